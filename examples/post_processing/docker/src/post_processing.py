@@ -56,8 +56,8 @@ def main():
         h5_path=h5_path,
         box_size=parameters["box_size"],
         stride=stride,
-        save_pickle_file=True,
-        pickle_file_path=None,
+        save_cache=True,
+        cache_path=None,
     )
 
     viz_stepsize = max(int(parameters["total_steps"] / 1000.0), 1)
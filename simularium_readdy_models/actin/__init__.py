@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 
+from .actin_analysis_pipeline import ActinAnalysisPipeline  # noqa: F401
 from .actin_analyzer import ActinAnalyzer  # noqa: F401
+from .actin_frame_context import ActinFrameContext  # noqa: F401
 from .actin_generator import ActinGenerator  # noqa: F401
 from .actin_reactions import ACTIN_REACTIONS  # noqa: F401
 from .actin_simulation import ActinSimulation  # noqa: F401
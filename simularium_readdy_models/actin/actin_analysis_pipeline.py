@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+
+import numpy as np
+
+from ..common import ReaddyUtil
+from .actin_analyzer import ActinAnalyzer
+from .actin_frame_context import ActinFrameContext
+
+
+class ActinAnalysisPipeline:
+    """
+    Calculate several ActinAnalyzer metrics in one pass over the frames
+    of monomer data.
+
+    Metrics are named like the ActinAnalyzer function that calculates them
+    without the "analyze_" prefix, e.g. "branch_angles".
+    Each frame is passed once to add_frame() (or all of them to run()),
+    wrapped in an ActinFrameContext so the metrics share the traced filaments,
+    and then only the per-frame results are kept.
+    So frames can be streamed from ReaddyUtil.iter_monomer_data_from_file:
+
+        pipeline = ActinAnalysisPipeline(["branch_angles"], box_size)
+        results = pipeline.run(
+            frame for _, frame in ReaddyUtil.iter_monomer_data_from_file(path)
+        )
+
+    results() returns the same output for each metric
+    as calling the ActinAnalyzer function on the list of all the frames.
+    The bond, angle and dihedral stretch analyses read ReaDDy trajectory frames
+    instead of monomer data, so they aren't part of the pipeline.
+    """
+
+    SERIES_METRICS = (
+        "pointed_end_displacement",
+        "normals_and_axis_positions",
+        "twist_axis",
+        "twist_planes",
+        "filament_length",
+    )
+    NORMALS_METRICS = ("normals_and_axis_positions", "twist_axis", "filament_length")
+
+    def __init__(self, metrics, box_size, periodic_boundary=True, stride=1):
+        frame_metrics = ActinAnalysisPipeline._frame_metrics()
+        self.metrics = list(dict.fromkeys(metrics))
+        for metric in self.metrics:
+            if (
+                metric not in frame_metrics
+                and metric not in ActinAnalysisPipeline.SERIES_METRICS
+            ):
+                raise Exception(f"{metric} is not an actin analysis pipeline metric")
+        self.box_size = box_size
+        self.periodic_boundary = periodic_boundary
+        self.stride = stride
+        self.n_frames = 0
+        self._frame_metrics = {
+            metric: frame_metrics[metric]
+            for metric in self.metrics
+            if metric in frame_metrics
+        }
+        self._values = {metric: [] for metric in self._frame_metrics}
+        self._initial_pointed_position = None
+        self._pointed_end_displacement = []
+        self._use_normals = any(
+            metric in self.metrics for metric in ActinAnalysisPipeline.NORMALS_METRICS
+        )
+        self._normals = []
+        self._axis_positions = []
+        self._warned_normals = False
+        self._twist_angles = []
+        self._twist_positions = []
+
+    @staticmethod
+    def metric_names():
+        """
+        get the names of all the metrics the pipeline can calculate.
+        """
+        return list(ActinAnalysisPipeline._frame_metrics()) + list(
+            ActinAnalysisPipeline.SERIES_METRICS
+        )
+
+    @staticmethod
+    def _frame_metrics():
+        """
+        get the ActinAnalyzer function for each metric that is calculated
+        independently for each frame, the names of the pipeline attributes
+        passed as its other arguments, and whether it returns an array.
+        """
+        return {
+            "ratio_of_filamentous_to_total_actin": (
+                ActinAnalyzer.analyze_ratio_of_filamentous_to_total_actin,
+                (),
+                True,
+            ),
+            "ratio_of_bound_ATP_actin_to_total_actin": (
+                ActinAnalyzer.analyze_ratio_of_bound_ATP_actin_to_total_actin,
+                (),
+                True,
+            ),
+            "ratio_of_daughter_to_total_actin": (
+                ActinAnalyzer.analyze_ratio_of_daughter_to_total_actin,
+                (),
+                True,
+            ),
+            "ratio_of_bound_to_total_arp23": (
+                ActinAnalyzer.analyze_ratio_of_bound_to_total_arp23,
+                (),
+                True,
+            ),
+            "ratio_of_capped_ends_to_total_ends": (
+                ActinAnalyzer.analyze_ratio_of_capped_ends_to_total_ends,
+                (),
+                True,
+            ),
+            "mother_filament_lengths": (
+                ActinAnalyzer.analyze_mother_filament_lengths,
+                (),
+                False,
+            ),
+            "daughter_filament_lengths": (
+                ActinAnalyzer.analyze_daughter_filament_lengths,
+                (),
+                False,
+            ),
+            "branch_angles": (
+                ActinAnalyzer.analyze_branch_angles,
+                ("box_size", "periodic_boundary"),
+                False,
+            ),
+            "short_helix_pitches": (
+                ActinAnalyzer.analyze_short_helix_pitches,
+                ("box_size", "periodic_boundary"),
+                False,
+            ),
+            "long_helix_pitches": (
+                ActinAnalyzer.analyze_long_helix_pitches,
+                ("box_size", "periodic_boundary"),
+                False,
+            ),
+            "filament_straightness": (
+                ActinAnalyzer.analyze_filament_straightness,
+                ("box_size", "periodic_boundary"),
+                False,
+            ),
+            "free_actin_concentration_over_time": (
+                ActinAnalyzer.analyze_free_actin_concentration_over_time,
+                ("box_size",),
+                True,
+            ),
+        }
+
+    def add_frame(self, frame_particle_data):
+        """
+        add the values of each metric for the next frame of monomer data.
+        """
+        frame = ActinFrameContext.of(frame_particle_data)
+        for metric, (analyze, arg_names, _) in self._frame_metrics.items():
+            args = [getattr(self, arg_name) for arg_name in arg_names]
+            self._values[metric].append(analyze([frame], *args)[0])
+        if "pointed_end_displacement" in self.metrics:
+            self._add_pointed_end_displacement(frame)
+        if self._use_normals:
+            (
+                normals,
+                axis_positions,
+                failed,
+            ) = ActinAnalyzer._get_frame_normals_and_axis_positions(
+                frame, self.box_size, self.periodic_boundary
+            )
+            if failed and not self._warned_normals:
+                ActinAnalyzer._warn_failed_normals(self.n_frames)
+                self._warned_normals = True
+            self._normals.append(normals)
+            self._axis_positions.append(axis_positions)
+        if "twist_planes" in self.metrics and self.n_frames % self.stride == 0:
+            angles, positions = ActinAnalyzer._get_frame_twist_planes(
+                frame, self.box_size, self.periodic_boundary
+            )
+            self._twist_angles.append(angles)
+            self._twist_positions.append(positions)
+        self.n_frames += 1
+
+    def _add_pointed_end_displacement(self, frame):
+        """
+        add the distance the pointed end has moved since the first frame.
+        """
+        pointed_position = ActinAnalyzer._get_frame_pointed_end_position(frame)
+        if self._initial_pointed_position is None:
+            self._initial_pointed_position = pointed_position
+            self._pointed_end_displacement.append(0.0)
+            return
+        if self.periodic_boundary:
+            pointed_position = ReaddyUtil.get_non_periodic_boundary_position(
+                self._initial_pointed_position, pointed_position, self.box_size
+            )
+        self._pointed_end_displacement.append(
+            np.linalg.norm(pointed_position - self._initial_pointed_position)
+        )
+
+    def results(self):
+        """
+        get the output of each metric for the frames added so far.
+        """
+        result = {}
+        for metric in self.metrics:
+            if metric in self._frame_metrics:
+                values = self._values[metric]
+                result[metric] = (
+                    np.array(values) if self._frame_metrics[metric][2] else values
+                )
+            elif metric == "pointed_end_displacement":
+                result[metric] = np.array(self._pointed_end_displacement)
+            elif metric == "normals_and_axis_positions":
+                result[metric] = (self._normals, self._axis_positions)
+            elif metric == "twist_axis":
+                result[metric] = ActinAnalyzer.analyze_twist_axis(
+                    self._normals, self._axis_positions, self.stride
+                )
+            elif metric == "twist_planes":
+                result[metric] = (
+                    np.array(self._twist_angles),
+                    np.array(self._twist_positions),
+                )
+            elif metric == "filament_length":
+                result[metric] = ActinAnalyzer.analyze_filament_length(
+                    self._normals,
+                    self._axis_positions,
+                    self.box_size,
+                    self.periodic_boundary,
+                    self.stride,
+                )
+        return result
+
+    def run(self, frames):
+        """
+        add each frame of monomer data and get the output of each metric.
+        """
+        for frame_particle_data in frames:
+            self.add_frame(frame_particle_data)
+        return self.results()
@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 
 import math
+from collections import Counter
 from typing import Dict
 
 import numpy as np
 
-from ..common import ReaddyUtil
+from ..common import FrameData, ReaddyUtil, TypeCatalogue
+from .actin_frame_context import ActinFrameContext
 from .actin_structure import ActinStructure
 from .actin_util import ActinUtil
 
@@ -93,88 +95,100 @@ class ActinAnalyzer:
         """
         Get all the types for actins freely diffusing.
         """
-        return ["actin#free", "actin#free_ATP"]
+        return ("actin#free", "actin#free_ATP")
+
+    @staticmethod
+    def _numbered_actin_types(name, flags):
+        """
+        Get a cached tuple of the types "actin#{flag}{i}"
+        for polymer numbers i in [1, 5] and each of the given flags.
+        """
+        return TypeCatalogue.ordered(
+            ("actin_analyzer", name),
+            None,
+            lambda: [f"actin#{flag}{i}" for i in range(1, 6) for flag in flags],
+        )
 
     @staticmethod
     def _pointed_actin_types():
         """
         Get all the types for actins at the pointed end of a filament.
         """
-        result = []
-        for i in range(1, 6):
-            result.append(f"actin#pointed_{i}")
-            result.append(f"actin#pointed_ATP_{i}")
-            result.append(f"actin#pointed_fixed_{i}")
-            result.append(f"actin#pointed_fixed_ATP_{i}")
-        return result
+        return ActinAnalyzer._numbered_actin_types(
+            "pointed",
+            ("pointed_", "pointed_ATP_", "pointed_fixed_", "pointed_fixed_ATP_"),
+        )
 
     @staticmethod
     def _actin_chain_types():
         """
-        Get all the types for actins along a filament from pointed to barbed,
+        Get a set of all the types for actins along a filament
+        from pointed to barbed for each polymer number,
         not including pointed or branch actins that start a new filament.
         """
-        result = []
-        for i in ActinUtil.polymer_number_range():
-            result.append(
-                [
-                    f"actin#{i}",
-                    f"actin#ATP_{i}",
-                    f"actin#mid_{i}",
-                    f"actin#mid_ATP_{i}",
-                    f"actin#fixed_{i}",
-                    f"actin#fixed_ATP_{i}",
-                    f"actin#mid_fixed_{i}",
-                    f"actin#mid_fixed_ATP_{i}",
-                    f"actin#barbed_{i}",
-                    f"actin#barbed_ATP_{i}",
-                    f"actin#fixed_barbed_{i}",
-                    f"actin#fixed_barbed_ATP_{i}",
-                ]
-            )
-        return result
+        flags = (
+            "",
+            "ATP_",
+            "mid_",
+            "mid_ATP_",
+            "fixed_",
+            "fixed_ATP_",
+            "mid_fixed_",
+            "mid_fixed_ATP_",
+            "barbed_",
+            "barbed_ATP_",
+            "fixed_barbed_",
+            "fixed_barbed_ATP_",
+        )
+        return TypeCatalogue.ordered(
+            ("actin_analyzer", "chain"),
+            ActinUtil.n_polymer_numbers(),
+            lambda: [
+                frozenset(f"actin#{flag}{i}" for flag in flags)
+                for i in ActinUtil.polymer_number_range()
+            ],
+        )
 
     @staticmethod
     def _middle_actin_types():
         """
         Get all the types for actins in the middle of a filament.
         """
-        result = []
-        for i in range(1, 6):
-            result.append(f"actin#{i}")
-            result.append(f"actin#ATP_{i}")
-            result.append(f"actin#mid_{i}")
-            result.append(f"actin#mid_ATP_{i}")
-            result.append(f"actin#fixed_{i}")
-            result.append(f"actin#fixed_ATP_{i}")
-            result.append(f"actin#mid_fixed_{i}")
-            result.append(f"actin#mid_fixed_ATP_{i}")
-        return result
+        return ActinAnalyzer._numbered_actin_types(
+            "middle",
+            (
+                "",
+                "ATP_",
+                "mid_",
+                "mid_ATP_",
+                "fixed_",
+                "fixed_ATP_",
+                "mid_fixed_",
+                "mid_fixed_ATP_",
+            ),
+        )
 
     @staticmethod
     def _barbed_actin_types():
         """
         Get all the types for actins at the barbed end of a filament.
         """
-        result = []
-        for i in range(1, 6):
-            result.append(f"actin#barbed_{i}")
-            result.append(f"actin#barbed_ATP_{i}")
-            result.append(f"actin#fixed_barbed_{i}")
-            result.append(f"actin#fixed_barbed_ATP_{i}")
-        return result
+        return ActinAnalyzer._numbered_actin_types(
+            "barbed",
+            ("barbed_", "barbed_ATP_", "fixed_barbed_", "fixed_barbed_ATP_"),
+        )
 
     @staticmethod
     def _branch_actin_types():
         """
         Get all the types for actins at the pointed end of a branch.
         """
-        return [
+        return (
             "actin#branch_1",
             "actin#branch_ATP_1",
             "actin#branch_barbed_1",
             "actin#branch_barbed_ATP_1",
-        ]
+        )
 
     @staticmethod
     def _filamentous_actin_types():
@@ -193,39 +207,123 @@ class ActinAnalyzer:
         """
         Get all the types for actins with ATP bound.
         """
-        result = []
-        for i in range(1, 6):
-            result.append(f"actin#ATP_{i}")
-            result.append(f"actin#mid_ATP_{i}")
-            result.append(f"actin#pointed_ATP_{i}")
-            result.append(f"actin#barbed_ATP_{i}")
-            result.append(f"actin#fixed_ATP_{i}")
-            result.append(f"actin#mid_fixed_ATP_{i}")
-            result.append(f"actin#pointed_fixed_ATP_{i}")
-            result.append(f"actin#fixed_barbed_ATP_{i}")
-        result.append("actin#branch_ATP_1")
-        result.append("actin#branch_barbed_ATP_1")
-        return result
+        return ActinAnalyzer._numbered_actin_types(
+            "ATP",
+            (
+                "ATP_",
+                "mid_ATP_",
+                "pointed_ATP_",
+                "barbed_ATP_",
+                "fixed_ATP_",
+                "mid_fixed_ATP_",
+                "pointed_fixed_ATP_",
+                "fixed_barbed_ATP_",
+            ),
+        ) + ("actin#branch_ATP_1", "actin#branch_barbed_ATP_1")
 
     @staticmethod
     def _filamentous_ADP_actin_types():
         """
         Get all the types for actins with ADP bound.
         """
-        result = []
-        for i in range(1, 6):
-            result.append(f"actin#{i}")
-            result.append(f"actin#mid_{i}")
-            result.append(f"actin#pointed_{i}")
-            result.append(f"actin#barbed_{i}")
-            result.append(f"actin#fixed_{i}")
-            result.append(f"actin#mid_fixed_{i}")
-            result.append(f"actin#pointed_fixed_{i}")
-            result.append(f"actin#fixed_barbed_{i}")
-        result.append("actin#branch_1")
-        result.append("actin#branch_barbed_1")
+        return ActinAnalyzer._numbered_actin_types(
+            "ADP",
+            (
+                "",
+                "mid_",
+                "pointed_",
+                "barbed_",
+                "fixed_",
+                "mid_fixed_",
+                "pointed_fixed_",
+                "fixed_barbed_",
+            ),
+        ) + ("actin#branch_1", "actin#branch_barbed_1")
+
+    @staticmethod
+    def _get_frame_next_actin_ids(frame_particle_data):
+        """
+        Get a mapping of the id of each actin in the given frame of data
+        to the id of the next actin toward the barbed end of its filament,
+        for actins that have one.
+        The next actin is the first neighbor with the next polymer number
+        and one of the _actin_chain_types.
+        """
+        chain_types = ActinAnalyzer._actin_chain_types()
+        particles = frame_particle_data["particles"]
+        result = {}
+        for particle_id in particles:
+            particle = particles[particle_id]
+            type_name = particle["type_name"]
+            if not type_name.startswith("actin#") or not type_name[-1].isdigit():
+                continue
+            next_types = chain_types[int(type_name[-1]) % len(chain_types)]
+            for neighbor_id in particle["neighbor_ids"]:
+                if neighbor_id not in particles:
+                    neighbor_id = str(neighbor_id)
+                if particles[neighbor_id]["type_name"] in next_types:
+                    result[particle_id] = neighbor_id
+                    break
         return result
 
+    @staticmethod
+    def _get_chain_from_next_actin_ids(start_actin_id, next_actin_ids, chain_length=0):
+        """
+        Get a list of the ids of the actins in a filament
+        from start_actin_id toward the barbed end,
+        with up to chain_length actins after the start actin,
+        or the rest of the filament if chain_length = 0.
+        """
+        result = [start_actin_id]
+        visited = {start_actin_id}
+        next_id = next_actin_ids.get(start_actin_id)
+        while next_id is not None and next_id not in visited:
+            result.append(next_id)
+            if len(result) - 1 == chain_length:
+                break
+            visited.add(next_id)
+            next_id = next_actin_ids.get(next_id)
+        return result
+
+    @staticmethod
+    def _cached(frame_particle_data, key, compute):
+        """
+        Get a value computed from the given frame of data with compute(),
+        cached if the frame is an ActinFrameContext.
+        """
+        if isinstance(frame_particle_data, ActinFrameContext):
+            return frame_particle_data.cached(key, compute)
+        return compute()
+
+    @staticmethod
+    def _frame_ids_for_types(frame_particle_data, particle_types):
+        """
+        Get a list of ids for all the particles with particle type
+        in the given list of types in the given frame of data.
+        """
+        return ActinAnalyzer._cached(
+            frame_particle_data,
+            ("ids_for_types", tuple(particle_types)),
+            lambda: ReaddyUtil.analyze_frame_get_ids_for_types(
+                frozenset(particle_types),
+                ActinFrameContext.unwrap(frame_particle_data),
+            ),
+        )
+
+    @staticmethod
+    def _frame_next_actin_ids(frame_particle_data):
+        """
+        Get the mapping of each actin id to the next actin id
+        toward the barbed end in the given frame of data.
+        """
+        return ActinAnalyzer._cached(
+            frame_particle_data,
+            "next_actin_ids",
+            lambda: ActinAnalyzer._get_frame_next_actin_ids(
+                ActinFrameContext.unwrap(frame_particle_data)
+            ),
+        )
+
     @staticmethod
     def _get_frame_filaments_from_start_actins(start_actin_ids, frame_particle_data):
         """
@@ -234,22 +332,11 @@ class ActinAnalyzer:
         Each filament is a list of the actin ids in the filament
         in order from pointed to barbed end.
         """
-        result = []
-        chain_types = ActinAnalyzer._actin_chain_types()
-        for start_actin_id in start_actin_ids:
-            pointed_number = int(
-                frame_particle_data["particles"][start_actin_id]["type_name"][-1]
-            )
-            result.append(
-                ReaddyUtil.analyze_frame_get_chain_of_types(
-                    start_actin_id,
-                    chain_types,
-                    frame_particle_data,
-                    result=[start_actin_id],
-                    next_neighbor_index=pointed_number,
-                )
-            )
-        return result
+        next_actin_ids = ActinAnalyzer._frame_next_actin_ids(frame_particle_data)
+        return [
+            ActinAnalyzer._get_chain_from_next_actin_ids(start_actin_id, next_actin_ids)
+            for start_actin_id in start_actin_ids
+        ]
 
     @staticmethod
     def _frame_mother_filaments(frame_particle_data):
@@ -258,11 +345,15 @@ class ActinAnalyzer:
         each filament is a list of the actin ids in the filament
         in order from pointed to barbed end.
         """
-        return ActinAnalyzer._get_frame_filaments_from_start_actins(
-            ReaddyUtil.analyze_frame_get_ids_for_types(
-                ActinAnalyzer._pointed_actin_types(), frame_particle_data
-            ),
+        return ActinAnalyzer._cached(
             frame_particle_data,
+            "mother_filaments",
+            lambda: ActinAnalyzer._get_frame_filaments_from_start_actins(
+                ActinAnalyzer._frame_ids_for_types(
+                    frame_particle_data, ActinAnalyzer._pointed_actin_types()
+                ),
+                frame_particle_data,
+            ),
         )
 
     @staticmethod
@@ -272,11 +363,15 @@ class ActinAnalyzer:
         each filament is a list of the actin ids in the filament
         in order from pointed to barbed end.
         """
-        return ActinAnalyzer._get_frame_filaments_from_start_actins(
-            ReaddyUtil.analyze_frame_get_ids_for_types(
-                ActinAnalyzer._branch_actin_types(), frame_particle_data
-            ),
+        return ActinAnalyzer._cached(
             frame_particle_data,
+            "daughter_filaments",
+            lambda: ActinAnalyzer._get_frame_filaments_from_start_actins(
+                ActinAnalyzer._frame_ids_for_types(
+                    frame_particle_data, ActinAnalyzer._branch_actin_types()
+                ),
+                frame_particle_data,
+            ),
         )
 
     @staticmethod
@@ -287,94 +382,149 @@ class ActinAnalyzer:
         each filament is a list of the actin ids in the filament
         in order from pointed to barbed end.
         """
+        context = ActinFrameContext.of(frame_particle_data)
         return ActinAnalyzer._frame_mother_filaments(
-            frame_particle_data
-        ) + ActinAnalyzer._frame_daughter_filaments(frame_particle_data)
+            context
+        ) + ActinAnalyzer._frame_daughter_filaments(context)
 
     @staticmethod
-    def analyze_ratio_of_filamentous_to_total_actin(monomer_data):
+    def _type_classes():
         """
-        Get a list of the ratio of actin in filaments to total actin over time.
+        Get the lists of particle types counted for each class of particles
+        in the count-based analyses.
         """
-        result = []
-        for t in range(len(monomer_data)):
-            free_actin = len(
-                ReaddyUtil.analyze_frame_get_ids_for_types(
-                    ActinAnalyzer._free_actin_types(), monomer_data[t]
+        return {
+            "free_actin": ActinAnalyzer._free_actin_types(),
+            "filamentous_actin": ActinAnalyzer._filamentous_actin_types(),
+            "filamentous_ATP_actin": ActinAnalyzer._filamentous_ATP_actin_types(),
+            "bound_arp23": ["arp2", "arp2#branched"],
+            "free_arp23": ["arp2#free"],
+            "capped_ends": ["cap#bound"],
+            "growing_ends": ActinAnalyzer._barbed_actin_types()
+            + ("actin#branch_barbed_1", "actin#branch_barbed_ATP_1"),
+        }
+
+    @staticmethod
+    def analyze_type_class_counts(types, particle_types):
+        """
+        Get the number of particles in each class of _type_classes
+        at each time index, straight from the raw particle types
+        (types from traj.read_observable_particles()
+        and particle_types from traj.particle_types).
+
+        The result can be passed as type_class_counts
+        to the count-based analyses instead of shaped monomer data.
+        """
+        return ReaddyUtil.analyze_type_class_counts(
+            types, particle_types, ActinAnalyzer._type_classes()
+        )
+
+    @staticmethod
+    def _frame_type_class_counts(frame_particle_data):
+        """
+        Get the number of particles in each class of _type_classes
+        in the given frame of data.
+        """
+
+        def calculate():
+            frame = ActinFrameContext.unwrap(frame_particle_data)
+            if isinstance(frame, FrameData):
+                type_counts = dict(zip(frame.type_names, frame.type_counts().tolist()))
+            else:
+                type_counts = Counter(
+                    particle["type_name"] for particle in frame["particles"].values()
                 )
-            )
-            filamentous_actin = len(
-                ReaddyUtil.analyze_frame_get_ids_for_types(
-                    ActinAnalyzer._filamentous_actin_types(),
-                    monomer_data[t],
+            return {
+                class_name: sum(
+                    type_counts.get(type_name, 0) for type_name in set(class_types)
                 )
+                for class_name, class_types in ActinAnalyzer._type_classes().items()
+            }
+
+        return ActinAnalyzer._cached(
+            frame_particle_data, "type_class_counts", calculate
+        )
+
+    @staticmethod
+    def _type_class_counts(monomer_data, type_class_counts=None):
+        """
+        Get the number of particles in each class of _type_classes
+        at each time index, from the monomer data
+        unless type_class_counts were already calculated.
+        """
+        if type_class_counts is not None:
+            return type_class_counts
+        frame_counts = [
+            ActinAnalyzer._frame_type_class_counts(frame) for frame in monomer_data
+        ]
+        return {
+            class_name: np.array(
+                [counts[class_name] for counts in frame_counts], dtype=np.int64
             )
-            if free_actin + filamentous_actin > 0:
-                result.append(filamentous_actin / float(free_actin + filamentous_actin))
-            else:
-                result.append(0)
-        return np.array(result)
+            for class_name in ActinAnalyzer._type_classes()
+        }
 
     @staticmethod
-    def analyze_ratio_of_bound_ATP_actin_to_total_actin(monomer_data):
+    def _ratio(numerator, denominator, default):
+        """
+        Get numerator / denominator for each time index,
+        or default where the denominator is zero.
+        """
+        numerator = np.asarray(numerator, dtype=float)
+        denominator = np.asarray(denominator, dtype=float)
+        result = np.full(numerator.shape, float(default))
+        np.divide(numerator, denominator, out=result, where=denominator > 0)
+        return result
+
+    @staticmethod
+    def analyze_ratio_of_filamentous_to_total_actin(
+        monomer_data, type_class_counts=None
+    ):
+        """
+        Get a list of the ratio of actin in filaments to total actin over time.
+        """
+        counts = ActinAnalyzer._type_class_counts(monomer_data, type_class_counts)
+        return ActinAnalyzer._ratio(
+            counts["filamentous_actin"],
+            counts["free_actin"] + counts["filamentous_actin"],
+            0,
+        )
+
+    @staticmethod
+    def analyze_ratio_of_bound_ATP_actin_to_total_actin(
+        monomer_data, type_class_counts=None
+    ):
         """
         Get a list of the ratio of bound ATP-actin to total actin over time.
         """
-        result = []
-        for t in range(len(monomer_data)):
-            ATP_actin = len(
-                ReaddyUtil.analyze_frame_get_ids_for_types(
-                    ActinAnalyzer._filamentous_ATP_actin_types(),
-                    monomer_data[t],
-                )
-            )
-            free_actin = len(
-                ReaddyUtil.analyze_frame_get_ids_for_types(
-                    ActinAnalyzer._free_actin_types(), monomer_data[t]
-                )
-            )
-            filamentous_actin = len(
-                ReaddyUtil.analyze_frame_get_ids_for_types(
-                    ActinAnalyzer._filamentous_actin_types(),
-                    monomer_data[t],
-                )
-            )
-            if free_actin + filamentous_actin > 0:
-                result.append(ATP_actin / float(free_actin + filamentous_actin))
-            else:
-                result.append(1.0)
-        return np.array(result)
+        counts = ActinAnalyzer._type_class_counts(monomer_data, type_class_counts)
+        return ActinAnalyzer._ratio(
+            counts["filamentous_ATP_actin"],
+            counts["free_actin"] + counts["filamentous_actin"],
+            1.0,
+        )
 
     @staticmethod
-    def analyze_ratio_of_daughter_to_total_actin(monomer_data):
+    def analyze_ratio_of_daughter_to_total_actin(monomer_data, type_class_counts=None):
         """
         Get a list of the ratio
         [daughter filament actin] / [total actin] over time.
         """
-        result = []
-        for t in range(len(monomer_data)):
-            daughter_actin = 0
-            daughter_filaments = ActinAnalyzer._frame_daughter_filaments(
-                monomer_data[t]
-            )
-            for daughter_filament in daughter_filaments:
-                daughter_actin += len(daughter_filament)
-            free_actin = len(
-                ReaddyUtil.analyze_frame_get_ids_for_types(
-                    ActinAnalyzer._free_actin_types(), monomer_data[t]
+        daughter_actin = [
+            sum(
+                len(daughter_filament)
+                for daughter_filament in ActinAnalyzer._frame_daughter_filaments(
+                    monomer_data[t]
                 )
             )
-            filamentous_actin = len(
-                ReaddyUtil.analyze_frame_get_ids_for_types(
-                    ActinAnalyzer._filamentous_actin_types(),
-                    monomer_data[t],
-                )
-            )
-            if free_actin + filamentous_actin > 0:
-                result.append(daughter_actin / float(free_actin + filamentous_actin))
-            else:
-                result.append(0)
-        return np.array(result)
+            for t in range(len(monomer_data))
+        ]
+        counts = ActinAnalyzer._type_class_counts(monomer_data, type_class_counts)
+        return ActinAnalyzer._ratio(
+            daughter_actin,
+            counts["free_actin"] + counts["filamentous_actin"],
+            0,
+        )
 
     @staticmethod
     def analyze_mother_filament_lengths(monomer_data):
@@ -407,69 +557,108 @@ class ActinAnalyzer:
         return result
 
     @staticmethod
-    def analyze_ratio_of_bound_to_total_arp23(monomer_data):
+    def analyze_ratio_of_bound_to_total_arp23(monomer_data, type_class_counts=None):
         """
         Get a list of the ratio of bound to total arp2/3 complexes over time.
         """
-        result = []
-        for t in range(len(monomer_data)):
-            bound_arp23 = len(
-                ReaddyUtil.analyze_frame_get_ids_for_types(
-                    ["arp2", "arp2#branched"], monomer_data[t]
-                )
-            )
-            free_arp23 = len(
-                ReaddyUtil.analyze_frame_get_ids_for_types(
-                    ["arp2#free"], monomer_data[t]
-                )
-            )
-            if free_arp23 + bound_arp23 > 0:
-                result.append(bound_arp23 / float(free_arp23 + bound_arp23))
-            else:
-                result.append(0)
-        return np.array(result)
+        counts = ActinAnalyzer._type_class_counts(monomer_data, type_class_counts)
+        return ActinAnalyzer._ratio(
+            counts["bound_arp23"],
+            counts["free_arp23"] + counts["bound_arp23"],
+            0,
+        )
 
     @staticmethod
-    def analyze_ratio_of_capped_ends_to_total_ends(monomer_data):
+    def analyze_ratio_of_capped_ends_to_total_ends(
+        monomer_data, type_class_counts=None
+    ):
         """
         Get a list of the ratio of barbed ends capped
         with capping protein to all barbed ends over time.
         """
-        capped_end_types = ["cap#bound"]
-        growing_end_types = ActinAnalyzer._barbed_actin_types() + [
-            "actin#branch_barbed_1",
-            "actin#branch_barbed_ATP_1",
-        ]
-        result = []
-        for t in range(len(monomer_data)):
-            capped_ends = len(
-                ReaddyUtil.analyze_frame_get_ids_for_types(
-                    capped_end_types, monomer_data[t]
-                )
-            )
-            growing_ends = len(
-                ReaddyUtil.analyze_frame_get_ids_for_types(
-                    growing_end_types, monomer_data[t]
-                )
+        counts = ActinAnalyzer._type_class_counts(monomer_data, type_class_counts)
+        return ActinAnalyzer._ratio(
+            counts["capped_ends"],
+            counts["growing_ends"] + counts["capped_ends"],
+            0,
+        )
+
+    @staticmethod
+    def _get_positions_for_ids(frame_particle_data, particle_ids):
+        """
+        get an array of the positions of the particles with the given ids,
+        with shape particle_ids.shape + (3,).
+        """
+        frame_particle_data = ActinFrameContext.unwrap(frame_particle_data)
+        particle_ids = np.asarray(particle_ids, dtype=int)
+        flat_ids = particle_ids.ravel().tolist()
+        if isinstance(frame_particle_data, FrameData):
+            rows = [frame_particle_data.row_for_id(p_id) for p_id in flat_ids]
+            positions = frame_particle_data.positions[rows]
+        else:
+            particles = frame_particle_data["particles"]
+            positions = np.array(
+                [particles[p_id]["position"] for p_id in flat_ids], dtype=float
             )
-            if growing_ends + capped_ends > 0:
-                result.append(capped_ends / float(growing_ends + capped_ends))
-            else:
-                result.append(0)
-        return np.array(result)
+        return positions.reshape(particle_ids.shape + (3,))
 
     @staticmethod
-    def _get_axis_position_for_actin(
+    def _get_actin_ids_for_filaments(filaments):
+        """
+        get an (N, 3) array of [previous actin id, this actin id, next actin id]
+        for each actin in the filaments except the ends, in filament order.
+        """
+        result = []
+        for filament in filaments:
+            for index in range(1, len(filament) - 1):
+                result.append(filament[index - 1 : index + 2])
+        return np.array(result, dtype=int).reshape(-1, 3)
+
+    @staticmethod
+    def _get_axis_positions_for_actins(
         frame_particle_data, actin_ids, box_size, periodic_boundary=True
     ):
         """
-        get the position on the filament axis closest to an actin
-        actin_ids = [previous actin id, this actin id, next actin id].
+        get the positions on the filament axis closest to N actins at once
+        actin_ids = (N, 3) array of
+            [previous actin id, this actin id, next actin id] for each actin.
+        returns the (N, 3, 3) actin positions and the (N, 3) axis positions.
         """
-        positions = []
-        for i in range(3):
-            positions.append(frame_particle_data["particles"][actin_ids[i]]["position"])
-        return ActinUtil.get_actin_axis_position(positions, box_size, periodic_boundary)
+        positions = ActinAnalyzer._get_positions_for_ids(frame_particle_data, actin_ids)
+        if len(positions) == 0:
+            return positions, np.zeros((0, 3))
+        return positions, ActinUtil.get_actin_axis_positions(
+            positions, box_size, periodic_boundary
+        )
+
+    @staticmethod
+    def _frame_filament_axis_positions(
+        frame_particle_data, box_size, periodic_boundary=True
+    ):
+        """
+        Get the actin ids, actin positions and axis positions
+        (see _get_axis_positions_for_actins) for each actin
+        in all the filaments in the given frame of data, except the ends,
+        in the order of _frame_all_filaments.
+        """
+
+        def calculate():
+            actin_ids = ActinAnalyzer._get_actin_ids_for_filaments(
+                ActinAnalyzer._frame_all_filaments(frame_particle_data)
+            )
+            return (actin_ids,) + ActinAnalyzer._get_axis_positions_for_actins(
+                frame_particle_data, actin_ids, box_size, periodic_boundary
+            )
+
+        return ActinAnalyzer._cached(
+            frame_particle_data,
+            (
+                "filament_axis_positions",
+                tuple(np.asarray(box_size, dtype=float).tolist()),
+                bool(periodic_boundary),
+            ),
+            calculate,
+        )
 
     @staticmethod
     def neighbor_types_to_string(particle_id, frame_particle_data):
@@ -501,6 +690,18 @@ class ActinAnalyzer:
 
     @staticmethod
     def _get_frame_branch_ids(frame_particle_data):
+        """
+        for each branch point at a time frame, get list of ids
+        (see _calculate_frame_branch_ids).
+        """
+        return ActinAnalyzer._cached(
+            frame_particle_data,
+            "branch_ids",
+            lambda: ActinAnalyzer._calculate_frame_branch_ids(frame_particle_data),
+        )
+
+    @staticmethod
+    def _calculate_frame_branch_ids(frame_particle_data):
         """
         for each branch point at a time frame, get list of ids for (in order):
         - [0,1,2,3] 4 actins after branch on main filament
@@ -508,15 +709,15 @@ class ActinAnalyzer:
         - [4,5,6,7] first 4 actins on branch
           (ordered from pointed end toward barbed end).
         """
-        arp2_ids = ReaddyUtil.analyze_frame_get_ids_for_types(
-            ["arp2#branched"], frame_particle_data
+        arp2_ids = ActinAnalyzer._frame_ids_for_types(
+            frame_particle_data, ["arp2#branched"]
         )
         actin_types = (
             ActinAnalyzer._pointed_actin_types()
             + ActinAnalyzer._middle_actin_types()
             + ActinAnalyzer._barbed_actin_types()
         )
-        chain_types = ActinAnalyzer._actin_chain_types()
+        next_actin_ids = ActinAnalyzer._frame_next_actin_ids(frame_particle_data)
         result = []
         for arp2_id in arp2_ids:
             actin1_id = ReaddyUtil.analyze_frame_get_id_for_neighbor_of_types(
@@ -533,17 +734,8 @@ class ActinAnalyzer:
                     + "]"
                 )
                 continue
-            pointed_number = int(
-                frame_particle_data["particles"][actin1_id]["type_name"][-1]
-            )
-            branch_actins = ReaddyUtil.analyze_frame_get_chain_of_types(
-                actin1_id,
-                chain_types,
-                frame_particle_data,
-                3,
-                arp2_id,
-                [actin1_id],
-                next_neighbor_index=pointed_number,
+            branch_actins = ActinAnalyzer._get_chain_from_next_actin_ids(
+                actin1_id, next_actin_ids, 3
             )
             if len(branch_actins) < 4:
                 # not enough daughter actins to measure branch
@@ -596,22 +788,13 @@ class ActinAnalyzer:
                     )
                     + "]"
                 )
-            pointed_number = int(
-                frame_particle_data["particles"][actin_arp3_id]["type_name"][-1]
-            )
-            main_actins = ReaddyUtil.analyze_frame_get_chain_of_types(
-                actin_arp3_id,
-                chain_types,
-                frame_particle_data,
-                2,
-                actin_arp2_id,
-                [actin_arp2_id, actin_arp3_id],
-                next_neighbor_index=pointed_number,
+            main_actins = ActinAnalyzer._get_chain_from_next_actin_ids(
+                actin_arp3_id, next_actin_ids, 2
             )
-            if len(main_actins) < 4:
+            if len(main_actins) < 3:
                 # not enough mother actins to measure branch
                 continue
-            result.append(main_actins + branch_actins)
+            result.append([actin_arp2_id] + main_actins + branch_actins)
         return result
 
     @staticmethod
@@ -621,61 +804,42 @@ class ActinAnalyzer:
         at each branch point in the given frame of the trajectory.
         """
         branch_ids = ActinAnalyzer._get_frame_branch_ids(frame_particle_data)
+        if len(branch_ids) == 0:
+            return []
+        # axis positions for mother actin 1 and 2, then daughter actin 1 and 2
+        branch_ids = np.array(branch_ids, dtype=int)
+        actin_ids = np.stack(
+            [branch_ids[:, i : i + 3] for i in [0, 1, 4, 5]], axis=1
+        ).reshape(-1, 3)
+        _, axis_positions = ActinAnalyzer._get_axis_positions_for_actins(
+            frame_particle_data, actin_ids, box_size, periodic_boundary
+        )
+        actin_ids = actin_ids.reshape(-1, 4, 3)
+        axis_positions = axis_positions.reshape(-1, 4, 3)
+        names = [
+            "mother actin 1, ",
+            "mother actin 2",
+            "daughter actin 1",
+            "daughter actin 2",
+        ]
         result = []
-        for branch in branch_ids:
-            actin_ids = [branch[0], branch[1], branch[2]]
-            main_pos1 = ActinAnalyzer._get_axis_position_for_actin(
-                frame_particle_data, actin_ids, box_size, periodic_boundary
-            )
-            if main_pos1 is None or ReaddyUtil.vector_is_invalid(main_pos1):
-                pos_to_string = "None" if main_pos1 is None else main_pos1
-                raise Exception(
-                    "Failed to get axis position for mother actin 1, "
-                    f"pos = {pos_to_string}\ntried to use positions: "
-                    + ActinAnalyzer.positions_to_string(
-                        actin_ids, box_size, frame_particle_data
-                    )
-                )
-            actin_ids = [branch[1], branch[2], branch[3]]
-            main_pos2 = ActinAnalyzer._get_axis_position_for_actin(
-                frame_particle_data, actin_ids, box_size, periodic_boundary
-            )
-            if main_pos2 is None or ReaddyUtil.vector_is_invalid(main_pos2):
-                pos_to_string = "None" if main_pos2 is None else main_pos2
-                raise Exception(
-                    "Failed to get axis position for mother actin 2"
-                    f"pos = {pos_to_string}\ntried to use positions: "
-                    + ActinAnalyzer.positions_to_string(
-                        actin_ids, box_size, frame_particle_data
+        for branch_index in range(len(branch_ids)):
+            for i in range(4):
+                axis_pos = axis_positions[branch_index][i]
+                if ReaddyUtil.vector_is_invalid(axis_pos):
+                    raise Exception(
+                        f"Failed to get axis position for {names[i]}"
+                        f"pos = {axis_pos}\ntried to use positions: "
+                        + ActinAnalyzer.positions_to_string(
+                            actin_ids[branch_index][i].tolist(),
+                            box_size,
+                            frame_particle_data,
+                        )
                     )
-                )
-            actin_ids = [branch[4], branch[5], branch[6]]
+            main_pos1, main_pos2, branch_pos1, branch_pos2 = axis_positions[
+                branch_index
+            ]
             v_main = ReaddyUtil.normalize(main_pos2 - main_pos1)
-            branch_pos1 = ActinAnalyzer._get_axis_position_for_actin(
-                frame_particle_data, actin_ids, box_size, periodic_boundary
-            )
-            if branch_pos1 is None or ReaddyUtil.vector_is_invalid(branch_pos1):
-                pos_to_string = "None" if branch_pos1 is None else branch_pos1
-                raise Exception(
-                    "Failed to get axis position for daughter actin 1"
-                    f"pos = {pos_to_string}\ntried to use positions: "
-                    + ActinAnalyzer.positions_to_string(
-                        actin_ids, box_size, frame_particle_data
-                    )
-                )
-            actin_ids = [branch[5], branch[6], branch[7]]
-            branch_pos2 = ActinAnalyzer._get_axis_position_for_actin(
-                frame_particle_data, actin_ids, box_size, periodic_boundary
-            )
-            if branch_pos2 is None or ReaddyUtil.vector_is_invalid(branch_pos2):
-                pos_to_string = "None" if branch_pos2 is None else branch_pos2
-                raise Exception(
-                    "Failed to get axis position for daughter actin 2"
-                    f"pos = {pos_to_string}\ntried to use positions: "
-                    + ActinAnalyzer.positions_to_string(
-                        actin_ids, box_size, frame_particle_data
-                    )
-                )
             v_branch = ReaddyUtil.normalize(branch_pos2 - branch_pos1)
             result.append(ReaddyUtil.get_angle_between_vectors(v_main, v_branch, True))
         return result
@@ -695,46 +859,57 @@ class ActinAnalyzer:
         return result
 
     @staticmethod
-    def _calculate_pitch(
-        frame_particle_data, actin1_ids, actin2_ids, box_size, periodic_boundary=True
+    def _get_frame_helix_pitches(
+        frame_particle_data, box_size, periodic_boundary, offset
     ):
         """
-        Calculate the pitch of the helix between two actins
-        actin_ids = [previous actin id, this actin id, next actin id]
-        for each of the two actins.
+        Get the pitch of the helix between each actin and the actin offset
+        monomers further along the filament (except near the ends)
+        on each filament for a given frame of data,
+        using the axis positions shared with the other analyses.
         """
-        actin1_pos = frame_particle_data["particles"][actin1_ids[1]]["position"]
-        actin1_axis_pos = ActinAnalyzer._get_axis_position_for_actin(
-            frame_particle_data, actin1_ids, box_size, periodic_boundary
+        filaments = ActinAnalyzer._frame_all_filaments(frame_particle_data)
+        (
+            actin_ids,
+            positions,
+            axis_positions,
+        ) = ActinAnalyzer._frame_filament_axis_positions(
+            frame_particle_data, box_size, periodic_boundary
         )
-        if actin1_axis_pos is None or ReaddyUtil.vector_is_invalid(actin1_axis_pos):
-            raise Exception(
-                "Failed to get axis position for actin 1\n"
-                "tried to use positions: "
-                + ActinAnalyzer.positions_to_string(
-                    actin1_ids, box_size, frame_particle_data
-                )
+        rows1 = []
+        start_index = 0
+        for filament in filaments:
+            rows1 += range(start_index, start_index + max(0, len(filament) - 4))
+            start_index += max(0, len(filament) - 2)
+        rows1 = np.array(rows1, dtype=int)
+        rows2 = rows1 + offset
+        invalid = np.isnan(axis_positions).any(axis=1)
+        failed = invalid[rows1] | invalid[rows2]
+        if np.any(failed):
+            pair_index = np.argmax(failed)
+            actin_number, row = (
+                (1, rows1[pair_index])
+                if invalid[rows1[pair_index]]
+                else (2, rows2[pair_index])
             )
-        v1 = ReaddyUtil.normalize(actin1_axis_pos - actin1_pos)
-        actin2_pos = frame_particle_data["particles"][actin2_ids[1]]["position"]
-        actin2_axis_pos = ActinAnalyzer._get_axis_position_for_actin(
-            frame_particle_data, actin2_ids, box_size, periodic_boundary
-        )
-        if actin2_axis_pos is None or ReaddyUtil.vector_is_invalid(actin2_axis_pos):
             raise Exception(
-                "Failed to get axis position for actin 2\n"
+                f"Failed to get axis position for actin {actin_number}\n"
                 "tried to use positions: "
                 + ActinAnalyzer.positions_to_string(
-                    actin2_ids, box_size, frame_particle_data
+                    actin_ids[row].tolist(), box_size, frame_particle_data
                 )
             )
-        v2 = ReaddyUtil.normalize(actin2_axis_pos - actin2_pos)
-        actin2_axis_pos = ReaddyUtil.get_non_periodic_boundary_position(
-            actin1_axis_pos, actin2_axis_pos, box_size
+        if len(rows1) == 0:
+            return []
+        v1 = ReaddyUtil.normalize_vectors(axis_positions[rows1] - positions[rows1, 1])
+        v2 = ReaddyUtil.normalize_vectors(axis_positions[rows2] - positions[rows2, 1])
+        axis_positions2 = ReaddyUtil.get_non_periodic_boundary_positions(
+            axis_positions[rows1], axis_positions[rows2], box_size
         )
-        length = np.linalg.norm(actin2_axis_pos - actin1_axis_pos)
-        angle = ReaddyUtil.get_angle_between_vectors(v1, v2, True)
-        return (360.0 / angle) * length
+        lengths = np.linalg.norm(axis_positions2 - axis_positions[rows1], axis=1)
+        angles = ReaddyUtil.get_angles_between_vectors(v1, v2, in_degrees=True)
+        with np.errstate(divide="ignore"):
+            return ((360.0 / angles) * lengths).tolist()
 
     @staticmethod
     def _get_frame_short_helix_pitches(
@@ -744,20 +919,9 @@ class ActinAnalyzer:
         Get the pitch of the short helix between all actins on each filament
         for a given frame of data.
         """
-        result = []
-        filaments = ActinAnalyzer._frame_all_filaments(frame_particle_data)
-        for filament in filaments:
-            for i in range(1, len(filament) - 3):
-                short_pitch = ActinAnalyzer._calculate_pitch(
-                    frame_particle_data,
-                    [filament[i - 1], filament[i], filament[i + 1]],
-                    [filament[i], filament[i + 1], filament[i + 2]],
-                    box_size,
-                    periodic_boundary,
-                )
-                if short_pitch is not None:
-                    result.append(short_pitch)
-        return result
+        return ActinAnalyzer._get_frame_helix_pitches(
+            frame_particle_data, box_size, periodic_boundary, 1
+        )
 
     @staticmethod
     def _get_frame_long_helix_pitches(
@@ -767,20 +931,9 @@ class ActinAnalyzer:
         Get the pitch of the long helix between all actins on each filament
         for a given frame of data.
         """
-        result = []
-        filaments = ActinAnalyzer._frame_all_filaments(frame_particle_data)
-        for filament in filaments:
-            for i in range(1, len(filament) - 3):
-                long_pitch = ActinAnalyzer._calculate_pitch(
-                    frame_particle_data,
-                    [filament[i - 1], filament[i], filament[i + 1]],
-                    [filament[i + 1], filament[i + 2], filament[i + 3]],
-                    box_size,
-                    periodic_boundary,
-                )
-                if long_pitch is not None:
-                    result.append(long_pitch)
-        return result
+        return ActinAnalyzer._get_frame_helix_pitches(
+            frame_particle_data, box_size, periodic_boundary, 2
+        )
 
     @staticmethod
     def analyze_short_helix_pitches(monomer_data, box_size, periodic_boundary):
@@ -842,34 +995,39 @@ class ActinAnalyzer:
         """
         result = []
         filaments = ActinAnalyzer._frame_all_filaments(frame_particle_data)
-        for filament in filaments:
-            positions = []
-            last_pos = frame_particle_data["particles"][filament[0]]["position"]
-            for i in range(1, len(filament) - 1):
-                actin_ids = [filament[i - 1], filament[i], filament[i + 1]]
-                axis_pos = ActinAnalyzer._get_axis_position_for_actin(
-                    frame_particle_data, actin_ids, box_size, periodic_boundary
-                )
-                if axis_pos is None or ReaddyUtil.vector_is_invalid(axis_pos):
-                    raise Exception(
-                        "Failed to get axis position for actin in filament\n"
-                        "tried to use positions: "
-                        + ActinAnalyzer.positions_to_string(
-                            actin_ids, box_size, frame_particle_data
-                        )
-                    )
-                axis_pos = ReaddyUtil.get_non_periodic_boundary_position(
-                    last_pos, axis_pos, box_size
-                )
-                positions.append(axis_pos)
-                last_pos = axis_pos
-            if len(positions) > 2:
-                axis = ActinAnalyzer._calculate_line(
-                    np.squeeze(np.array(positions)), box_size
+        actin_ids, _, axis_positions = ActinAnalyzer._frame_filament_axis_positions(
+            frame_particle_data, box_size, periodic_boundary
+        )
+        invalid = np.isnan(axis_positions).any(axis=1)
+        if np.any(invalid):
+            actin_index = np.argmax(invalid)
+            raise Exception(
+                "Failed to get axis position for actin in filament\n"
+                "tried to use positions: "
+                + ActinAnalyzer.positions_to_string(
+                    actin_ids[actin_index].tolist(), box_size, frame_particle_data
                 )
-                for pos in positions:
-                    line_pos = ActinAnalyzer._get_closest_point_on_line(axis, pos)
-                    result.append(np.linalg.norm(line_pos - pos))
+            )
+        start_index = 0
+        for filament in filaments:
+            n_positions = max(0, len(filament) - 2)
+            filament_axis_positions = axis_positions[
+                start_index : start_index + n_positions
+            ]
+            start_index += n_positions
+            if n_positions <= 2:
+                continue
+            positions = ReaddyUtil.get_non_periodic_boundary_chain(
+                filament_axis_positions,
+                box_size,
+                frame_particle_data["particles"][filament[0]]["position"],
+            )
+            axis = ActinAnalyzer._calculate_line(positions, box_size)
+            line_dir = ReaddyUtil.normalize(axis[1] - axis[0])
+            line_positions = axis[0] + np.outer(
+                np.dot(positions - axis[0], line_dir), line_dir
+            )
+            result += np.linalg.norm(line_positions - positions, axis=1).tolist()
         return result
 
     @staticmethod
@@ -887,24 +1045,16 @@ class ActinAnalyzer:
         return result
 
     @staticmethod
-    def analyze_free_actin_concentration_over_time(monomer_data, box_size):
+    def analyze_free_actin_concentration_over_time(
+        monomer_data, box_size, type_class_counts=None
+    ):
         """
         Get an array of the concentration of free actin at each step.
         """
-        result = []
-        for t in range(len(monomer_data)):
-            result.append(
-                ReaddyUtil.calculate_concentration(
-                    len(
-                        ReaddyUtil.analyze_frame_get_ids_for_types(
-                            ActinAnalyzer._free_actin_types(),
-                            monomer_data[t],
-                        )
-                    ),
-                    box_size,
-                )
-            )
-        return np.array(result)
+        counts = ActinAnalyzer._type_class_counts(monomer_data, type_class_counts)
+        return ReaddyUtil.calculate_concentration(
+            counts["free_actin"].astype(float), box_size
+        )
 
     @staticmethod
     def analyze_pointed_end_displacement(monomer_data, box_size, periodic_boundary):
@@ -915,10 +1065,9 @@ class ActinAnalyzer:
         result = []
         initial_pointed_pos = None
         for t in range(len(monomer_data)):
-            pointed_id = ReaddyUtil.analyze_frame_get_ids_for_types(
-                ActinAnalyzer._pointed_actin_types(), monomer_data[t]
-            )[0]
-            pointed_position = monomer_data[t]["particles"][pointed_id]["position"]
+            pointed_position = ActinAnalyzer._get_frame_pointed_end_position(
+                monomer_data[t]
+            )
             if t == 0:
                 result.append(0.0)
                 initial_pointed_pos = pointed_position
@@ -930,6 +1079,16 @@ class ActinAnalyzer:
             result.append(np.linalg.norm(pointed_position - initial_pointed_pos))
         return np.array(result)
 
+    @staticmethod
+    def _get_frame_pointed_end_position(frame_particle_data):
+        """
+        Get the position of the pointed end of the mother filament.
+        """
+        pointed_id = ActinAnalyzer._frame_ids_for_types(
+            frame_particle_data, ActinAnalyzer._pointed_actin_types()
+        )[0]
+        return frame_particle_data["particles"][pointed_id]["position"]
+
     @staticmethod
     def analyze_normals_and_axis_positions(monomer_data, box_size, periodic_boundary):
         """
@@ -942,43 +1101,58 @@ class ActinAnalyzer:
         axis_positions = []
         warned = False
         for time_index in range(total_steps):
-            normals.append([])
-            axis_positions.append([])
-            filaments = ActinAnalyzer._frame_all_filaments(monomer_data[time_index])
-            for filament in filaments:
-                for index in range(1, len(filament) - 1):
-                    position = monomer_data[time_index]["particles"][filament[index]][
-                        "position"
-                    ]
-                    actin_ids = [
-                        filament[index - 1],
-                        filament[index],
-                        filament[index + 1],
-                    ]
-                    axis_pos = ActinAnalyzer._get_axis_position_for_actin(
-                        monomer_data[time_index], actin_ids, box_size, periodic_boundary
-                    )
-                    if ReaddyUtil.vector_is_invalid(axis_pos):
-                        if not warned:
-                            print(
-                                "WARNING: Failed normal calculation: something is "
-                                "wrong with actin structure starting at time index "
-                                f"= {time_index}"
-                            )
-                            warned = True
-                        axis_positions[time_index].append(None)
-                        normals[time_index].append(None)
-                        continue
-                    if periodic_boundary:
-                        axis_pos = ReaddyUtil.get_non_periodic_boundary_position(
-                            position, axis_pos, box_size
-                        )
-                    axis_positions[time_index].append(axis_pos)
-                    normals[time_index].append(
-                        ReaddyUtil.normalize(position - axis_pos)
-                    )
+            (
+                frame_normals,
+                frame_axis_positions,
+                failed,
+            ) = ActinAnalyzer._get_frame_normals_and_axis_positions(
+                monomer_data[time_index], box_size, periodic_boundary
+            )
+            if failed and not warned:
+                ActinAnalyzer._warn_failed_normals(time_index)
+                warned = True
+            normals.append(frame_normals)
+            axis_positions.append(frame_axis_positions)
         return normals, axis_positions
 
+    @staticmethod
+    def _warn_failed_normals(time_index):
+        """
+        Warn that the normals couldn't be calculated at a time index.
+        """
+        print(
+            "WARNING: Failed normal calculation: something is "
+            "wrong with actin structure starting at time index "
+            f"= {time_index}"
+        )
+
+    @staticmethod
+    def _get_frame_normals_and_axis_positions(
+        frame_particle_data, box_size, periodic_boundary
+    ):
+        """
+        Get the normal vector and axis position
+        for each filamentous actin monomer (except ends) in one frame
+        (None where they can't be calculated),
+        and whether any of them couldn't be calculated.
+        """
+        _, positions, axis_pos = ActinAnalyzer._frame_filament_axis_positions(
+            frame_particle_data, box_size, periodic_boundary
+        )
+        invalid = np.isnan(axis_pos).any(axis=1).tolist()
+        if len(positions) > 0:
+            positions = positions[:, 1]
+            if periodic_boundary:
+                axis_pos = ReaddyUtil.get_non_periodic_boundary_positions(
+                    positions, axis_pos, box_size
+                )
+            normal = ReaddyUtil.normalize_vectors(positions - axis_pos)
+        normals = [None if invalid[i] else normal[i] for i in range(len(invalid))]
+        axis_positions = [
+            None if invalid[i] else axis_pos[i] for i in range(len(invalid))
+        ]
+        return normals, axis_positions, any(invalid)
+
     @staticmethod
     def _normal_vectors_are_none(normals, axis_positions, time_i, normal_i):
         """
@@ -1057,64 +1231,59 @@ class ActinAnalyzer:
         at each timestep.
         """
         total_steps = len(monomer_data)
-        plane_normals = []
+        twist_angles = []
         filament_positions = []
         print("Analyzing twist (planes)...")
         for time_index in range(0, total_steps, stride):
-            plane_normals.append([])
-            new_time = math.floor(time_index / stride)
-            filaments = ActinAnalyzer._frame_all_filaments(monomer_data[time_index])
-            for filament in filaments:
-                filament_length = len(filament)
-                for index in range(1, filament_length - 1):
-                    prev_particle = monomer_data[time_index]["particles"][
-                        filament[index - 1]
-                    ]
-                    particle = monomer_data[time_index]["particles"][filament[index]]
-                    next_particle = monomer_data[time_index]["particles"][
-                        filament[index + 1]
-                    ]
-                    prev_type_name = prev_particle["type_name"]
-                    type_name = particle["type_name"]
-                    next_type_name = next_particle["type_name"]
-                    if (
-                        "fixed" in prev_type_name
-                        or "fixed" in type_name
-                        or "fixed" in next_type_name
-                    ):
-                        continue
-                    prev_position = prev_particle["position"]
-                    position = particle["position"]
-                    next_position = next_particle["position"]
-                    if periodic_boundary:
-                        prev_position = ReaddyUtil.get_non_periodic_boundary_position(
-                            position, prev_position, box_size
-                        )
-                        next_position = ReaddyUtil.get_non_periodic_boundary_position(
-                            position, next_position, box_size
-                        )
-                    v1 = prev_position - position
-                    v2 = next_position - position
-                    normal = np.cross(v1, v2)
-                    normal /= np.linalg.norm(normal)
-                    plane_normals[new_time].append(normal)
-        twist_angles = []
-        for time_index in range(len(plane_normals)):
-            twist_angles.append([])
-            filament_positions.append([])
-            for index in range(0, len(plane_normals[time_index]) - 1, 2):
-                # compare every other normal to get the long helix twist
-                total_angle = ReaddyUtil.get_angle_between_vectors(
-                    plane_normals[time_index][index],
-                    plane_normals[time_index][index + 1],
-                    in_degrees=True,
-                )
-                if math.isnan(total_angle):
-                    total_angle = 0.0
-                twist_angles[time_index].append(total_angle)
-                filament_positions[time_index].append(index)
+            angles, positions = ActinAnalyzer._get_frame_twist_planes(
+                monomer_data[time_index], box_size, periodic_boundary
+            )
+            twist_angles.append(angles)
+            filament_positions.append(positions)
         return np.array(twist_angles), np.array(filament_positions)
 
+    @staticmethod
+    def _get_frame_twist_planes(frame_particle_data, box_size, periodic_boundary):
+        """
+        Get the twist in degrees between the normal vectors to the planes
+        of every other set of 3 actin positions in one frame,
+        and the index in the filament of each.
+        """
+        filaments = ActinAnalyzer._frame_all_filaments(frame_particle_data)
+        actin_ids = ActinAnalyzer._get_actin_ids_for_filaments(filaments)
+        fixed = np.array(
+            [
+                "fixed" in frame_particle_data["particles"][particle_id]["type_name"]
+                for particle_id in actin_ids.ravel().tolist()
+            ],
+            dtype=bool,
+        ).reshape(actin_ids.shape)
+        actin_ids = actin_ids[~np.any(fixed, axis=1)]
+        positions = ActinAnalyzer._get_positions_for_ids(frame_particle_data, actin_ids)
+        prev_positions = positions[:, 0]
+        next_positions = positions[:, 2]
+        if periodic_boundary:
+            prev_positions = ReaddyUtil.get_non_periodic_boundary_positions(
+                positions[:, 1], prev_positions, box_size
+            )
+            next_positions = ReaddyUtil.get_non_periodic_boundary_positions(
+                positions[:, 1], next_positions, box_size
+            )
+        normals = np.cross(
+            prev_positions - positions[:, 1], next_positions - positions[:, 1]
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+        # compare every other normal to get the long helix twist
+        n_angles = len(normals) // 2
+        angles = ReaddyUtil.get_angles_between_vectors(
+            normals[0 : 2 * n_angles : 2],
+            normals[1 : 2 * n_angles : 2],
+            in_degrees=True,
+        )
+        angles[np.isnan(angles)] = 0.0
+        return angles.tolist(), list(range(0, 2 * n_angles, 2))
+
     @staticmethod
     def analyze_filament_length(
         normals, axis_positions, box_size, periodic_boundary, stride=1
@@ -1148,6 +1317,32 @@ class ActinAnalyzer:
             )
         return np.array(filament_length)
 
+    @staticmethod
+    def _get_trajectory_filament(frame):
+        """
+        get the (N, 3) positions of the particles in the first topology
+        of a trajectory frame, in order, and whether each one is fixed.
+        """
+        particles = [
+            frame.particles[particle_id]
+            for particle_id in frame.topologies[0].particle_ids
+        ]
+        positions = np.array(
+            [particle.position for particle in particles], dtype=float
+        ).reshape(-1, 3)
+        fixed = np.array(["fixed" in particle.type_name for particle in particles])
+        return positions, fixed
+
+    @staticmethod
+    def _windows_with_fixed(fixed, window_size):
+        """
+        for each window of window_size consecutive particles in a filament,
+        does it include a fixed particle?
+        """
+        if len(fixed) < window_size:
+            return np.zeros(0, dtype=bool)
+        return np.convolve(fixed, np.ones(window_size), "valid") > 0
+
     @staticmethod
     def analyze_bond_stretch(trajectory, box_size, periodic_boundary, stride=1):
         """
@@ -1164,45 +1359,51 @@ class ActinAnalyzer:
         )
         print("Analyzing bond stretch...")
         for time_index in range(0, len(trajectory), stride):
-            stretch_lat.append([])
-            stretch_long.append([])
-            new_time_index = math.floor(time_index / stride)
-            filament = trajectory[time_index].topologies[0].particle_ids
-            for index in range(len(filament) - 2):
-                particle = trajectory[time_index].particles[filament[index]]
-                particle_lat = trajectory[time_index].particles[filament[index + 1]]
-                particle_long = trajectory[time_index].particles[filament[index + 2]]
-                type_name = particle.type_name
-                type_name_lat = particle_lat.type_name
-                type_name_long = particle_long.type_name
-                if (
-                    "fixed" in type_name
-                    or "fixed" in type_name_lat
-                    or "fixed" in type_name_long
-                ):
-                    stretch_lat[new_time_index].append(0.0)
-                    stretch_long[new_time_index].append(0.0)
-                    continue
-                pos = particle.position
-                pos_lat = particle_lat.position
-                pos_long = particle_long.position
-                if periodic_boundary:
-                    pos_lat = ReaddyUtil.get_non_periodic_boundary_position(
-                        pos, pos_lat, box_size
-                    )
-                    pos_long = ReaddyUtil.get_non_periodic_boundary_position(
-                        pos, pos_long, box_size
-                    )
-                bond_stretch_lat = np.linalg.norm(pos_lat - pos) - ideal_length_lat
-                bond_stretch_long = np.linalg.norm(pos_long - pos) - ideal_length_long
-                if math.isnan(bond_stretch_lat) or math.isnan(bond_stretch_long):
-                    stretch_lat[new_time_index].append(0.0)
-                    stretch_long[new_time_index].append(0.0)
-                    continue
-                stretch_lat[new_time_index].append(bond_stretch_lat)
-                stretch_long[new_time_index].append(bond_stretch_long)
+            positions, fixed = ActinAnalyzer._get_trajectory_filament(
+                trajectory[time_index]
+            )
+            pos = positions[:-2]
+            pos_lat = positions[1:-1]
+            pos_long = positions[2:]
+            if periodic_boundary:
+                pos_lat = ReaddyUtil.get_non_periodic_boundary_positions(
+                    pos, pos_lat, box_size
+                )
+                pos_long = ReaddyUtil.get_non_periodic_boundary_positions(
+                    pos, pos_long, box_size
+                )
+            bond_stretch_lat = np.linalg.norm(pos_lat - pos, axis=1) - ideal_length_lat
+            bond_stretch_long = (
+                np.linalg.norm(pos_long - pos, axis=1) - ideal_length_long
+            )
+            invalid = (
+                ActinAnalyzer._windows_with_fixed(fixed, 3)
+                | np.isnan(bond_stretch_lat)
+                | np.isnan(bond_stretch_long)
+            )
+            bond_stretch_lat[invalid] = 0.0
+            bond_stretch_long[invalid] = 0.0
+            stretch_lat.append(bond_stretch_lat.tolist())
+            stretch_long.append(bond_stretch_long.tolist())
         return np.array(stretch_lat), np.array(stretch_long)
 
+    @staticmethod
+    def _get_angle_stretch(positions, window_size, indices, ideal_angle):
+        """
+        for each window of window_size consecutive positions in a filament,
+        get the difference from ideal_angle (degrees) of the angle between
+        the vectors from window[indices[1]] to window[indices[0]]
+        and from window[indices[3]] to window[indices[2]].
+        """
+        n_windows = max(0, len(positions) - window_size + 1)
+        vectors = [positions[index : index + n_windows] for index in indices]
+        return (
+            ReaddyUtil.get_angles_between_vectors(
+                vectors[0] - vectors[1], vectors[2] - vectors[3], True
+            )
+            - ideal_angle
+        )
+
     @staticmethod
     def analyze_angle_stretch(trajectory, box_size, periodic_boundary, stride=1):
         """
@@ -1220,62 +1421,35 @@ class ActinAnalyzer:
         ideal_angle_long_long = ActinStructure.actin_to_actin_angle(False, False, True)
         print("Analyzing angle stretch...")
         for time_index in range(0, len(trajectory), stride):
-            result_lat_lat.append([])
-            result_lat_long.append([])
-            result_long_long.append([])
-            new_time_index = math.floor(time_index / stride)
-            filament = trajectory[time_index].topologies[0].particle_ids
-            for index in range(len(filament) - 4):
-                particles = []
-                positions = []
-                fixed = False
-                for d in range(5):
-                    particles.append(
-                        trajectory[time_index].particles[filament[index + d]]
-                    )
-                    if "fixed" in particles[d].type_name:
-                        fixed = True
-                        break
-                    positions.append(particles[d].position)
-                    if d > 0 and periodic_boundary:
-                        positions[d] = ReaddyUtil.get_non_periodic_boundary_position(
-                            positions[d - 1], positions[d], box_size
-                        )
-                if fixed:
-                    result_lat_lat[new_time_index].append(0.0)
-                    result_lat_long[new_time_index].append(0.0)
-                    result_long_long[new_time_index].append(0.0)
-                    continue
-                stretch_lat_lat = (
-                    ReaddyUtil.get_angle_between_vectors(
-                        positions[0] - positions[1], positions[2] - positions[1], True
-                    )
-                    - ideal_angle_lat_lat
-                )
-                stretch_lat_long = (
-                    ReaddyUtil.get_angle_between_vectors(
-                        positions[0] - positions[1], positions[3] - positions[1], True
-                    )
-                    - ideal_angle_lat_long
-                )
-                stretch_long_long = (
-                    ReaddyUtil.get_angle_between_vectors(
-                        positions[0] - positions[2], positions[4] - positions[2], True
-                    )
-                    - ideal_angle_long_long
+            positions, fixed = ActinAnalyzer._get_trajectory_filament(
+                trajectory[time_index]
+            )
+            if periodic_boundary:
+                positions = ReaddyUtil.get_non_periodic_boundary_chain(
+                    positions, box_size
                 )
-                if (
-                    math.isnan(stretch_lat_lat)
-                    or math.isnan(stretch_lat_long)
-                    or math.isnan(stretch_long_long)
-                ):
-                    result_lat_lat[new_time_index].append(0.0)
-                    result_lat_long[new_time_index].append(0.0)
-                    result_long_long[new_time_index].append(0.0)
-                    continue
-                result_lat_lat[new_time_index].append(stretch_lat_lat)
-                result_lat_long[new_time_index].append(stretch_lat_long)
-                result_long_long[new_time_index].append(stretch_long_long)
+            stretch_lat_lat = ActinAnalyzer._get_angle_stretch(
+                positions, 5, [0, 1, 2, 1], ideal_angle_lat_lat
+            )
+            stretch_lat_long = ActinAnalyzer._get_angle_stretch(
+                positions, 5, [0, 1, 3, 1], ideal_angle_lat_long
+            )
+            stretch_long_long = ActinAnalyzer._get_angle_stretch(
+                positions, 5, [0, 2, 4, 2], ideal_angle_long_long
+            )
+            invalid = (
+                ActinAnalyzer._windows_with_fixed(fixed, 5)
+                | np.isnan(stretch_lat_lat)
+                | np.isnan(stretch_lat_long)
+                | np.isnan(stretch_long_long)
+            )
+            for result, angles in [
+                (result_lat_lat, stretch_lat_lat),
+                (result_lat_long, stretch_lat_long),
+                (result_long_long, stretch_long_long),
+            ]:
+                angles[invalid] = 0.0
+                result.append(angles.tolist())
         return (
             np.array(result_lat_lat),
             np.array(result_lat_long),
@@ -1302,48 +1476,26 @@ class ActinAnalyzer:
         )
         print("Analyzing dihedral stretch...")
         for time_index in range(0, len(trajectory), stride):
-            result_lat_lat_lat.append([])
-            result_long_long_long.append([])
-            new_time_index = math.floor(time_index / stride)
-            filament = trajectory[time_index].topologies[0].particle_ids
-            for index in range(len(filament) - 6):
-                particles = []
-                positions = []
-                fixed = False
-                for d in range(7):
-                    particles.append(
-                        trajectory[time_index].particles[filament[index + d]]
-                    )
-                    if "fixed" in particles[d].type_name:
-                        fixed = True
-                        break
-                    positions.append(particles[d].position)
-                    if d > 0 and periodic_boundary:
-                        positions[d] = ReaddyUtil.get_non_periodic_boundary_position(
-                            positions[d - 1], positions[d], box_size
-                        )
-                if fixed:
-                    result_lat_lat_lat[new_time_index].append(0.0)
-                    result_long_long_long[new_time_index].append(0.0)
-                    continue
-                stretch_lat_lat_lat = (
-                    ReaddyUtil.get_angle_between_vectors(
-                        positions[0] - positions[1], positions[3] - positions[2], True
-                    )
-                    - ideal_angle_lat_lat_lat
-                )
-                stretch_long_long_long = (
-                    ReaddyUtil.get_angle_between_vectors(
-                        positions[0] - positions[2], positions[6] - positions[4], True
-                    )
-                    - ideal_angle_long_long_long
+            positions, fixed = ActinAnalyzer._get_trajectory_filament(
+                trajectory[time_index]
+            )
+            if periodic_boundary:
+                positions = ReaddyUtil.get_non_periodic_boundary_chain(
+                    positions, box_size
                 )
-                if math.isnan(stretch_lat_lat_lat) or math.isnan(
-                    stretch_long_long_long
-                ):
-                    result_lat_lat_lat[new_time_index].append(0.0)
-                    result_long_long_long[new_time_index].append(0.0)
-                    continue
-                result_lat_lat_lat[new_time_index].append(stretch_lat_lat_lat)
-                result_long_long_long[new_time_index].append(stretch_long_long_long)
+            stretch_lat_lat_lat = ActinAnalyzer._get_angle_stretch(
+                positions, 7, [0, 1, 3, 2], ideal_angle_lat_lat_lat
+            )
+            stretch_long_long_long = ActinAnalyzer._get_angle_stretch(
+                positions, 7, [0, 2, 6, 4], ideal_angle_long_long_long
+            )
+            invalid = (
+                ActinAnalyzer._windows_with_fixed(fixed, 7)
+                | np.isnan(stretch_lat_lat_lat)
+                | np.isnan(stretch_long_long_long)
+            )
+            stretch_lat_lat_lat[invalid] = 0.0
+            stretch_long_long_long[invalid] = 0.0
+            result_lat_lat_lat.append(stretch_lat_lat_lat.tolist())
+            result_long_long_long.append(stretch_long_long_long.tolist())
         return (np.array(result_lat_lat_lat), np.array(result_long_long_long))
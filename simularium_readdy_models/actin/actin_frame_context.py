@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+
+class ActinFrameContext:
+    """
+    One frame of monomer data plus a cache for the values
+    that actin analyses derive from it
+    (filaments, branch ids, ids of each class of particle types, etc).
+
+    It reads like the frame (context["particles"], context["topologies"]),
+    so a list of contexts from ActinFrameContext.from_monomer_data
+    can be passed to any ActinAnalyzer function in place of the monomer data.
+    Each value is then computed once per frame and shared by all the analyses,
+    instead of every analysis tracing the same filaments again.
+    The frame must not be changed while its context is in use.
+    """
+
+    def __init__(self, frame_particle_data):
+        self.frame_particle_data = frame_particle_data
+        self._values = {}
+
+    @staticmethod
+    def of(frame_particle_data):
+        """
+        get a context for a frame, or the frame itself if it's already a context.
+        """
+        if isinstance(frame_particle_data, ActinFrameContext):
+            return frame_particle_data
+        return ActinFrameContext(frame_particle_data)
+
+    @staticmethod
+    def from_monomer_data(monomer_data):
+        """
+        get a context for each frame of monomer data.
+        """
+        return [ActinFrameContext.of(frame) for frame in monomer_data]
+
+    @staticmethod
+    def unwrap(frame_particle_data):
+        """
+        get the frame of monomer data for a frame or a context.
+        """
+        if isinstance(frame_particle_data, ActinFrameContext):
+            return frame_particle_data.frame_particle_data
+        return frame_particle_data
+
+    def __getitem__(self, key):
+        return self.frame_particle_data[key]
+
+    def __contains__(self, key):
+        return key in self.frame_particle_data
+
+    def keys(self):
+        return self.frame_particle_data.keys()
+
+    def cached(self, key, compute):
+        """
+        get the value cached for key, calling compute() to get it the first time.
+        """
+        if key not in self._values:
+            self._values[key] = compute()
+        return self._values[key]
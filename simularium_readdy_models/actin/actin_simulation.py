@@ -4,17 +4,41 @@
 import numpy as np
 import readdy
 
-from ..common import ReaddyUtil
+from ..common import ReaddyUtil, SystemSpec
 from .actin_structure import ActinStructure
 from .actin_util import ActinUtil
 
 
 class ActinSimulation:
+    # parameters that only affect reactions or the initial state,
+    # not the particle types and constraints in the system spec
+    SPEC_IGNORED_PARAMETERS = [
+        "name",
+        "total_steps",
+        "time_step",
+        "timestep",
+        "n_cpu",
+        "verbose",
+        "reactions",
+        "*_rate",
+        "*_concentration",
+        "seed_*",
+        "orthogonal_seed",
+        "branched_seed",
+        "n_fixed_monomers_*",
+        "displace*",
+        "tangent_displace*",
+        "radial_displace*",
+        "obstacle*_position_*",
+        "plot_*",
+    ]
+
     def __init__(
         self,
         parameters,
         record=False,
         save_checkpoints=False,
+        spec_cache_path=None,
     ):
         """
         Creates a ReaDDy branched actin simulation.
@@ -37,8 +61,12 @@ class ActinSimulation:
         debranching_ATP_rate, debranching_ADP_rate, cap_bind_rate,
         cap_unbind_rate, hydrolysis_actin_rate, hydrolysis_arp_rate,
         nucleotide_exchange_actin_rate, nucleotide_exchange_arp_rate, verbose
+
+        spec_cache_path: directory to save the system's types and constraints to,
+        so later simulations with the same parameters can load them.
         """
         self.parameters = parameters
+        self.spec_cache_path = spec_cache_path
         self.set_constant_parameters()
         self.actin_util = ActinUtil(
             self.parameters, self.get_pointed_end_displacements()
@@ -86,12 +114,32 @@ class ActinSimulation:
         )
         self.parameters["temperature_K"] = self._parameter("temperature_C") + 273.15
         self.system.temperature = self.parameters["temperature_K"]
-        self.add_particle_types()
-        ActinUtil.check_add_global_box_potential(self.system)
-        self.add_constraints()
+        self.system_spec = SystemSpec.load_or_build(
+            self.spec_cache_path, self.system_spec_key(), self.add_system_spec
+        )
+        self.system_spec.apply(self.system)
         self.add_reactions()
 
-    def add_particle_types(self):
+    def system_spec_key(self):
+        """
+        Get the key for the system's types and constraints
+        from the parameters that can affect them.
+        """
+        return SystemSpec.key(
+            self.parameters,
+            ActinSimulation.SPEC_IGNORED_PARAMETERS,
+            [ActinSimulation, ActinUtil, ActinStructure, ReaddyUtil],
+        )
+
+    def add_system_spec(self, system):
+        """
+        Add particle types and constraints to a ReaDDy system or SystemSpec.
+        """
+        self.add_particle_types(system)
+        ActinUtil.check_add_global_box_potential(system)
+        self.add_constraints(system)
+
+    def add_particle_types(self, system):
         """
         Add particle and topology types for actin particles
         to the ReaDDy system.
@@ -107,12 +155,12 @@ class ActinSimulation:
         cap_diffCoeff = ReaddyUtil.calculate_diffusionCoefficient(
             self._parameter("cap_radius"), viscosity, temperature
         )  # nm^2/s
-        self.actin_util.add_actin_types(self.system, actin_diffCoeff)
-        self.actin_util.add_arp23_types(self.system, arp23_diffCoeff)
-        self.actin_util.add_cap_types(self.system, cap_diffCoeff)
-        self.system.add_species("obstacle", 0.0)
+        self.actin_util.add_actin_types(system, actin_diffCoeff)
+        self.actin_util.add_arp23_types(system, arp23_diffCoeff)
+        self.actin_util.add_cap_types(system, cap_diffCoeff)
+        system.add_species("obstacle", 0.0)
 
-    def add_constraints(self):
+    def add_constraints(self, system):
         """
         Add geometric constraints for connected actin particles,
         including bonds, angles, and repulsions, to the ReaDDy system.
@@ -127,37 +175,37 @@ class ActinSimulation:
         )
         # linear actin
         self.actin_util.add_bonds_between_actins(
-            self.system,
+            system,
             util,
             longitudinal_bonds,
             float(self._parameter("bonds_force_multiplier")),
         )
         self.actin_util.add_filament_twist_angles(
-            actin_angle_force_constant, self.system, util, longitudinal_bonds
+            actin_angle_force_constant, system, util, longitudinal_bonds
         )
         self.actin_util.add_filament_twist_dihedrals(
             actin_dihedral_force_constant,
-            self.system,
+            system,
             util,
             longitudinal_bonds,
             only_linear_actin,
         )
         if not only_linear_actin:
             # branch junction
-            self.actin_util.add_branch_bonds(self.system, util)
+            self.actin_util.add_branch_bonds(system, util)
             self.actin_util.add_branch_angles(
-                2.0 * ActinUtil.DEFAULT_FORCE_CONSTANT, self.system, util
+                2.0 * ActinUtil.DEFAULT_FORCE_CONSTANT, system, util
             )
             self.actin_util.add_branch_dihedrals(
-                ActinUtil.DEFAULT_FORCE_CONSTANT, self.system, util
+                ActinUtil.DEFAULT_FORCE_CONSTANT, system, util
             )
             # capping protein
-            self.actin_util.add_cap_bonds(self.system, util)
+            self.actin_util.add_cap_bonds(system, util)
             self.actin_util.add_cap_angles(
-                2.0 * ActinUtil.DEFAULT_FORCE_CONSTANT, self.system, util
+                2.0 * ActinUtil.DEFAULT_FORCE_CONSTANT, system, util
             )
             self.actin_util.add_cap_dihedrals(
-                ActinUtil.DEFAULT_FORCE_CONSTANT, self.system, util
+                ActinUtil.DEFAULT_FORCE_CONSTANT, system, util
             )
         # repulsions
         self.actin_util.add_repulsions(
@@ -165,13 +213,13 @@ class ActinSimulation:
             self._parameter("cap_radius"),
             self._parameter("obstacle_radius"),
             ActinUtil.DEFAULT_FORCE_CONSTANT,
-            self.system,
+            system,
             util,
             actin_actin_repulsion_potentials=True,
             longitudinal_bonds=longitudinal_bonds,
         )
         # box potentials
-        self.actin_util.add_monomer_box_potentials(self.system)
+        self.actin_util.add_monomer_box_potentials(system)
 
     def add_reactions(self):
         """
@@ -330,19 +378,21 @@ class ActinSimulation:
         """
         Add obstacle particles.
         """
-        n = 0
-        while f"obstacle{n}_position_x" in self.parameters:
-            self.simulation.add_particle(
-                type="obstacle",
-                position=[
+        positions = []
+        while f"obstacle{len(positions)}_position_x" in self.parameters:
+            n = len(positions)
+            positions.append(
+                [
                     float(self._parameter(f"obstacle{n}_position_x")),
                     float(self._parameter(f"obstacle{n}_position_y")),
                     float(self._parameter(f"obstacle{n}_position_z")),
-                ],
+                ]
+            )
+        if len(positions) > 0:
+            self.simulation.add_particles(
+                type="obstacle", positions=np.array(positions)
             )
-            n += 1
-        if n > 0:
-            print(f"Added {n} obstacle(s).")
+            print(f"Added {len(positions)} obstacle(s).")
 
     def add_crystal_structure_monomers(self):
         """
@@ -1,11 +1,39 @@
 #!/usr/bin/env python
 
+from functools import lru_cache, wraps
+
 import numpy as np
 
 from ..common import ReaddyUtil
 from .fiber_data import FiberData
 
 
+def _read_only(value):
+    """
+    make arrays read-only, recursing into lists and tuples.
+    """
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, (list, tuple)):
+        value = tuple(_read_only(item) for item in value)
+    return value
+
+
+def _structural_constant(function):
+    """
+    calculate a structural quantity only the first time it's requested
+    (for each set of arguments), and return it read-only after that
+    so callers can't change the cached value.
+    """
+
+    @lru_cache(maxsize=None)
+    @wraps(function)
+    def constant(*args, **kwargs):
+        return _read_only(function(*args, **kwargs))
+
+    return constant
+
+
 class ActinStructure:
     """
     Measurements are from Chimera:
@@ -23,6 +51,9 @@ class ActinStructure:
       - find these values in the output from the measure commands
         (spatial values are multiplied by 0.1 from Angstroms to nm,
         angle values are in degrees).
+
+    Quantities derived from the crystal structure are calculated once
+    and returned read-only.
     """
 
     arp3_position = np.array([29.275, 27.535, 23.944])
@@ -54,6 +85,7 @@ class ActinStructure:
     actin_to_actin_axis_distance = (2.795019154 + 2.811178372) / 2.0
 
     @staticmethod
+    @_structural_constant
     def actin_to_actin_axis_angle():
         return np.deg2rad(ActinStructure.actin_to_actin_angle_degrees)
 
@@ -80,6 +112,7 @@ class ActinStructure:
         )
 
     @staticmethod
+    @_structural_constant
     def vector_to_axis():
         mother_fiber = ActinStructure.mother_fiber()
         axis_position = mother_fiber.get_nearest_position(
@@ -88,10 +121,12 @@ class ActinStructure:
         return axis_position - ActinStructure.mother_positions[3]
 
     @staticmethod
+    @_structural_constant
     def actin_distance_from_axis():
         return np.linalg.norm(ActinStructure.vector_to_axis())
 
     @staticmethod
+    @_structural_constant
     def branch_positions():
         """
         get the points on the mother and daughter axes that are closest to each other.
@@ -119,10 +154,12 @@ class ActinStructure:
         ]
 
     @staticmethod
+    @_structural_constant
     def mother_branch_position():
         return ActinStructure.branch_positions()[0]
 
     @staticmethod
+    @_structural_constant
     def branch_shift():
         branch_positions = ActinStructure.branch_positions()
         return np.linalg.norm(branch_positions[1] - branch_positions[0])
@@ -142,12 +179,14 @@ class ActinStructure:
             return ActinStructure.daughter_positions[0]
 
     @staticmethod
+    @_structural_constant
     def branch_angle():
         return ReaddyUtil.get_angle_between_vectors(
             ActinStructure.mother_axis_direction, ActinStructure.daughter_axis_direction
         )
 
     @staticmethod
+    @_structural_constant
     def bound_arp_orientation():
         actin_arp2_pos = ActinStructure.mother_positions[3]
         actin_arp2_axis_pos = ActinStructure.mother_fiber().get_nearest_position(
@@ -159,12 +198,14 @@ class ActinStructure:
         )
 
     @staticmethod
+    @_structural_constant
     def nucleated_arp_orientation():
         return ReaddyUtil.get_orientation_from_vectors(
             ActinStructure.mother_axis_direction, ActinStructure.daughter_axis_direction
         )
 
     @staticmethod
+    @_structural_constant
     def actin_to_actin_distance_lateral():
         distances = []
         for i in range(len(ActinStructure.mother_positions) - 1):
@@ -177,6 +218,7 @@ class ActinStructure:
         return np.mean(np.array(distances))
 
     @staticmethod
+    @_structural_constant
     def actin_to_actin_distance_longitudinal():
         distances = []
         for i in range(len(ActinStructure.mother_positions) - 2):
@@ -213,6 +255,7 @@ class ActinStructure:
         )
 
     @staticmethod
+    @_structural_constant
     def actin_to_actin_angle(isLateral1=True, isLateral2=True, inDegrees=False):
         angles = []
         d1 = 1
@@ -235,6 +278,7 @@ class ActinStructure:
         return np.mean(np.array(angles))
 
     @staticmethod
+    @_structural_constant
     def actin_to_actin_dihedral_angle(
         isLateral1=True, isLateral2=True, isLateral3=True, inDegrees=False
     ):
@@ -294,6 +338,7 @@ class ActinStructure:
         return ReaddyUtil.get_angle_between_vectors(v1, v2)
 
     @staticmethod
+    @_structural_constant
     def actin_to_actin_repulsion_distance(isLateral):
         if isLateral:
             return 0.95 * ActinStructure.actin_to_actin_distance_lateral()
@@ -361,6 +406,7 @@ class ActinStructure:
         return ReaddyUtil.get_angle_between_vectors(v1, v2)
 
     @staticmethod
+    @_structural_constant
     def orientation():
         return ReaddyUtil.get_orientation_from_positions(
             [
@@ -371,6 +417,22 @@ class ActinStructure:
         )
 
     @staticmethod
+    @_structural_constant
+    def inverse_orientation():
+        return np.linalg.inv(ActinStructure.orientation())
+
+    @staticmethod
+    @_structural_constant
+    def inverse_bound_arp_orientation():
+        return np.linalg.inv(ActinStructure.bound_arp_orientation())
+
+    @staticmethod
+    @_structural_constant
+    def inverse_nucleated_arp_orientation():
+        return np.linalg.inv(ActinStructure.nucleated_arp_orientation())
+
+    @staticmethod
+    @_structural_constant
     def mother1_to_branch_actin_vectors():
         return [
             ActinStructure.daughter_positions[0] - ActinStructure.mother_positions[3],
@@ -379,17 +441,21 @@ class ActinStructure:
         ]
 
     @staticmethod
+    @_structural_constant
     def mother1_to_arp3_vector():
         return ActinStructure.arp3_position - ActinStructure.mother_positions[3]
 
     @staticmethod
+    @_structural_constant
     def mother1_to_arp2_vector():
         return ActinStructure.arp2_position - ActinStructure.mother_positions[3]
 
     @staticmethod
+    @_structural_constant
     def mother1_to_mother3_vector():
         return ActinStructure.mother_positions[5] - ActinStructure.mother_positions[3]
 
     @staticmethod
+    @_structural_constant
     def mother1_to_mother_vector():
         return ActinStructure.mother_positions[1] - ActinStructure.mother_positions[3]
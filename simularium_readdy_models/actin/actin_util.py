@@ -5,7 +5,7 @@ import random
 import numpy as np
 import readdy
 
-from ..common import ReaddyUtil
+from ..common import ParticleTypeRegistry, ReaddyUtil, TopologyIndex, TypeCatalogue
 from .actin_generator import ActinGenerator
 from .actin_structure import ActinStructure
 from .fiber_data import FiberData
@@ -120,12 +120,16 @@ class ActinUtil:
     }
 
     @staticmethod
-    def get_new_vertex(topology):
+    def get_new_vertex(topology, index=None):
         """
         Get the vertex tagged "new".
         """
         results = ReaddyUtil.get_vertices_of_type(
-            topology, "new", exact_match=False, error_msg="Failed to find new vertex"
+            topology,
+            "new",
+            exact_match=False,
+            error_msg="Failed to find new vertex",
+            index=index,
         )
         if len(results) > 1:
             raise Exception(
@@ -135,16 +139,22 @@ class ActinUtil:
         return results[0]
 
     @staticmethod
-    def get_new_arp23(topology):
+    def get_new_arp23(topology, index=None):
         """
         get a new arp3 and its unbranched arp2#free neighbor,
         meaning the arp2/3 dimer has just bound.
         """
-        for vertex in topology.graph.get_vertices():
-            pt = topology.particle_type_of_vertex(vertex)
+        if index is None:
+            vertices = topology.graph.get_vertices()
+            type_of = topology.particle_type_of_vertex
+        else:
+            vertices = index.vertices_of_type("arp3#new", False)
+            type_of = index.type_of
+        for vertex in vertices:
+            pt = type_of(vertex)
             if "arp3#new" in pt:
                 for neighbor in vertex:
-                    if topology.particle_type_of_vertex(neighbor.get()) == "arp2#free":
+                    if type_of(neighbor.get()) == "arp2#free":
                         return neighbor.get(), vertex
         return None, None
 
@@ -170,7 +180,9 @@ class ActinUtil:
                 f"{ReaddyUtil.topology_to_string(topology)}"
             )
         return ReaddyUtil.calculate_polymer_number(
-            int(pt[-1]), offset, ActinUtil.n_polymer_numbers()
+            ParticleTypeRegistry.polymer_number(pt),
+            offset,
+            ActinUtil.n_polymer_numbers(),
         )
 
     @staticmethod
@@ -184,12 +196,48 @@ class ActinUtil:
         (e.g. for "actin#ATP" return
         ["actin#ATP_1", "actin#ATP_2", "actin#ATP_3"]).
         """
-        spacer = "_"
-        if "#" not in vertex_type:
-            spacer = "#"
-        return [
-            f"{vertex_type}{spacer}{i + 1}" for i in ActinUtil.polymer_number_range()
-        ]
+        return list(ActinUtil.polymer_actin_types((vertex_type,)))
+
+    @staticmethod
+    def polymer_actin_types(vertex_types, other_types=()):
+        """
+        get a cached tuple of all numbered versions of each of a tuple of types
+        followed by the tuple of other_types
+        (e.g. for ("actin#ATP",), ("actin#branch_ATP_1",) return
+        ("actin#ATP_1", "actin#ATP_2", "actin#ATP_3", "actin#branch_ATP_1")).
+        """
+        return TypeCatalogue.ordered(
+            ("polymer_actin", vertex_types, other_types),
+            ActinUtil.n_polymer_numbers(),
+            lambda: ActinUtil._polymer_actin_types(vertex_types, other_types),
+        )
+
+    @staticmethod
+    def polymer_actin_type_set(vertex_types, other_types=()):
+        """
+        get a cached frozenset of the types from polymer_actin_types.
+        """
+        return TypeCatalogue.members(
+            ("polymer_actin", vertex_types, other_types),
+            ActinUtil.n_polymer_numbers(),
+            lambda: ActinUtil._polymer_actin_types(vertex_types, other_types),
+        )
+
+    @staticmethod
+    def _polymer_actin_types(vertex_types, other_types):
+        """
+        build the list of types for polymer_actin_types.
+        """
+        result = []
+        for vertex_type in vertex_types:
+            spacer = "_"
+            if "#" not in vertex_type:
+                spacer = "#"
+            result += [
+                f"{vertex_type}{spacer}{i + 1}"
+                for i in ActinUtil.polymer_number_range()
+            ]
+        return result + list(other_types)
 
     @staticmethod
     def get_actin_rotation(positions, box_size, periodic_boundary=True):
@@ -206,9 +254,32 @@ class ActinUtil:
                 positions[1], positions[2], box_size
             )
         current_orientation = ReaddyUtil.get_orientation_from_positions(positions)
-        return np.matmul(
-            current_orientation, np.linalg.inv(ActinStructure.orientation())
-        )
+        return np.matmul(current_orientation, ActinStructure.inverse_orientation())
+
+    @staticmethod
+    def get_actin_rotations(positions, box_size, periodic_boundary=True):
+        """
+        get the rotation for each of N actins at once (see get_actin_rotation)
+        positions = (N, 3, 3) array of
+            [prev actin position, middle actin position, next actin position]
+            for each actin.
+        returns (N, 3, 3) array of rotation matrices.
+        """
+        positions = np.array(positions, dtype=float)
+        if periodic_boundary:
+            for index in [0, 2]:
+                positions[:, index] = ReaddyUtil.get_non_periodic_boundary_positions(
+                    positions[:, 1], positions[:, index], box_size
+                )
+        v1 = ReaddyUtil.normalize_vectors(positions[:, 0] - positions[:, 1])
+        v2 = ReaddyUtil.normalize_vectors(positions[:, 2] - positions[:, 1])
+        v1_dot_v1 = np.sum(v1 * v1, axis=1)[:, np.newaxis]
+        v1_dot_v2 = np.sum(v1 * v2, axis=1)[:, np.newaxis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # coincident actins give NaN, like get_actin_rotation
+            v2 = ReaddyUtil.normalize_vectors(v2 - (v1_dot_v2 / v1_dot_v1) * v1)
+        current_orientations = np.stack([v1, v2, np.cross(v2, v1)], axis=2)
+        return np.matmul(current_orientations, ActinStructure.inverse_orientation())
 
     @staticmethod
     def get_actin_axis_position(positions, box_size, periodic_boundary=True):
@@ -228,6 +299,21 @@ class ActinUtil:
         )
         return positions[1] + vector_to_axis_local
 
+    @staticmethod
+    def get_actin_axis_positions(positions, box_size, periodic_boundary=True):
+        """
+        get the position on the filament axis closest to each of N actins at once
+        positions = (N, 3, 3) array of
+            [previous actin position, middle actin position, next actin position]
+            for each actin.
+        """
+        rotations = ActinUtil.get_actin_rotations(
+            positions, box_size, periodic_boundary
+        )
+        return np.asarray(positions, dtype=float)[:, 1] + np.matmul(
+            rotations, ActinStructure.vector_to_axis()
+        )
+
     @staticmethod
     def get_position_for_new_vertex(positions, offset_vector):
         """
@@ -247,7 +333,9 @@ class ActinUtil:
         return (positions[1] + vector_to_new_pos).tolist()
 
     @staticmethod
-    def get_next_actin(topology, v_actin, direction, error_if_not_found=False):
+    def get_next_actin(
+        topology, v_actin, direction, error_if_not_found=False, index=None
+    ):
         """
         get the next actin toward the pointed or barbed direction.
         """
@@ -272,6 +360,7 @@ class ActinUtil:
             parameters["verbose"],
             error_msg if not error_if_not_found else "",
             error_msg if error_if_not_found else "",
+            index=index,
         )
         return v_actin_neighbor
 
@@ -296,14 +385,18 @@ class ActinUtil:
         return None, max_edges
 
     @staticmethod
-    def get_branch_orientation_vertices_and_offset(topology, vertex):
+    def get_branch_orientation_vertices_and_offset(topology, vertex, index=None):
         """
         get orientation vertices [actin, actin_arp2, actin_arp3]
         for a new actin within 3 actins of a branch,
         as well as the offset vector.
         """
         v_arp2 = ReaddyUtil.get_neighbor_of_types(
-            topology, vertex, ["arp2", "arp2#branched", "arp2#free"], []
+            topology,
+            vertex,
+            ["arp2", "arp2#branched", "arp2#free"],
+            [],
+            index=index,
         )
         offset_index = 0
         if v_arp2 is None:
@@ -320,6 +413,7 @@ class ActinUtil:
                 ["arp2", "arp2#branched", "arp2#free"],
                 [],
                 error_msg="Failed to set position: couldn't find arp2",
+                index=index,
             )
         v_arp3 = ReaddyUtil.get_neighbor_of_types(
             topology,
@@ -327,14 +421,17 @@ class ActinUtil:
             ["arp3", "arp3#ATP", "arp3#new", "arp3#new_ATP"],
             [],
             error_msg="Failed to set position: couldn't find arp3",
+            index=index,
         )
-        actin_types = (
-            ActinUtil.get_all_polymer_actin_types("actin")
-            + ActinUtil.get_all_polymer_actin_types("actin#ATP")
-            + ActinUtil.get_all_polymer_actin_types("actin#mid")
-            + ActinUtil.get_all_polymer_actin_types("actin#mid_ATP")
-            + ActinUtil.get_all_polymer_actin_types("actin#barbed")
-            + ActinUtil.get_all_polymer_actin_types("actin#barbed_ATP")
+        actin_types = ActinUtil.polymer_actin_type_set(
+            (
+                "actin",
+                "actin#ATP",
+                "actin#mid",
+                "actin#mid_ATP",
+                "actin#barbed",
+                "actin#barbed_ATP",
+            )
         )
         v_actin_arp3 = ReaddyUtil.get_neighbor_of_types(
             topology,
@@ -342,6 +439,7 @@ class ActinUtil:
             actin_types,
             [],
             error_msg="Failed to set position: couldn't find actin_arp3",
+            index=index,
         )
         n_pointed = ActinUtil.get_actin_number(topology, v_actin_arp3, -1)
         actin_types = [f"actin#ATP_{n_pointed}", f"actin#{n_pointed}"]
@@ -351,6 +449,7 @@ class ActinUtil:
             actin_types,
             [],
             error_msg="Failed to set position: couldn't find actin_arp2",
+            index=index,
         )
         n_pointed = ActinUtil.get_actin_number(topology, v_actin_arp2, -1)
         actin_types = [
@@ -367,6 +466,7 @@ class ActinUtil:
             actin_types,
             [v_actin_arp3],
             error_msg="Failed to set position: couldn't find v_prev",
+            index=index,
         )
         return (
             [v_prev, v_actin_arp2, v_actin_arp3],
@@ -374,7 +474,7 @@ class ActinUtil:
         )
 
     @staticmethod
-    def set_end_vertex_position(topology, recipe, v_new, barbed):
+    def set_end_vertex_position(topology, recipe, v_new, barbed, index=None):
         """
         set the position of a new pointed or barbed vertex.
         """
@@ -386,18 +486,22 @@ class ActinUtil:
         )
         at_branch = False
         vertices.append(
-            ReaddyUtil.get_neighbor_of_type(topology, v_new, "actin", False)
+            ReaddyUtil.get_neighbor_of_type(
+                topology, v_new, "actin", False, index=index
+            )
         )
         if vertices[0] is None:
             (
                 vertices,
                 offset_vector,
-            ) = ActinUtil.get_branch_orientation_vertices_and_offset(topology, v_new)
+            ) = ActinUtil.get_branch_orientation_vertices_and_offset(
+                topology, v_new, index
+            )
             at_branch = True
         else:
             vertices.append(
                 ReaddyUtil.get_neighbor_of_type(
-                    topology, vertices[0], "actin", False, [v_new]
+                    topology, vertices[0], "actin", False, [v_new], index=index
                 )
             )
             if vertices[1] is None:
@@ -405,13 +509,18 @@ class ActinUtil:
                     vertices,
                     offset_vector,
                 ) = ActinUtil.get_branch_orientation_vertices_and_offset(
-                    topology, v_new
+                    topology, v_new, index
                 )
                 at_branch = True
             else:
                 vertices.append(
                     ReaddyUtil.get_neighbor_of_type(
-                        topology, vertices[1], "actin", False, [vertices[0]]
+                        topology,
+                        vertices[1],
+                        "actin",
+                        False,
+                        [vertices[0]],
+                        index=index,
                     )
                 )
                 if vertices[2] is None:
@@ -419,7 +528,7 @@ class ActinUtil:
                         vertices,
                         offset_vector,
                     ) = ActinUtil.get_branch_orientation_vertices_and_offset(
-                        topology, v_new
+                        topology, v_new, index
                     )
                     at_branch = True
         positions = []
@@ -460,19 +569,21 @@ class ActinUtil:
 
     @staticmethod
     def set_arp23_vertex_position(
-        topology, recipe, v_arp2, v_arp3, v_actin_arp2, v_actin_arp3
+        topology, recipe, v_arp2, v_arp3, v_actin_arp2, v_actin_arp3, index=None
     ):
         """
         set the position of new arp2/3 vertices.
         """
-        actin_types = (
-            ActinUtil.get_all_polymer_actin_types("actin")
-            + ActinUtil.get_all_polymer_actin_types("actin#ATP")
-            + ActinUtil.get_all_polymer_actin_types("actin#mid")
-            + ActinUtil.get_all_polymer_actin_types("actin#mid_ATP")
-            + ActinUtil.get_all_polymer_actin_types("actin#pointed")
-            + ActinUtil.get_all_polymer_actin_types("actin#pointed_ATP")
-            + ["actin#branch_1", "actin#branch_ATP_1"]
+        actin_types = ActinUtil.polymer_actin_type_set(
+            (
+                "actin",
+                "actin#ATP",
+                "actin#mid",
+                "actin#mid_ATP",
+                "actin#pointed",
+                "actin#pointed_ATP",
+            ),
+            ("actin#branch_1", "actin#branch_ATP_1"),
         )
         v1 = ReaddyUtil.get_neighbor_of_types(
             topology,
@@ -480,6 +591,7 @@ class ActinUtil:
             actin_types,
             [v_actin_arp3],
             error_msg="Failed to set position: couldn't find v1",
+            index=index,
         )
         pos1 = ReaddyUtil.get_vertex_position(topology, v1)
         pos2 = ReaddyUtil.get_vertex_position(topology, v_actin_arp2)
@@ -504,7 +616,7 @@ class ActinUtil:
         recipe.change_particle_position(v_arp3, pos_arp3)
 
     @staticmethod
-    def get_random_arp2(topology, with_ATP, with_branch):
+    def get_random_arp2(topology, with_ATP, with_branch, index=None):
         """
         get a random bound arp2 with the given arp3 nucleotide state
         and with or without a branch attached to the arp2.
@@ -515,13 +627,18 @@ class ActinUtil:
             True,
             parameters["verbose"],
             f"Couldn't find arp3 (ATP={with_ATP})",
+            index=index,
         )
         if len(v_arp3s) < 1:
             return None
         v_arp2s = []
         for v_arp3 in v_arp3s:
             v_arp2 = ReaddyUtil.get_neighbor_of_types(
-                topology, v_arp3, ["arp2#branched" if with_branch else "arp2"], []
+                topology,
+                v_arp3,
+                ["arp2#branched" if with_branch else "arp2"],
+                [],
+                index=index,
             )
             if v_arp2 is not None:
                 v_arp2s.append(v_arp2)
@@ -559,7 +676,7 @@ class ActinUtil:
         return False
 
     @staticmethod
-    def set_actin_mid_flag(topology, recipe, vertex, exclude_id=None):
+    def set_actin_mid_flag(topology, recipe, vertex, exclude_id=None, index=None):
         """
         if an actin near a reaction is a "mid" actin,
         add the "mid" flag, otherwise remove it.
@@ -576,10 +693,12 @@ class ActinUtil:
             not ActinUtil.check_arp3_attached_to_neighbors(
                 topology, vertex, 3, exclude_id
             )
-            and ReaddyUtil.get_neighbor_of_type(topology, vertex, "actin#branch", False)
+            and ReaddyUtil.get_neighbor_of_type(
+                topology, vertex, "actin#branch", False, index=index
+            )
             is None
             and ReaddyUtil.get_neighbor_of_type(
-                topology, vertex, "actin#pointed", False
+                topology, vertex, "actin#pointed", False, index=index
             )
             is None
         ):
@@ -588,7 +707,9 @@ class ActinUtil:
             ReaddyUtil.set_flags(topology, recipe, vertex, [""], ["mid"], True)
 
     @staticmethod
-    def get_actins_near_branch(topology, recipe, v_actin_arp2, v_actin_arp3):
+    def get_actins_near_branch(
+        topology, recipe, v_actin_arp2, v_actin_arp3, index=None
+    ):
         """
         get the 5 mother actins near a branch.
         """
@@ -604,7 +725,7 @@ class ActinUtil:
         if n_pointed == 1:
             pointed_types += ["actin#branch_1", "actin#branch_ATP_1"]
         v_actin_pointed = ReaddyUtil.get_neighbor_of_types(
-            topology, v_actin_arp2, pointed_types, []
+            topology, v_actin_arp2, pointed_types, [], index=index
         )
         n_barbed = ActinUtil.get_actin_number(topology, v_actin_arp3, 1)
         barbed_types = [
@@ -616,7 +737,7 @@ class ActinUtil:
             f"actin#barbed_{n_barbed}",
         ]
         v_actin_barbed1 = ReaddyUtil.get_neighbor_of_types(
-            topology, v_actin_arp3, barbed_types, [v_actin_pointed]
+            topology, v_actin_arp3, barbed_types, [v_actin_pointed], index=index
         )
         v_actin_barbed2 = None
         if v_actin_barbed1 is not None:
@@ -630,7 +751,7 @@ class ActinUtil:
                 f"actin#barbed_{n_barbed}",
             ]
             v_actin_barbed2 = ReaddyUtil.get_neighbor_of_types(
-                topology, v_actin_barbed1, barbed_types, [v_actin_arp3]
+                topology, v_actin_barbed1, barbed_types, [v_actin_arp3], index=index
             )
         return [
             v_actin_pointed,
@@ -641,12 +762,14 @@ class ActinUtil:
         ]
 
     @staticmethod
-    def set_actin_mid_flags_at_new_branch(topology, recipe, v_actin_arp2, v_actin_arp3):
+    def set_actin_mid_flags_at_new_branch(
+        topology, recipe, v_actin_arp2, v_actin_arp3, index=None
+    ):
         """
         Remove the "mid" flag on all the mother actins near a branch nucleation reaction.
         """
         v_branch_actins = ActinUtil.get_actins_near_branch(
-            topology, recipe, v_actin_arp2, v_actin_arp3
+            topology, recipe, v_actin_arp2, v_actin_arp3, index
         )
         for v_actin in v_branch_actins:
             if v_actin is not None:
@@ -654,18 +777,18 @@ class ActinUtil:
 
     @staticmethod
     def set_actin_mid_flags_at_removed_branch(
-        topology, recipe, v_actin_arp2, v_actin_arp3, v_arp3
+        topology, recipe, v_actin_arp2, v_actin_arp3, v_arp3, index=None
     ):
         """
         set the "mid" state on all the actins near a branch dissociation reaction.
         """
         v_branch_actins = ActinUtil.get_actins_near_branch(
-            topology, recipe, v_actin_arp2, v_actin_arp3
+            topology, recipe, v_actin_arp2, v_actin_arp3, index
         )
         arp3_id = topology.particle_id_of_vertex(v_arp3)
         for v_actin in v_branch_actins:
             if v_actin is not None:
-                ActinUtil.set_actin_mid_flag(topology, recipe, v_actin, arp3_id)
+                ActinUtil.set_actin_mid_flag(topology, recipe, v_actin, arp3_id, index)
 
     @staticmethod
     def add_random_linear_fibers(
@@ -740,28 +863,29 @@ class ActinUtil:
         topologies = []
         for topology_id in monomer_data["topologies"]:
             topology = monomer_data["topologies"][topology_id]
-            types = []
-            positions = []
-            for particle_id in topology["particle_ids"]:
-                particle = monomer_data["particles"][particle_id]
-                types.append(particle["type_name"])
-                positions.append(particle["position"])
+            particle_ids = topology["particle_ids"]
+            index_by_id = {
+                particle_id: index for index, particle_id in enumerate(particle_ids)
+            }
+            particles = [
+                monomer_data["particles"][particle_id] for particle_id in particle_ids
+            ]
             top = simulation.add_topology(
-                topology["type_name"], types, np.array(positions)
+                topology["type_name"],
+                [particle["type_name"] for particle in particles],
+                np.stack([particle["position"] for particle in particles]).astype(
+                    float
+                ),
             )
-            added_edges = []
-            for index, particle_id in enumerate(topology["particle_ids"]):
-                for neighbor_id in monomer_data["particles"][particle_id][
-                    "neighbor_ids"
-                ]:
-                    neighbor_index = topology["particle_ids"].index(neighbor_id)
-                    if (index, neighbor_index) not in added_edges and (
-                        neighbor_index,
-                        index,
-                    ) not in added_edges:
-                        top.get_graph().add_edge(index, neighbor_index)
-                        added_edges.append((index, neighbor_index))
-                        added_edges.append((neighbor_index, index))
+            graph = top.get_graph()
+            added_edges = set()
+            for index, particle in enumerate(particles):
+                for neighbor_id in particle["neighbor_ids"]:
+                    neighbor_index = index_by_id[neighbor_id]
+                    edge = (min(index, neighbor_index), max(index, neighbor_index))
+                    if edge not in added_edges:
+                        graph.add_edge(index, neighbor_index)
+                        added_edges.add(edge)
             topologies.append(top)
         return topologies
 
@@ -827,11 +951,12 @@ class ActinUtil:
         """
         add free actin.
         """
-        positions = ActinUtil.get_box_positions(n, "actin")
-        for p in range(len(positions)):
-            simulation.add_topology(
-                "Actin-Monomer-ATP", ["actin#free_ATP"], np.array([positions[p]])
-            )
+        ReaddyUtil.add_topologies(
+            simulation,
+            "Actin-Monomer-ATP",
+            ["actin#free_ATP"],
+            ActinUtil.get_box_positions(n, "actin"),
+        )
 
     @staticmethod
     def add_arp23_dimers(n, simulation):
@@ -839,27 +964,28 @@ class ActinUtil:
         add arp2/3 dimers.
         """
         positions = ActinUtil.get_box_positions(n, "arp")
-        for p in range(len(positions)):
-            top = simulation.add_topology(
-                "Arp23-Dimer-ATP",
-                ["arp2#free", "arp3#ATP"],
-                np.array(
-                    [
-                        positions[p],
-                        positions[p] + 4.0 * ReaddyUtil.get_random_unit_vector(),
-                    ]
-                ),
-            )
-            top.get_graph().add_edge(0, 1)
+        ReaddyUtil.add_topologies(
+            simulation,
+            "Arp23-Dimer-ATP",
+            ["arp2#free", "arp3#ATP"],
+            np.stack(
+                [
+                    positions,
+                    positions + 4.0 * ReaddyUtil.get_random_unit_vectors(n),
+                ],
+                axis=1,
+            ),
+            edges=[(0, 1)],
+        )
 
     @staticmethod
     def add_capping_protein(n, simulation):
         """
         add free capping protein.
         """
-        positions = ActinUtil.get_box_positions(n, "cap")
-        for p in range(len(positions)):
-            simulation.add_topology("Cap", ["cap"], np.array([positions[p]]))
+        ReaddyUtil.add_topologies(
+            simulation, "Cap", ["cap"], ActinUtil.get_box_positions(n, "cap")
+        )
 
     @staticmethod
     def reaction_function_reverse_dimerize(topology):
@@ -869,16 +995,22 @@ class ActinUtil:
         recipe = readdy.StructuralReactionRecipe(topology)
         if parameters["verbose"]:
             print("Reverse Dimerize")
-        actin_types = ActinUtil.get_all_polymer_actin_types(
-            "actin#barbed"
-        ) + ActinUtil.get_all_polymer_actin_types("actin#barbed_ATP")
+        index = TopologyIndex(topology)
+        actin_types = ActinUtil.polymer_actin_type_set(
+            ("actin#barbed", "actin#barbed_ATP")
+        )
         v_barbed = ReaddyUtil.get_first_vertex_of_types(
             topology,
             actin_types,
             error_msg="Failed to find barbed end of dimer",
+            index=index,
         )
         v_pointed = ReaddyUtil.get_first_neighbor(
-            topology, v_barbed, [], error_msg="Failed to find pointed end of dimer"
+            topology,
+            v_barbed,
+            [],
+            error_msg="Failed to find pointed end of dimer",
+            index=index,
         )
         pt_barbed = topology.particle_type_of_vertex(v_barbed)
         pt_pointed = topology.particle_type_of_vertex(v_pointed)
@@ -900,18 +1032,21 @@ class ActinUtil:
         recipe = readdy.StructuralReactionRecipe(topology)
         if parameters["verbose"]:
             print("Trimerize")
-        v_new = ActinUtil.get_new_vertex(topology)
+        index = TopologyIndex(topology)
+        v_new = ActinUtil.get_new_vertex(topology, index)
         v_neighbor1 = ReaddyUtil.get_first_neighbor(
             topology,
             v_new,
             [],
             error_msg="Failed to find first neighbor of new vertex in trimer",
+            index=index,
         )
         v_neighbor2 = ReaddyUtil.get_first_neighbor(
             topology,
             v_neighbor1,
             [v_new],
             error_msg="Failed to find second neighbor of new vertex in trimer",
+            index=index,
         )
         ReaddyUtil.set_flags(
             topology,
@@ -935,19 +1070,22 @@ class ActinUtil:
         recipe = readdy.StructuralReactionRecipe(topology)
         if parameters["verbose"]:
             print("Reverse Trimerize")
-        actin_types = ActinUtil.get_all_polymer_actin_types(
-            "actin#barbed"
-        ) + ActinUtil.get_all_polymer_actin_types("actin#barbed_ATP")
+        index = TopologyIndex(topology)
+        actin_types = ActinUtil.polymer_actin_type_set(
+            ("actin#barbed", "actin#barbed_ATP")
+        )
         v_barbed = ReaddyUtil.get_first_vertex_of_types(
             topology,
             actin_types,
             error_msg="Failed to find barbed end in trimer",
+            index=index,
         )
         v_neighbor = ReaddyUtil.get_first_neighbor(
             topology,
             v_barbed,
             [],
             error_msg="Failed to find neighbor of barbed end in trimer",
+            index=index,
         )
         recipe.remove_edge(v_barbed, v_neighbor)
         recipe.change_particle_type(v_barbed, "actin#free_ATP")
@@ -964,18 +1102,24 @@ class ActinUtil:
         end_type = "barbed" if barbed else "pointed"
         if parameters["verbose"]:
             print("Grow " + end_type)
-        v_new = ActinUtil.get_new_vertex(topology)
+        index = TopologyIndex(topology)
+        v_new = ActinUtil.get_new_vertex(topology, index)
         v_neighbor = ReaddyUtil.get_first_neighbor(
             topology,
             v_new,
             [],
             error_msg=f"Failed to find neighbor of new {end_type} end",
+            index=index,
         )
         if not barbed:
-            v_neighbor_neighbor = ActinUtil.get_next_actin(topology, v_neighbor, 1)
+            v_neighbor_neighbor = ActinUtil.get_next_actin(
+                topology, v_neighbor, 1, index=index
+            )
             if v_neighbor_neighbor is not None:
                 # previous neighbor of pointed end probably needs "mid" added
-                ActinUtil.set_actin_mid_flag(topology, recipe, v_neighbor_neighbor)
+                ActinUtil.set_actin_mid_flag(
+                    topology, recipe, v_neighbor_neighbor, index=index
+                )
         ReaddyUtil.set_flags(
             topology,
             recipe,
@@ -996,8 +1140,8 @@ class ActinUtil:
             ReaddyUtil.set_flags(topology, recipe, v_neighbor, [""], ["mid"], True)
         else:
             # neighbor of barbed end could be "mid"
-            ActinUtil.set_actin_mid_flag(topology, recipe, v_neighbor)
-        ActinUtil.set_end_vertex_position(topology, recipe, v_new, barbed)
+            ActinUtil.set_actin_mid_flag(topology, recipe, v_neighbor, index=index)
+        ActinUtil.set_end_vertex_position(topology, recipe, v_new, barbed, index)
         recipe.change_topology_type("Actin-Polymer")
         return recipe
 
@@ -1024,18 +1168,23 @@ class ActinUtil:
         recipe = readdy.StructuralReactionRecipe(topology)
         if parameters["verbose"]:
             print("Bind Arp2/3")
-        v_arp2, v_arp3 = ActinUtil.get_new_arp23(topology)
+        index = TopologyIndex(topology)
+        v_arp2, v_arp3 = ActinUtil.get_new_arp23(topology, index)
         if v_arp2 is None or v_arp3 is None:
             raise Exception(
                 f"Failed to find new arp2 and arp3\n"
                 f"{ReaddyUtil.topology_to_string(topology)}"
             )
         v_actin_arp3 = ReaddyUtil.get_first_neighbor(
-            topology, v_arp3, [v_arp2], error_msg="Failed to find new actin_arp3"
+            topology,
+            v_arp3,
+            [v_arp2],
+            error_msg="Failed to find new actin_arp3",
+            index=index,
         )
         # make sure arp2 binds to the pointed end neighbor of the actin bound to arp3
         v_actin_arp2 = ActinUtil.get_next_actin(
-            topology, v_actin_arp3, -1, error_if_not_found=True
+            topology, v_actin_arp3, -1, error_if_not_found=True, index=index
         )
         actin_arp2_type = topology.particle_type_of_vertex(v_actin_arp2)
         if "pointed" in actin_arp2_type or "branch" in actin_arp2_type:
@@ -1045,12 +1194,12 @@ class ActinUtil:
         ReaddyUtil.set_flags(topology, recipe, v_arp2, [], ["free"], True)
         ReaddyUtil.set_flags(topology, recipe, v_arp3, [], ["new"], True)
         ActinUtil.set_actin_mid_flags_at_new_branch(
-            topology, recipe, v_actin_arp2, v_actin_arp3
+            topology, recipe, v_actin_arp2, v_actin_arp3, index
         )
         recipe.add_edge(v_actin_arp2, v_arp2)
         recipe.change_topology_type("Actin-Polymer")
         ActinUtil.set_arp23_vertex_position(
-            topology, recipe, v_arp2, v_arp3, v_actin_arp2, v_actin_arp3
+            topology, recipe, v_arp2, v_arp3, v_actin_arp2, v_actin_arp3, index
         )
         return recipe
 
@@ -1062,12 +1211,13 @@ class ActinUtil:
         recipe = readdy.StructuralReactionRecipe(topology)
         if parameters["verbose"]:
             print("Start Branch")
-        v_new = ActinUtil.get_new_vertex(topology)
+        index = TopologyIndex(topology)
+        v_new = ActinUtil.get_new_vertex(topology, index)
         ReaddyUtil.set_flags(
             topology, recipe, v_new, ["barbed", "1", "branch"], ["new"], True
         )
         recipe.change_topology_type("Actin-Polymer")
-        ActinUtil.set_end_vertex_position(topology, recipe, v_new, True)
+        ActinUtil.set_end_vertex_position(topology, recipe, v_new, True, index)
         return recipe
 
     @staticmethod
@@ -1083,11 +1233,13 @@ class ActinUtil:
         end_flag = end_state.lower()
         atp_flag = "_ATP" if atp else ""
         end_type = f"actin#{end_flag}{atp_flag}"
+        index = TopologyIndex(topology)
         v_end = ReaddyUtil.get_random_vertex_of_types(
             topology,
-            ActinUtil.get_all_polymer_actin_types(end_type),
+            ActinUtil.polymer_actin_types((end_type,)),
             parameters["verbose"],
             "Couldn't find end actin to remove",
+            index=index,
         )
         if v_end is None:
             return recipe
@@ -1098,20 +1250,21 @@ class ActinUtil:
             [],
             parameters["verbose"],
             "Couldn't remove actin because a branch was attached",
+            index=index,
         )
         if v_arp is not None:
             return recipe
         v_neighbor = ReaddyUtil.get_neighbor_of_types(
             topology,
             v_end,
-            ActinUtil.get_all_polymer_actin_types("actin")
-            + ActinUtil.get_all_polymer_actin_types("actin#ATP")
-            + ActinUtil.get_all_polymer_actin_types("actin#mid")
-            + ActinUtil.get_all_polymer_actin_types("actin#mid_ATP")
-            + ["actin#branch_1", "actin#branch_ATP_1"],
+            ActinUtil.polymer_actin_type_set(
+                ("actin", "actin#ATP", "actin#mid", "actin#mid_ATP"),
+                ("actin#branch_1", "actin#branch_ATP_1"),
+            ),
             [],
             parameters["verbose"],
             "Couldn't find plain actin neighbor of actin to remove",
+            index=index,
         )
         if v_neighbor is None:
             return recipe
@@ -1124,10 +1277,13 @@ class ActinUtil:
                 parameters["verbose"],
                 "Couldn't remove actin because a branch "
                 "was attached to its barbed neighbor",
+                index=index,
             )
             if v_arp2 is not None:
                 return recipe
-            v_neighbor_neighbor = ActinUtil.get_next_actin(topology, v_neighbor, 1)
+            v_neighbor_neighbor = ActinUtil.get_next_actin(
+                topology, v_neighbor, 1, index=index
+            )
             if v_neighbor_neighbor is not None:
                 ReaddyUtil.set_flags(
                     topology,
@@ -1188,9 +1344,10 @@ class ActinUtil:
         recipe = readdy.StructuralReactionRecipe(topology)
         if parameters["verbose"]:
             print("Cleanup Shrink")
+        index = TopologyIndex(topology)
         new_type = ""
-        if len(topology.graph.get_vertices()) < 2:
-            v_cap = ReaddyUtil.get_vertex_of_type(topology, "cap", True)
+        if len(index.vertices) < 2:
+            v_cap = ReaddyUtil.get_vertex_of_type(topology, "cap", True, index=index)
             if v_cap is not None:
                 new_type = "Cap"
             else:
@@ -1199,23 +1356,27 @@ class ActinUtil:
                     "actin",
                     False,
                     error_msg="Failed to find actin to set monomer's ATP state",
+                    index=index,
                 )
                 pt_actin = topology.particle_type_of_vertex(v_actin)
                 new_type = "Actin-Monomer" + ("-ATP" if "ATP" in pt_actin else "")
-        elif len(topology.graph.get_vertices()) < 3:
-            v_arp2 = ReaddyUtil.get_vertex_of_type(topology, "arp2#free", True)
+        elif len(index.vertices) < 3:
+            v_arp2 = ReaddyUtil.get_vertex_of_type(
+                topology, "arp2#free", True, index=index
+            )
             if v_arp2 is not None:
                 v_arp3 = ReaddyUtil.get_vertex_of_type(
                     topology,
                     "arp3",
                     False,
                     error_msg="Failed to find arp3 to set arp2/3's ATP state",
+                    index=index,
                 )
                 pt_arp3 = topology.particle_type_of_vertex(v_arp3)
                 new_type = "Arp23-Dimer" + ("-ATP" if "ATP" in pt_arp3 else "")
             else:
                 new_type = "Actin-Dimer"
-        elif len(topology.graph.get_vertices()) < 4:
+        elif len(index.vertices) < 4:
             new_type = "Actin-Trimer"
         else:
             new_type = "Actin-Polymer"
@@ -1232,15 +1393,16 @@ class ActinUtil:
         recipe = readdy.StructuralReactionRecipe(topology)
         if parameters["verbose"]:
             print("Hydrolyze Actin")
+        index = TopologyIndex(topology)
         v_actin = ReaddyUtil.get_random_vertex_of_types(
             topology,
-            ActinUtil.get_all_polymer_actin_types("actin#ATP")
-            + ActinUtil.get_all_polymer_actin_types("actin#pointed_ATP")
-            + ActinUtil.get_all_polymer_actin_types("actin#mid_ATP")
-            + ActinUtil.get_all_polymer_actin_types("actin#barbed_ATP")
-            + ["actin#branch_barbed_ATP_1", "actin#branch_ATP_1"],
+            ActinUtil.polymer_actin_types(
+                ("actin#ATP", "actin#pointed_ATP", "actin#mid_ATP", "actin#barbed_ATP"),
+                ("actin#branch_barbed_ATP_1", "actin#branch_ATP_1"),
+            ),
             parameters["verbose"],
             "Couldn't find ATP-actin",
+            index=index,
         )
         if v_actin is None:
             return recipe
@@ -1255,8 +1417,13 @@ class ActinUtil:
         recipe = readdy.StructuralReactionRecipe(topology)
         if parameters["verbose"]:
             print("Hydrolyze Arp2/3")
+        index = TopologyIndex(topology)
         v_arp3 = ReaddyUtil.get_random_vertex_of_types(
-            topology, ["arp3#ATP"], parameters["verbose"], "Couldn't find ATP-arp3"
+            topology,
+            ["arp3#ATP"],
+            parameters["verbose"],
+            "Couldn't find ATP-arp3",
+            index=index,
         )
         if v_arp3 is None:
             return recipe
@@ -1271,12 +1438,14 @@ class ActinUtil:
         recipe = readdy.StructuralReactionRecipe(topology)
         if parameters["verbose"]:
             print("Nucleotide Exchange Actin")
+        index = TopologyIndex(topology)
         v_actin = ReaddyUtil.get_vertex_of_type(
             topology,
             "actin#free",
             True,
             parameters["verbose"],
             "Couldn't find ADP-actin",
+            index=index,
         )
         if v_actin is None:
             return recipe
@@ -1291,8 +1460,14 @@ class ActinUtil:
         recipe = readdy.StructuralReactionRecipe(topology)
         if parameters["verbose"]:
             print("Nucleotide Exchange Arp2/3")
+        index = TopologyIndex(topology)
         v_arp3 = ReaddyUtil.get_vertex_of_type(
-            topology, "arp3", True, parameters["verbose"], "Couldn't find ADP-arp3"
+            topology,
+            "arp3",
+            True,
+            parameters["verbose"],
+            "Couldn't find ADP-arp3",
+            index=index,
         )
         if v_arp3 is None:
             return recipe
@@ -1308,33 +1483,51 @@ class ActinUtil:
         state = "ATP" if with_ATP else "ADP"
         if parameters["verbose"]:
             print(f"Remove Arp2/3 {state}")
-        v_arp2 = ActinUtil.get_random_arp2(topology, with_ATP, False)
+        index = TopologyIndex(topology)
+        v_arp2 = ActinUtil.get_random_arp2(topology, with_ATP, False, index)
         if v_arp2 is None:
             return recipe
-        actin_types = (
-            ActinUtil.get_all_polymer_actin_types("actin")
-            + ActinUtil.get_all_polymer_actin_types("actin#ATP")
-            + ActinUtil.get_all_polymer_actin_types("actin#pointed")
-            + ActinUtil.get_all_polymer_actin_types("actin#pointed_ATP")
-            + ActinUtil.get_all_polymer_actin_types("actin#mid")
-            + ActinUtil.get_all_polymer_actin_types("actin#mid_ATP")
-            + ActinUtil.get_all_polymer_actin_types("actin#barbed")
-            + ActinUtil.get_all_polymer_actin_types("actin#barbed_ATP")
-            + ["actin#branch_1", "actin#branch_ATP_1"]
+        actin_types = ActinUtil.polymer_actin_type_set(
+            (
+                "actin",
+                "actin#ATP",
+                "actin#pointed",
+                "actin#pointed_ATP",
+                "actin#mid",
+                "actin#mid_ATP",
+                "actin#barbed",
+                "actin#barbed_ATP",
+            ),
+            ("actin#branch_1", "actin#branch_ATP_1"),
         )
         v_actin_arp2 = ReaddyUtil.get_neighbor_of_types(
-            topology, v_arp2, actin_types, [], error_msg="Failed to find actin_arp2"
+            topology,
+            v_arp2,
+            actin_types,
+            [],
+            error_msg="Failed to find actin_arp2",
+            index=index,
         )
         v_arp3 = ReaddyUtil.get_neighbor_of_types(
-            topology, v_arp2, ["arp3", "arp3#ATP"], [], error_msg="Failed to find arp3"
+            topology,
+            v_arp2,
+            ["arp3", "arp3#ATP"],
+            [],
+            error_msg="Failed to find arp3",
+            index=index,
         )
         v_actin_arp3 = ReaddyUtil.get_neighbor_of_types(
-            topology, v_arp3, actin_types, [], error_msg="Failed to find actin_arp3"
+            topology,
+            v_arp3,
+            actin_types,
+            [],
+            error_msg="Failed to find actin_arp3",
+            index=index,
         )
         recipe.remove_edge(v_arp2, v_actin_arp2)
         recipe.remove_edge(v_arp3, v_actin_arp3)
         ActinUtil.set_actin_mid_flags_at_removed_branch(
-            topology, recipe, v_actin_arp2, v_actin_arp3, v_arp3
+            topology, recipe, v_actin_arp2, v_actin_arp3, v_arp3, index
         )
         ReaddyUtil.set_flags(topology, recipe, v_arp2, ["free"], [])
         recipe.change_topology_type("Actin-Polymer#Shrinking")
@@ -1363,7 +1556,8 @@ class ActinUtil:
         state = "ATP" if with_ATP else "ADP"
         if parameters["verbose"]:
             print(f"Debranching {state}")
-        v_arp2 = ActinUtil.get_random_arp2(topology, with_ATP, True)
+        index = TopologyIndex(topology)
+        v_arp2 = ActinUtil.get_random_arp2(topology, with_ATP, True, index)
         if v_arp2 is None:
             return recipe
         actin_types = [
@@ -1378,6 +1572,7 @@ class ActinUtil:
             actin_types,
             [],
             error_msg="Failed to find first branch actin",
+            index=index,
         )
         recipe.remove_edge(v_arp2, v_actin1)
         ReaddyUtil.set_flags(topology, recipe, v_arp2, [], ["branched"], True)
@@ -1416,7 +1611,8 @@ class ActinUtil:
         recipe = readdy.StructuralReactionRecipe(topology)
         if parameters["verbose"]:
             print("Finish Cap Bind")
-        v_new = ActinUtil.get_new_vertex(topology)
+        index = TopologyIndex(topology)
+        v_new = ActinUtil.get_new_vertex(topology, index)
         ReaddyUtil.set_flags(topology, recipe, v_new, ["bound"], ["new"], True)
         recipe.change_topology_type("Actin-Polymer")
         return recipe
@@ -1429,21 +1625,26 @@ class ActinUtil:
         recipe = readdy.StructuralReactionRecipe(topology)
         if parameters["verbose"]:
             print("Remove Cap")
+        index = TopologyIndex(topology)
         v_cap = ReaddyUtil.get_random_vertex_of_types(
-            topology, ["cap#bound"], parameters["verbose"], "Couldn't find cap"
+            topology,
+            ["cap#bound"],
+            parameters["verbose"],
+            "Couldn't find cap",
+            index=index,
         )
         if v_cap is None:
             return recipe
         v_actin = ReaddyUtil.get_neighbor_of_types(
             topology,
             v_cap,
-            ActinUtil.get_all_polymer_actin_types("actin")
-            + ActinUtil.get_all_polymer_actin_types("actin#ATP")
-            + ActinUtil.get_all_polymer_actin_types("actin#mid")
-            + ActinUtil.get_all_polymer_actin_types("actin#mid_ATP")
-            + ["actin#branch_1", "actin#branch_ATP_1"],
+            ActinUtil.polymer_actin_type_set(
+                ("actin", "actin#ATP", "actin#mid", "actin#mid_ATP"),
+                ("actin#branch_1", "actin#branch_ATP_1"),
+            ),
             [],
             error_msg="Failed to find actin bound to cap",
+            index=index,
         )
         recipe.remove_edge(v_cap, v_actin)
         ReaddyUtil.set_flags(topology, recipe, v_cap, [], ["bound"], True)
@@ -1463,6 +1664,7 @@ class ActinUtil:
             return recipe
         if parameters["verbose"]:
             print("Translate particles")
+        index = TopologyIndex(topology)
         for vertex_id in displacements:
             if vertex_id == "displace_stride":
                 continue
@@ -1470,6 +1672,7 @@ class ActinUtil:
                 topology,
                 vertex_id,
                 error_msg=f"Couldn't find particle {vertex_id} to displace",
+                index=index,
             )
             vertex_pos = ReaddyUtil.get_vertex_position(topology, v)
             new_pos = displacements[vertex_id]["get_translation"](
@@ -1516,6 +1719,19 @@ class ActinUtil:
 
                                             + end
         """
+        return list(
+            TypeCatalogue.ordered(
+                "actin_particle_types",
+                ActinUtil.n_polymer_numbers(),
+                ActinUtil._actin_particle_types,
+            )
+        )
+
+    @staticmethod
+    def _actin_particle_types():
+        """
+        build the list of types for get_all_actin_particle_types.
+        """
         result = [
             "actin#free",
             "actin#free_ATP",
@@ -1537,7 +1753,6 @@ class ActinUtil:
                 f"actin#barbed_{i}",
                 f"actin#barbed_ATP_{i}",
             ]
-
         return result
 
     @staticmethod
@@ -1545,6 +1760,19 @@ class ActinUtil:
         """
         get particle types for actins that don't diffuse.
         """
+        return list(
+            TypeCatalogue.ordered(
+                "fixed_actin_particle_types",
+                ActinUtil.n_polymer_numbers(),
+                ActinUtil._fixed_actin_particle_types,
+            )
+        )
+
+    @staticmethod
+    def _fixed_actin_particle_types():
+        """
+        build the list of types for get_all_fixed_actin_particle_types.
+        """
         result = []
         for i in ActinUtil.polymer_number_range():
             result += [
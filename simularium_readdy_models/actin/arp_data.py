@@ -94,7 +94,7 @@ class ArpData:
             v_mother, v_actin_arp2
         )
         return np.matmul(
-            current_orientation, np.linalg.inv(ActinStructure.bound_arp_orientation())
+            current_orientation, ActinStructure.inverse_bound_arp_orientation()
         )
 
     def get_bound_monomer_position(self, actin_arp2_pos, mother_fiber, monomer_type):
@@ -123,7 +123,7 @@ class ArpData:
         )
         return np.matmul(
             current_orientation,
-            np.linalg.inv(ActinStructure.nucleated_arp_orientation()),
+            ActinStructure.inverse_nucleated_arp_orientation(),
         )
 
     def get_local_nucleated_monomer_position(self, v_mother, v_daughter, monomer_type):
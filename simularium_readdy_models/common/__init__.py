@@ -1,5 +1,11 @@
 #!/usr/bin/env python
 
+from .frame_cache import FrameCache  # noqa: F401
+from .frame_data import FrameData  # noqa: F401
 from .particle_data import ParticleData  # noqa: F401
+from .particle_type_registry import ParticleTypeInfo, ParticleTypeRegistry  # noqa: F401
 from .readdy_util import ReaddyUtil  # noqa: F401
 from .repeated_timer import RepeatedTimer  # noqa: F401
+from .system_spec import SystemSpec  # noqa: F401
+from .topology_index import TopologyIndex  # noqa: F401
+from .type_catalogue import TypeCatalogue  # noqa: F401
@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from shutil import rmtree
+
+import numpy as np
+import pandas as pd
+
+from .frame_data import FrameData
+
+
+class FrameCache(Sequence):
+    """
+    On-disk cache of shaped frames in a columnar binary layout.
+
+    The cache is a directory of .npy arrays holding every frame's
+    FrameData concatenated, with per-frame offsets, plus a meta.json
+    with the format version and the key it was built for
+    (source file fingerprint, stride, timestep and reaction mapping).
+
+    Arrays are opened memory-mapped, so opening a cache is near-instant
+    and frames are read from disk only when they are indexed.
+    """
+
+    VERSION = 2
+    BLOCK_SIZE = 1 << 20
+
+    def __init__(self, cache_path):
+        with open(os.path.join(cache_path, "meta.json")) as f:
+            self.meta = json.load(f)
+        self.cache_path = cache_path
+        self.type_names = self.meta["type_names"]
+        self.topology_type_names = self.meta["topology_type_names"]
+        self.time_inc_s = self.meta["time_inc_s"]
+        self.times = self._load("times")
+        self.frame_offsets = self._load("frame_offsets")
+        self.ids = self._load("ids")
+        self.type_codes = self._load("type_codes")
+        self.positions = self._load("positions")
+        self.neighbor_offsets = self._load("neighbor_offsets")
+        self.neighbor_rows = self._load("neighbor_rows")
+        self.frame_topology_offsets = self._load("frame_topology_offsets")
+        self.topology_type_codes = self._load("topology_type_codes")
+        self.topology_offsets = self._load("topology_offsets")
+        self.topology_particle_ids = self._load("topology_particle_ids")
+        self.reactions = None
+        if self.meta["reaction_columns"] is not None:
+            records = self._load("reactions")
+            self.reactions = pd.DataFrame(
+                {
+                    index: np.array(records[name])
+                    for index, name in enumerate(records.dtype.names)
+                }
+            )
+            self.reactions.columns = self.meta["reaction_columns"]
+
+    def _load(self, name):
+        return np.load(os.path.join(self.cache_path, name + ".npy"), mmap_mode="r")
+
+    def __len__(self):
+        return self.frame_offsets.shape[0] - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        p0, p1 = self.frame_offsets[index : index + 2]
+        n0 = self.neighbor_offsets[p0]
+        n1 = self.neighbor_offsets[p1]
+        t0, t1 = self.frame_topology_offsets[index : index + 2]
+        tp0 = self.topology_offsets[t0]
+        tp1 = self.topology_offsets[t1]
+        return FrameData(
+            self.ids[p0:p1],
+            self.type_codes[p0:p1],
+            self.type_names,
+            self.positions[p0:p1],
+            self.neighbor_offsets[p0 : p1 + 1] - n0,
+            self.neighbor_rows[n0:n1],
+            self.topology_type_codes[t0:t1],
+            self.topology_type_names,
+            self.topology_offsets[t0 : t1 + 1] - tp0,
+            self.topology_particle_ids[tp0:tp1],
+        )
+
+    @staticmethod
+    def default_path(h5_file_path):
+        """
+        get the default cache directory for a ReaDDy .h5 file.
+        """
+        return h5_file_path + ".cache"
+
+    @staticmethod
+    def source_fingerprint(file_path):
+        """
+        get a fingerprint of a file from its size, modification time,
+        and a hash of its first and last blocks,
+        which is cheap to compute even for very large trajectories.
+        """
+        stat = os.stat(file_path)
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, "rb") as f:
+            digest.update(f.read(FrameCache.BLOCK_SIZE))
+            if stat.st_size > FrameCache.BLOCK_SIZE:
+                f.seek(max(stat.st_size - FrameCache.BLOCK_SIZE, FrameCache.BLOCK_SIZE))
+                digest.update(f.read(FrameCache.BLOCK_SIZE))
+        return f"{stat.st_size}-{stat.st_mtime_ns}-{digest.hexdigest()}"
+
+    @staticmethod
+    def key(h5_file_path, stride, timestep, reaction_names):
+        """
+        get the key that a cache must match to be reused.
+        """
+        reactions_hash = hashlib.blake2b(
+            json.dumps(reaction_names, sort_keys=True).encode(), digest_size=16
+        ).hexdigest()
+        return {
+            "version": FrameCache.VERSION,
+            "source": FrameCache.source_fingerprint(h5_file_path),
+            "stride": int(stride),
+            "timestep": float(timestep),
+            "reactions": reactions_hash,
+        }
+
+    @staticmethod
+    def open(cache_path, key):
+        """
+        open a cache if it exists, is complete
+        and was built for the given key, otherwise return None.
+        """
+        meta_path = os.path.join(cache_path, "meta.json")
+        if not os.path.isfile(meta_path):
+            return None
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            print("Shaped data cache is unreadable, ignoring it")
+            return None
+        if meta.get("key") != key:
+            print("Shaped data cache is out of date, ignoring it")
+            return None
+        try:
+            return FrameCache(cache_path)
+        except (OSError, ValueError, KeyError):
+            print("Shaped data cache is incomplete, ignoring it")
+            return None
+
+    @staticmethod
+    def _global_codes(local_codes, local_names, table):
+        """
+        map codes into a frame's name table to codes into a shared table.
+        """
+        lookup = np.array(
+            [table.setdefault(name, len(table)) for name in local_names],
+            dtype=np.int32,
+        )
+        return lookup[local_codes] if len(lookup) > 0 else local_codes
+
+    @staticmethod
+    def write(cache_path, key, monomer_data, times, reactions=None, time_inc_s=None):
+        """
+        write shaped frames (FrameData or dictionary monomer data)
+        to a cache directory, replacing any existing cache there.
+        """
+        frames = [
+            (
+                frame
+                if isinstance(frame, FrameData)
+                else FrameData.from_monomer_data(frame)
+            )
+            for frame in monomer_data
+        ]
+        type_table = {}
+        topology_type_table = {}
+        frame_offsets = np.zeros(len(frames) + 1, dtype=np.int64)
+        frame_topology_offsets = np.zeros(len(frames) + 1, dtype=np.int64)
+        neighbor_counts = []
+        topology_counts = []
+        for index, frame in enumerate(frames):
+            frame_offsets[index + 1] = frame_offsets[index] + len(frame)
+            frame_topology_offsets[index + 1] = frame_topology_offsets[index] + len(
+                frame.topology_type_codes
+            )
+            neighbor_counts.append(np.diff(frame.neighbor_offsets))
+            topology_counts.append(np.diff(frame.topology_offsets))
+        arrays = {
+            "times": np.asarray(times, dtype=float),
+            "frame_offsets": frame_offsets,
+            "ids": FrameCache._concatenate([f.ids for f in frames], np.int64),
+            "type_codes": FrameCache._concatenate(
+                [
+                    FrameCache._global_codes(f.type_codes, f.type_names, type_table)
+                    for f in frames
+                ],
+                np.int32,
+            ),
+            "positions": FrameCache._concatenate(
+                [f.positions for f in frames], float
+            ).reshape(-1, 3),
+            "neighbor_offsets": FrameCache._offsets(neighbor_counts),
+            "neighbor_rows": FrameCache._concatenate(
+                [f.neighbor_rows for f in frames], np.int64
+            ),
+            "frame_topology_offsets": frame_topology_offsets,
+            "topology_type_codes": FrameCache._concatenate(
+                [
+                    FrameCache._global_codes(
+                        f.topology_type_codes,
+                        f.topology_type_names,
+                        topology_type_table,
+                    )
+                    for f in frames
+                ],
+                np.int32,
+            ),
+            "topology_offsets": FrameCache._offsets(topology_counts),
+            "topology_particle_ids": FrameCache._concatenate(
+                [f.topology_particle_ids for f in frames], np.int64
+            ),
+        }
+        if reactions is not None:
+            # one record field per column, so each column keeps its dtype
+            arrays["reactions"] = np.rec.fromarrays(
+                [
+                    reactions.iloc[:, index].to_numpy()
+                    for index in range(reactions.shape[1])
+                ],
+                names=[f"c{index}" for index in range(reactions.shape[1])],
+            )
+        meta = {
+            "key": key,
+            "n_frames": len(frames),
+            "type_names": list(type_table.keys()),
+            "topology_type_names": list(topology_type_table.keys()),
+            "reaction_columns": (
+                [str(c) for c in reactions.columns] if reactions is not None else None
+            ),
+            "time_inc_s": None if time_inc_s is None else float(time_inc_s),
+        }
+        if os.path.exists(cache_path) and not os.path.isdir(cache_path):
+            raise Exception(f"{cache_path} exists and is not a shaped data cache")
+        tmp_path = cache_path + ".tmp"
+        if os.path.exists(tmp_path):
+            rmtree(tmp_path)
+        os.makedirs(tmp_path)
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp_path, name + ".npy"), array)
+        # meta.json is written last, so an interrupted write is never reused
+        with open(os.path.join(tmp_path, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        if os.path.exists(cache_path):
+            rmtree(cache_path)
+        os.rename(tmp_path, cache_path)
+
+    @staticmethod
+    def _concatenate(arrays, dtype):
+        """
+        concatenate a list of arrays, which may be empty.
+        """
+        if len(arrays) == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.concatenate([np.asarray(a, dtype=dtype) for a in arrays])
+
+    @staticmethod
+    def _offsets(counts):
+        """
+        get global CSR offsets from a list of per-frame counts.
+        """
+        counts = FrameCache._concatenate(counts, np.int64)
+        offsets = np.zeros(counts.shape[0] + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return offsets
@@ -0,0 +1,337 @@
+#!/usr/bin/env python
+
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class FrameData:
+    """
+    Columnar (struct-of-arrays) monomer data for one frame.
+
+    Particles are stored in contiguous arrays indexed by row:
+      ids : (N,) particle ids
+      type_codes : (N,) index into type_names for each particle
+      positions : (N, 3) particle positions
+      neighbor_offsets : (N + 1,) CSR offsets into neighbor_rows
+      neighbor_rows : (2E,) rows of each particle's neighbors
+
+    Topologies are stored the same way:
+      topology_type_codes : (T,) index into topology_type_names
+      topology_offsets : (T + 1,) CSR offsets into topology_particle_ids
+      topology_particle_ids : particle ids for each topology
+
+    frame["topologies"] and frame["particles"] give read-only views
+    with the same layout as the dictionary monomer data, so analysis
+    written for the dictionary format works on a FrameData unchanged.
+    """
+
+    def __init__(
+        self,
+        ids,
+        type_codes,
+        type_names,
+        positions,
+        neighbor_offsets,
+        neighbor_rows,
+        topology_type_codes=None,
+        topology_type_names=None,
+        topology_offsets=None,
+        topology_particle_ids=None,
+    ):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.type_codes = np.asarray(type_codes, dtype=np.int32)
+        self.type_names = list(type_names)
+        self.positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        self.neighbor_offsets = np.asarray(neighbor_offsets, dtype=np.int64)
+        self.neighbor_rows = np.asarray(neighbor_rows, dtype=np.int64)
+        self.topology_type_codes = np.asarray(
+            topology_type_codes if topology_type_codes is not None else [],
+            dtype=np.int32,
+        )
+        self.topology_type_names = list(
+            topology_type_names if topology_type_names is not None else []
+        )
+        self.topology_offsets = np.asarray(
+            topology_offsets if topology_offsets is not None else [0],
+            dtype=np.int64,
+        )
+        self.topology_particle_ids = np.asarray(
+            topology_particle_ids if topology_particle_ids is not None else [],
+            dtype=np.int64,
+        )
+        self._rows_by_id = None
+        self._type_codes_by_name = None
+
+    @staticmethod
+    def _neighbor_csr(rows1, rows2, n_particles):
+        """
+        build CSR neighbor arrays from edges given as pairs of rows,
+        listing each particle's neighbors in the same order as the edges.
+        """
+        rows1 = np.asarray(rows1, dtype=np.int64)
+        rows2 = np.asarray(rows2, dtype=np.int64)
+        # interleave both directions of each edge to keep edge order per particle
+        sources = np.stack([rows1, rows2], axis=1).ravel()
+        targets = np.stack([rows2, rows1], axis=1).ravel()
+        keep = np.ones(sources.shape[0], dtype=bool)
+        keep[1::2] = rows1 != rows2  # self edges are only listed once
+        sources = sources[keep]
+        targets = targets[keep]
+        order = np.argsort(sources, kind="stable")
+        counts = np.bincount(sources, minlength=n_particles)
+        offsets = np.zeros(n_particles + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return offsets, targets[order]
+
+    @staticmethod
+    def _encode(names):
+        """
+        get a table of unique names and the code for each name.
+        """
+        table = {}
+        codes = np.empty(len(names), dtype=np.int32)
+        for index, name in enumerate(names):
+            codes[index] = table.setdefault(name, len(table))
+        return list(table.keys()), codes
+
+    @staticmethod
+    def _topology_arrays(topology_type_names, topology_particle_ids):
+        """
+        get columnar arrays for a list of topologies.
+        """
+        names, codes = FrameData._encode(topology_type_names)
+        lengths = [len(particle_ids) for particle_ids in topology_particle_ids]
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        particle_ids = (
+            np.concatenate(
+                [np.asarray(p, dtype=np.int64) for p in topology_particle_ids]
+            )
+            if len(topology_particle_ids) > 0
+            else np.zeros(0, dtype=np.int64)
+        )
+        return codes, names, offsets, particle_ids
+
+    @staticmethod
+    def from_records(time_index, topology_records, ids, types, positions, traj):
+        """
+        After a simulation has finished,
+        get columnar data for topologies of particles.
+
+        traj from readdy.Trajectory(h5_file_path)
+        topology_records from traj.read_observable_topologies()
+        ids, types, positions from traj.read_observable_particles()
+        """
+        frame_ids = np.asarray(ids[time_index], dtype=np.int64)
+        species, type_codes = np.unique(
+            np.asarray(types[time_index]), return_inverse=True
+        )
+        type_names = [traj.species_name(s) for s in species]
+        frame_positions = np.asarray(positions[time_index], dtype=float)[:, :3]
+        order = np.argsort(frame_ids, kind="stable")
+        sorted_ids = frame_ids[order]
+        edge_ids = []
+        for top in topology_records[time_index]:
+            for e1, e2 in top.edges:
+                if e1 <= e2:
+                    edge_ids.append((top.particles[e1], top.particles[e2]))
+        edge_ids = np.asarray(edge_ids, dtype=np.int64).reshape(-1, 2)
+        edge_rows = order[np.searchsorted(sorted_ids, edge_ids)]
+        neighbor_offsets, neighbor_rows = FrameData._neighbor_csr(
+            edge_rows[:, 0], edge_rows[:, 1], frame_ids.shape[0]
+        )
+        tops = topology_records[time_index]
+        (
+            topology_type_codes,
+            topology_type_names,
+            topology_offsets,
+            topology_particle_ids,
+        ) = FrameData._topology_arrays(
+            [top.type for top in tops], [top.particles for top in tops]
+        )
+        return FrameData(
+            frame_ids,
+            type_codes,
+            type_names,
+            frame_positions,
+            neighbor_offsets,
+            neighbor_rows,
+            topology_type_codes,
+            topology_type_names,
+            topology_offsets,
+            topology_particle_ids,
+        )
+
+    @staticmethod
+    def from_monomer_data(monomer_data):
+        """
+        get columnar data from dictionary monomer data.
+        """
+        particles = monomer_data["particles"]
+        frame_ids = np.fromiter(particles.keys(), dtype=np.int64, count=len(particles))
+        type_names, type_codes = FrameData._encode(
+            [particles[p_id]["type_name"] for p_id in particles]
+        )
+        frame_positions = np.array(
+            [particles[p_id]["position"] for p_id in particles], dtype=float
+        ).reshape(-1, 3)
+        rows_by_id = {p_id: row for row, p_id in enumerate(particles)}
+        neighbor_rows = []
+        neighbor_offsets = np.zeros(len(particles) + 1, dtype=np.int64)
+        for row, p_id in enumerate(particles):
+            neighbor_ids = particles[p_id]["neighbor_ids"]
+            neighbor_rows += [rows_by_id[n_id] for n_id in neighbor_ids]
+            neighbor_offsets[row + 1] = neighbor_offsets[row] + len(neighbor_ids)
+        topologies = monomer_data["topologies"]
+        (
+            topology_type_codes,
+            topology_type_names,
+            topology_offsets,
+            topology_particle_ids,
+        ) = FrameData._topology_arrays(
+            [topologies[t]["type_name"] for t in topologies],
+            [topologies[t]["particle_ids"] for t in topologies],
+        )
+        return FrameData(
+            frame_ids,
+            type_codes,
+            type_names,
+            frame_positions,
+            neighbor_offsets,
+            neighbor_rows,
+            topology_type_codes,
+            topology_type_names,
+            topology_offsets,
+            topology_particle_ids,
+        )
+
+    def __len__(self):
+        return self.ids.shape[0]
+
+    def __getitem__(self, key):
+        if key == "particles":
+            return _ParticlesView(self)
+        if key == "topologies":
+            return _TopologiesView(self)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in ("topologies", "particles")
+
+    def keys(self):
+        """
+        get the keys of the dictionary monomer data.
+        """
+        return ["topologies", "particles"]
+
+    def row_for_id(self, particle_id):
+        """
+        get the row of the particle with the given id.
+        """
+        if self._rows_by_id is None:
+            self._rows_by_id = {p_id: row for row, p_id in enumerate(self.ids.tolist())}
+        return self._rows_by_id[particle_id]
+
+    def type_code(self, type_name):
+        """
+        get the code for a particle type, or -1 if it's not in this frame.
+        """
+        if self._type_codes_by_name is None:
+            self._type_codes_by_name = {
+                name: code for code, name in enumerate(self.type_names)
+            }
+        return self._type_codes_by_name.get(type_name, -1)
+
+    def rows_of_types(self, type_names):
+        """
+        get the rows of all particles with any of the given types.
+        """
+        codes = [self.type_code(type_name) for type_name in type_names]
+        return np.flatnonzero(np.isin(self.type_codes, codes))
+
+    def neighbor_rows_of(self, row):
+        """
+        get the rows of a particle's neighbors.
+        """
+        return self.neighbor_rows[
+            self.neighbor_offsets[row] : self.neighbor_offsets[row + 1]
+        ]
+
+    def type_counts(self):
+        """
+        get the number of particles of each type code.
+        """
+        return np.bincount(self.type_codes, minlength=len(self.type_names))
+
+    def to_monomer_data(self):
+        """
+        get dictionary monomer data for this frame.
+        """
+        return {
+            "topologies": {
+                index: dict(topology) for index, topology in self["topologies"].items()
+            },
+            "particles": {
+                p_id: dict(particle) for p_id, particle in self["particles"].items()
+            },
+        }
+
+
+class _ParticlesView(Mapping):
+    """
+    Read-only mapping of particle id to dictionary data
+    for each particle in a FrameData.
+    """
+
+    def __init__(self, frame):
+        self._frame = frame
+
+    def __getitem__(self, particle_id):
+        frame = self._frame
+        row = frame.row_for_id(particle_id)
+        return {
+            "type_name": frame.type_names[frame.type_codes[row]],
+            "position": np.array(frame.positions[row]),
+            "neighbor_ids": frame.ids[frame.neighbor_rows_of(row)].tolist(),
+        }
+
+    def __iter__(self):
+        return iter(self._frame.ids.tolist())
+
+    def __len__(self):
+        return len(self._frame)
+
+    def __contains__(self, particle_id):
+        try:
+            self._frame.row_for_id(particle_id)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+
+class _TopologiesView(Mapping):
+    """
+    Read-only mapping of topology index to dictionary data
+    for each topology in a FrameData.
+    """
+
+    def __init__(self, frame):
+        self._frame = frame
+
+    def __getitem__(self, index):
+        frame = self._frame
+        if not isinstance(index, (int, np.integer)) or not 0 <= index < len(self):
+            raise KeyError(index)
+        start = frame.topology_offsets[index]
+        end = frame.topology_offsets[index + 1]
+        return {
+            "type_name": frame.topology_type_names[frame.topology_type_codes[index]],
+            "particle_ids": frame.topology_particle_ids[start:end].tolist(),
+        }
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def __len__(self):
+        return self._frame.topology_type_codes.shape[0]
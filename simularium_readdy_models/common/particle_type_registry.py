@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+
+class ParticleTypeInfo:
+    """
+    A particle type name parsed into its parts,
+    e.g. "tubulinA#GTP_bent_2_3" has
+    base "tubulinA", flags ("GTP", "bent") and polymer indices (2, 3).
+    """
+
+    name = ""
+    base = ""
+    flags = ()
+    polymer_indices = ()
+
+    def __init__(self, name):
+        self.name = name
+        if "#" not in name:
+            self.base = name
+            self.flags = ()
+            self.polymer_indices = ()
+            return
+        self.base = name[: name.index("#")]
+        flags = name[name.index("#") + 1 :].split("_")
+        n_numbers = 0
+        while n_numbers < len(flags) and flags[-1 - n_numbers].isdigit():
+            n_numbers += 1
+        self.flags = tuple(flags[: len(flags) - n_numbers])
+        self.polymer_indices = tuple(
+            int(number) for number in flags[len(flags) - n_numbers :]
+        )
+
+    def has_flag(self, flag):
+        """
+        check if the type has the given flag.
+        """
+        return flag in self.flags
+
+
+class ParticleTypeRegistry:
+    """
+    Interned particle type names.
+
+    Each type name is parsed into a ParticleTypeInfo only once,
+    and each flag change (type name, flags to add, flags to remove)
+    is computed only once, so reaction functions that check and change
+    flags do dictionary lookups instead of splitting and sorting strings.
+
+    The interned types and transitions are kept at class level
+    for the lifetime of the process and shared by every simulation in it.
+    They only grow with the number of distinct types and flag changes,
+    which is bounded by the types in the ReaDDy systems,
+    but a process that builds many different systems can call clear()
+    between them to release the ones it no longer needs.
+    """
+
+    _types = {}
+    _flag_transitions = {}
+
+    @staticmethod
+    def get(particle_type):
+        """
+        get the parsed info for a particle type.
+        """
+        info = ParticleTypeRegistry._types.get(particle_type)
+        if info is None:
+            info = ParticleTypeInfo(particle_type)
+            ParticleTypeRegistry._types[particle_type] = info
+        return info
+
+    @staticmethod
+    def register(particle_types):
+        """
+        parse a list of particle types ahead of time
+        (e.g. all the types added to a ReaDDy system).
+        """
+        for particle_type in particle_types:
+            ParticleTypeRegistry.get(particle_type)
+
+    @staticmethod
+    def polymer_number(particle_type):
+        """
+        get the last polymer index of a particle type,
+        e.g. 3 for "actin#mid_ATP_3".
+        """
+        return ParticleTypeRegistry.get(particle_type).polymer_indices[-1]
+
+    @staticmethod
+    def with_flags(particle_type, add_flags, remove_flags, reverse_sort=False):
+        """
+        get particle type with the flags added and removed,
+        computing each transition only the first time it's seen.
+        """
+        key = (particle_type, tuple(add_flags), tuple(remove_flags), reverse_sort)
+        result = ParticleTypeRegistry._flag_transitions.get(key)
+        if result is None:
+            result = ParticleTypeRegistry._type_with_flags(
+                particle_type, add_flags, remove_flags, reverse_sort
+            )
+            ParticleTypeRegistry._flag_transitions[key] = result
+        return result
+
+    @staticmethod
+    def _type_with_flags(particle_type, add_flags, remove_flags, reverse_sort):
+        """
+        calculate particle type with the flags added and removed.
+        """
+        if "#" not in particle_type:
+            for f in range(len(add_flags)):
+                particle_type = particle_type + ("_" if f > 0 else "#") + add_flags[f]
+            return particle_type
+        flag_string = particle_type[particle_type.index("#") + 1 :]
+        flags = flag_string.split("_")
+        polymer_indices = ""
+        if "tubulin" in particle_type and len(flags) > 1:
+            polymer_indices = f"_{flags[-2]}_{flags[-1]}"
+            flags = flags[:-2]
+        for flag in remove_flags:
+            if flag in flags:
+                flags.remove(flag)
+        for flag in add_flags:
+            if flag not in flags:
+                flags.append(flag)
+        if "" in flags:
+            flags.remove("")
+        if len(flags) < 1:
+            return particle_type[: particle_type.index("#")]
+        flags.sort(reverse=reverse_sort)
+        flag_string = ""
+        for f in range(len(flags)):
+            flag_string = flag_string + ("_" if f > 0 else "") + flags[f]
+        particle_type = particle_type[: particle_type.index("#")]
+        new_type = f"{particle_type}#{flag_string}{polymer_indices}"
+        return new_type
+
+    @staticmethod
+    def clear():
+        """
+        forget all interned types and flag transitions.
+        """
+        ParticleTypeRegistry._types.clear()
+        ParticleTypeRegistry._flag_transitions.clear()
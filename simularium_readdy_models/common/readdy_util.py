@@ -4,24 +4,31 @@ import copy
 import math
 import os
 import random
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from shutil import rmtree
+from types import SimpleNamespace
 
+import h5py
 import numpy as np
 import pandas as pd
 import readdy
-import scipy.linalg as linalg
 from tqdm import tqdm
 
+from .frame_cache import FrameCache
+from .frame_data import FrameData
+from .particle_type_registry import ParticleTypeRegistry
+
 
 class ReaddyUtil:
     def __init__(self):
         """
         Utilities used for Simularium ReaDDy models.
         """
-        self.bond_pairs = []
-        self.angle_triples = []
-        self.dihedral_quads = []
-        self.repulse_pairs = []
+        self.bond_pairs = set()
+        self.angle_triples = set()
+        self.dihedral_quads = set()
+        self.repulse_pairs = set()
 
     @staticmethod
     def is_zero_vector(v):
@@ -39,6 +46,17 @@ class ReaddyUtil:
             return v
         return v / np.linalg.norm(v)
 
+    @staticmethod
+    def normalize_vectors(vectors):
+        """
+        normalize each row of an (N, 3) array, leaving zero vectors as they are.
+        """
+        vectors = np.asarray(vectors, dtype=float)
+        lengths = np.linalg.norm(vectors, axis=1)[:, np.newaxis]
+        return np.divide(
+            vectors, lengths, out=np.zeros_like(vectors), where=lengths != 0
+        )
+
     @staticmethod
     def analyze_reaction_count_over_time(reactions, reaction_name):
         """
@@ -76,13 +94,71 @@ class ReaddyUtil:
         )
         return result if not in_degrees else np.rad2deg(result)
 
+    @staticmethod
+    def get_angles_between_vectors(vectors1, vectors2, in_degrees=False):
+        """
+        get the angle between each pair of rows in two (N, 3) arrays of vectors
+        in radians unless in_degrees is True.
+        """
+        result = np.arccos(
+            np.clip(
+                np.sum(
+                    ReaddyUtil.normalize_vectors(vectors1)
+                    * ReaddyUtil.normalize_vectors(vectors2),
+                    axis=1,
+                ),
+                -1.0,
+                1.0,
+            )
+        )
+        return result if not in_degrees else np.rad2deg(result)
+
     @staticmethod
     def rotate(v, axis, angle):
         """
-        rotate a vector around axis by angle (radians).
+        rotate a vector around axis by angle (radians),
+        using Rodrigues' rotation formula.
+        """
+        x, y, z = (float(a) for a in axis)
+        length = math.sqrt(x * x + y * y + z * z)
+        if length > 0:
+            x, y, z = x / length, y / length, z / length
+        a, b, c = (float(n) for n in v)
+        # axis x v and axis x (axis x v)
+        cross1 = (y * c - z * b, z * a - x * c, x * b - y * a)
+        cross2 = (
+            y * cross1[2] - z * cross1[1],
+            z * cross1[0] - x * cross1[2],
+            x * cross1[1] - y * cross1[0],
+        )
+        sin = math.sin(angle)
+        one_minus_cos = 1.0 - math.cos(angle)
+        return np.array(
+            [
+                a + sin * cross1[0] + one_minus_cos * cross2[0],
+                b + sin * cross1[1] + one_minus_cos * cross2[1],
+                c + sin * cross1[2] + one_minus_cos * cross2[2],
+            ]
+        )
+
+    @staticmethod
+    def rotate_vectors(vectors, axes, angles):
         """
-        rotation = linalg.expm(np.cross(np.eye(3), ReaddyUtil.normalize(axis) * angle))
-        return np.dot(rotation, np.copy(v))
+        rotate vectors around axes by angles (radians),
+        using Rodrigues' rotation formula.
+
+        vectors (..., 3), axes (..., 3) and angles (...) are broadcast
+        against each other, e.g. N vectors (N, 3) around one axis (3,)
+        by M angles (M, 1) gives (M, N, 3).
+        """
+        vectors = np.asarray(vectors, dtype=float)
+        axes = np.asarray(axes, dtype=float)
+        angles = np.asarray(angles, dtype=float)[..., np.newaxis]
+        lengths = np.linalg.norm(axes, axis=-1, keepdims=True)
+        axes = np.divide(axes, lengths, out=np.zeros_like(axes), where=lengths > 0)
+        cross1 = np.cross(axes, vectors)
+        cross2 = np.cross(axes, cross1)
+        return vectors + np.sin(angles) * cross1 + (1.0 - np.cos(angles)) * cross2
 
     @staticmethod
     def get_rotation_matrix(v1, v2):
@@ -182,6 +258,38 @@ class ReaddyUtil:
                 result[dim] -= pos2[dim] / abs(pos2[dim]) * box_size[dim]
         return result
 
+    @staticmethod
+    def get_non_periodic_boundary_positions(positions1, positions2, box_size):
+        """
+        get_non_periodic_boundary_position for (N, 3) arrays of positions at once.
+        """
+        positions2 = np.asarray(positions2, dtype=float)
+        box_size = np.asarray(box_size, dtype=float)
+        crosses = np.abs(positions2 - positions1) > box_size / 2.0
+        return positions2 - crosses * np.sign(positions2) * box_size
+
+    @staticmethod
+    def get_non_periodic_boundary_chain(positions, box_size, start_position=None):
+        """
+        move each of a chain of (N, 3) positions across the box if needed
+        so it's next to the previous one (the first is moved next to
+        start_position if given), the same as calling
+        get_non_periodic_boundary_position along the chain
+        with the previous result.
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        if len(positions) == 0:
+            return positions.copy()
+        box_size = np.asarray(box_size, dtype=float)
+        first = positions[:1]
+        if start_position is not None:
+            first = ReaddyUtil.get_non_periodic_boundary_positions(
+                start_position, first, box_size
+            )
+        steps = np.diff(positions, axis=0)
+        steps -= box_size * np.round(steps / box_size)
+        return np.concatenate([first, first + np.cumsum(steps, axis=0)])
+
     @staticmethod
     def calculate_diffusionCoefficient(r0, eta, T):
         """
@@ -236,11 +344,23 @@ class ReaddyUtil:
 
     @staticmethod
     def get_vertex_of_type(
-        topology, vertex_type, exact_match, verbose=False, debug_msg="", error_msg=""
+        topology,
+        vertex_type,
+        exact_match,
+        verbose=False,
+        debug_msg="",
+        error_msg="",
+        index=None,
     ):
         """
         get the first vertex with a given type.
         """
+        if index is not None:
+            vertices = index.vertices_of_type(vertex_type, exact_match)
+            if len(vertices) > 0:
+                return vertices[0]
+            ReaddyUtil.vertex_not_found(topology, verbose, error_msg, debug_msg)
+            return None
         for vertex in topology.graph.get_vertices():
             pt = topology.particle_type_of_vertex(vertex)
             if (not exact_match and vertex_type in pt) or (
@@ -252,11 +372,17 @@ class ReaddyUtil:
 
     @staticmethod
     def get_first_vertex_of_types(
-        topology, vertex_types, verbose=False, debug_msg="", error_msg=""
+        topology, vertex_types, verbose=False, debug_msg="", error_msg="", index=None
     ):
         """
         get the first vertex with any of the given types.
         """
+        if index is not None:
+            vertices = index.vertices_of_types(vertex_types)
+            if len(vertices) > 0:
+                return vertices[0]
+            ReaddyUtil.vertex_not_found(topology, verbose, error_msg, debug_msg)
+            return None
         for vertex in topology.graph.get_vertices():
             if topology.particle_type_of_vertex(vertex) in vertex_types:
                 return vertex
@@ -265,11 +391,17 @@ class ReaddyUtil:
 
     @staticmethod
     def get_vertex_with_id(
-        topology, vertex_id, verbose=False, debug_msg="", error_msg=""
+        topology, vertex_id, verbose=False, debug_msg="", error_msg="", index=None
     ):
         """
         get the first vertex with a given id.
         """
+        if index is not None:
+            vertex = index.vertex_with_id(vertex_id)
+            if vertex is not None:
+                return vertex
+            ReaddyUtil.vertex_not_found(topology, verbose, error_msg, debug_msg)
+            return None
         for vertex in topology.graph.get_vertices():
             if topology.particle_id_of_vertex(vertex) == vertex_id:
                 return vertex
@@ -278,16 +410,23 @@ class ReaddyUtil:
 
     @staticmethod
     def get_first_neighbor(
-        topology, vertex, exclude_vertices, verbose=False, debug_msg="", error_msg=""
+        topology,
+        vertex,
+        exclude_vertices,
+        verbose=False,
+        debug_msg="",
+        error_msg="",
+        index=None,
     ):
         """
         get the first neighboring vertex.
         """
+        id_of = topology.particle_id_of_vertex if index is None else index.id_of
         exclude_ids = []
         for v in exclude_vertices:
-            exclude_ids.append(topology.particle_id_of_vertex(v))
+            exclude_ids.append(id_of(v))
         for neighbor in vertex:
-            if topology.particle_id_of_vertex(neighbor) in exclude_ids:
+            if id_of(neighbor) in exclude_ids:
                 continue
             return neighbor.get()
         ReaddyUtil.vertex_not_found(topology, verbose, error_msg, debug_msg)
@@ -303,18 +442,21 @@ class ReaddyUtil:
         verbose=False,
         debug_msg="",
         error_msg="",
+        index=None,
     ):
         """
         get the first neighboring vertex of type vertex_type.
         """
+        id_of = topology.particle_id_of_vertex if index is None else index.id_of
+        type_of = topology.particle_type_of_vertex if index is None else index.type_of
         exclude_ids = []
         for v in exclude_vertices:
-            exclude_ids.append(topology.particle_id_of_vertex(v))
+            exclude_ids.append(id_of(v))
         for neighbor in vertex:
-            if topology.particle_id_of_vertex(neighbor) in exclude_ids:
+            if id_of(neighbor) in exclude_ids:
                 continue
             v_neighbor = neighbor.get()
-            pt = topology.particle_type_of_vertex(v_neighbor)
+            pt = type_of(v_neighbor)
             if (not exact_match and vertex_type in pt) or (
                 exact_match and pt == vertex_type
             ):
@@ -331,19 +473,22 @@ class ReaddyUtil:
         verbose=False,
         debug_msg="",
         error_msg="",
+        index=None,
     ):
         """
         get the first neighboring vertex with any of the given types,
         excluding particles with the given ids.
         """
+        id_of = topology.particle_id_of_vertex if index is None else index.id_of
+        type_of = topology.particle_type_of_vertex if index is None else index.type_of
         exclude_ids = []
         for v in exclude_vertices:
-            exclude_ids.append(topology.particle_id_of_vertex(v))
+            exclude_ids.append(id_of(v))
         for neighbor in vertex:
-            if topology.particle_id_of_vertex(neighbor) in exclude_ids:
+            if id_of(neighbor) in exclude_ids:
                 continue
             v_neighbor = neighbor.get()
-            pt = topology.particle_type_of_vertex(v_neighbor)
+            pt = type_of(v_neighbor)
             if pt in vertex_types:
                 return v_neighbor
         ReaddyUtil.vertex_not_found(topology, verbose, error_msg, debug_msg)
@@ -351,11 +496,22 @@ class ReaddyUtil:
 
     @staticmethod
     def get_vertices_of_type(
-        topology, vertex_type, exact_match, verbose=False, debug_msg="", error_msg=""
+        topology,
+        vertex_type,
+        exact_match,
+        verbose=False,
+        debug_msg="",
+        error_msg="",
+        index=None,
     ):
         """
         get all vertices with a given type.
         """
+        if index is not None:
+            v = list(index.vertices_of_type(vertex_type, exact_match))
+            if len(v) == 0:
+                ReaddyUtil.vertex_not_found(topology, verbose, error_msg, debug_msg)
+            return v
         v = []
         for vertex in topology.graph.get_vertices():
             pt = topology.particle_type_of_vertex(vertex)
@@ -376,14 +532,16 @@ class ReaddyUtil:
         verbose=False,
         debug_msg="",
         error_msg="",
+        index=None,
     ):
         """
         get all neighboring vertices with a given type.
         """
+        type_of = topology.particle_type_of_vertex if index is None else index.type_of
         v = []
         for neighbor in vertex:
             v_neighbor = neighbor.get()
-            pt = topology.particle_type_of_vertex(v_neighbor)
+            pt = type_of(v_neighbor)
             if (not exact_match and vertex_type in pt) or (
                 exact_match and pt == vertex_type
             ):
@@ -394,12 +552,20 @@ class ReaddyUtil:
 
     @staticmethod
     def get_random_vertex_of_type(
-        topology, vertex_type, exact_match, verbose=False, debug_msg="", error_msg=""
+        topology,
+        vertex_type,
+        exact_match,
+        verbose=False,
+        debug_msg="",
+        error_msg="",
+        index=None,
     ):
         """
         get a random vertex with a given type.
         """
-        vertices = ReaddyUtil.get_vertices_of_type(topology, vertex_type, exact_match)
+        vertices = ReaddyUtil.get_vertices_of_type(
+            topology, vertex_type, exact_match, index=index
+        )
         if len(vertices) == 0:
             ReaddyUtil.vertex_not_found(topology, verbose, error_msg, debug_msg)
             return None
@@ -407,14 +573,16 @@ class ReaddyUtil:
 
     @staticmethod
     def get_random_vertex_of_types(
-        topology, vertex_types, verbose=False, debug_msg="", error_msg=""
+        topology, vertex_types, verbose=False, debug_msg="", error_msg="", index=None
     ):
         """
         get a random vertex with any of the given types.
         """
         v = []
         for vertex_type in vertex_types:
-            v += ReaddyUtil.get_vertices_of_type(topology, vertex_type, True)
+            v += ReaddyUtil.get_vertices_of_type(
+                topology, vertex_type, True, index=index
+            )
         if len(v) == 0:
             ReaddyUtil.vertex_not_found(topology, verbose, error_msg, debug_msg)
             return None
@@ -440,33 +608,9 @@ class ReaddyUtil:
         """
         get particle type with the flags added and removed.
         """
-        if "#" not in particle_type:
-            for f in range(len(add_flags)):
-                particle_type = particle_type + ("_" if f > 0 else "#") + add_flags[f]
-            return particle_type
-        flag_string = particle_type[particle_type.index("#") + 1 :]
-        flags = flag_string.split("_")
-        polymer_indices = ""
-        if "tubulin" in particle_type and len(flags) > 1:
-            polymer_indices = f"_{flags[-2]}_{flags[-1]}"
-            flags = flags[:-2]
-        for flag in remove_flags:
-            if flag in flags:
-                flags.remove(flag)
-        for flag in add_flags:
-            if flag not in flags:
-                flags.append(flag)
-        if "" in flags:
-            flags.remove("")
-        if len(flags) < 1:
-            return particle_type[: particle_type.index("#")]
-        flags.sort(reverse=reverse_sort)
-        flag_string = ""
-        for f in range(len(flags)):
-            flag_string = flag_string + ("_" if f > 0 else "") + flags[f]
-        particle_type = particle_type[: particle_type.index("#")]
-        new_type = f"{particle_type}#{flag_string}{polymer_indices}"
-        return new_type
+        return ParticleTypeRegistry.with_flags(
+            particle_type, add_flags, remove_flags, reverse_sort
+        )
 
     @staticmethod
     def set_flags(
@@ -604,9 +748,9 @@ class ReaddyUtil:
             types.append(
                 (
                     t
-                    + str(ReaddyUtil.calculate_polymer_number(x, polymer_offsets[0]))
+                    + str(ReaddyUtil.calculate_polymer_number(x, polymer_offsets[0], 3))
                     + "_"
-                    + str(ReaddyUtil.calculate_polymer_number(y, polymer_offsets[1]))
+                    + str(ReaddyUtil.calculate_polymer_number(y, polymer_offsets[1], 3))
                 )
                 if len(polymer_offsets) > 0
                 else t
@@ -622,6 +766,15 @@ class ReaddyUtil:
             np.array([random.random(), random.random(), random.random()])
         )
 
+    @staticmethod
+    def get_random_unit_vectors(n):
+        """
+        get n random unit vectors as an (n, 3) array,
+        from the same distribution as get_random_unit_vector().
+        """
+        vectors = np.random.uniform(size=(n, 3))
+        return vectors / np.linalg.norm(vectors, axis=1)[:, np.newaxis]
+
     @staticmethod
     def get_random_boundary_position(box_size):
         """
@@ -658,6 +811,26 @@ class ReaddyUtil:
         recipe.remove_edge(vertex1, vertex2)
         return True, ""
 
+    @staticmethod
+    def _canonical_key(types):
+        """
+        get the same key for a tuple of types and its reverse.
+        """
+        reverse = types[::-1]
+        return types if types <= reverse else reverse
+
+    def add_bonds(self, bonds, system):
+        """
+        adds bonds to the system (if they haven't been added already)
+            for each (type1, type2, force_const, bond_length [nm]) in bonds.
+        """
+        for t1, t2, force_const, bond_length in bonds:
+            key = ReaddyUtil._canonical_key((t1, t2))
+            if key in self.bond_pairs:
+                continue
+            system.topologies.configure_harmonic_bond(t1, t2, force_const, bond_length)
+            self.bond_pairs.add(key)
+
     def add_bond(self, types1, types2, force_const, bond_length, system):
         """
         adds a bond to the system (if it hasn't been added already)
@@ -666,14 +839,22 @@ class ReaddyUtil:
             with force constant force_const
             and length bond_length [nm].
         """
-        for t1 in types1:
-            for t2 in types2:
-                if (t1, t2) not in self.bond_pairs and (t2, t1) not in self.bond_pairs:
-                    system.topologies.configure_harmonic_bond(
-                        t1, t2, force_const, bond_length
-                    )
-                    self.bond_pairs.append((t1, t2))
-                    self.bond_pairs.append((t2, t1))
+        self.add_bonds(
+            ((t1, t2, force_const, bond_length) for t1 in types1 for t2 in types2),
+            system,
+        )
+
+    def add_angles(self, angles, system):
+        """
+        adds angles to the system (if they haven't been added already)
+            for each (type1, type2, type3, force_const, angle [radians]) in angles.
+        """
+        for t1, t2, t3, force_const, angle in angles:
+            key = ReaddyUtil._canonical_key((t1, t2, t3))
+            if key in self.angle_triples:
+                continue
+            system.topologies.configure_harmonic_angle(t1, t2, t3, force_const, angle)
+            self.angle_triples.add(key)
 
     def add_angle(self, types1, types2, types3, force_const, angle, system):
         """
@@ -684,20 +865,33 @@ class ReaddyUtil:
             with force constant force_const
             and angle [radians].
         """
-        for t1 in types1:
-            for t2 in types2:
-                for t3 in types3:
-                    if (t1, t2, t3) not in self.angle_triples and (
-                        t3,
-                        t2,
-                        t1,
-                    ) not in self.angle_triples:
-                        system.topologies.configure_harmonic_angle(
-                            t1, t2, t3, force_const, angle
-                        )
-                        self.angle_triples.append((t1, t2, t3))
-                        self.angle_triples.append((t3, t2, t1))
-                        # print(f"angles: {t1}, {t2}, {t3}")
+        self.add_angles(
+            (
+                (t1, t2, t3, force_const, angle)
+                for t1 in types1
+                for t2 in types2
+                for t3 in types3
+            ),
+            system,
+        )
+
+    def add_dihedrals(self, dihedrals, system):
+        """
+        adds cosine dihedrals to the system (if they haven't been added already)
+            for each (type1, type2, type3, type4, force_const, angle [radians])
+            in dihedrals.
+        """
+        for t1, t2, t3, t4, force_const, angle in dihedrals:
+            key = ReaddyUtil._canonical_key((t1, t2, t3, t4))
+            if key in self.dihedral_quads:
+                continue
+            system.topologies.configure_cosine_dihedral(
+                t1, t2, t3, t4, force_const, 1.0, angle
+            )
+            system.topologies.configure_cosine_dihedral(
+                t4, t3, t2, t1, force_const, 1.0, angle
+            )
+            self.dihedral_quads.add(key)
 
     def add_dihedral(self, types1, types2, types3, types4, force_const, angle, system):
         """
@@ -709,26 +903,28 @@ class ReaddyUtil:
             with force constant force_const
             and angle [radians].
         """
-        for t1 in types1:
-            for t2 in types2:
-                for t3 in types3:
-                    for t4 in types4:
-                        if (t1, t2, t3, t4) not in self.dihedral_quads and (
-                            t4,
-                            t3,
-                            t2,
-                            t1,
-                        ) not in self.dihedral_quads:
-                            system.topologies.configure_cosine_dihedral(
-                                t1, t2, t3, t4, force_const, 1.0, angle
-                            )
-                            system.topologies.configure_cosine_dihedral(
-                                t4, t3, t2, t1, force_const, 1.0, angle
-                            )
-                            self.dihedral_quads.append((t1, t2, t3, t4))
-                            self.dihedral_quads.append((t4, t3, t2, t1))
-                            # print(f"dihedrals: {t1}, {t2}, {t3}, {t4}")
-                            # print("from add_dihedrals:", self.dihedral_quads)
+        self.add_dihedrals(
+            (
+                (t1, t2, t3, t4, force_const, angle)
+                for t1 in types1
+                for t2 in types2
+                for t3 in types3
+                for t4 in types4
+            ),
+            system,
+        )
+
+    def add_repulsions(self, repulsions, system):
+        """
+        adds pairwise repulsions to the system (if they haven't been added already)
+            for each (type1, type2, force_const, distance [nm]) in repulsions.
+        """
+        for t1, t2, force_const, distance in repulsions:
+            key = ReaddyUtil._canonical_key((t1, t2))
+            if key in self.repulse_pairs:
+                continue
+            system.potentials.add_harmonic_repulsion(t1, t2, force_const, distance)
+            self.repulse_pairs.add(key)
 
     def add_repulsion(self, types1, types2, force_const, distance, system):
         """
@@ -738,17 +934,10 @@ class ReaddyUtil:
             with force constant force_const
             with equilibrium distance [nm].
         """
-        for t1 in types1:
-            for t2 in types2:
-                if (t1, t2) not in self.repulse_pairs and (
-                    t2,
-                    t1,
-                ) not in self.repulse_pairs:
-                    system.potentials.add_harmonic_repulsion(
-                        t1, t2, force_const, distance
-                    )
-                    self.repulse_pairs.append((t1, t2))
-                    self.repulse_pairs.append((t2, t1))
+        self.add_repulsions(
+            ((t1, t2, force_const, distance) for t1 in types1 for t2 in types2),
+            system,
+        )
 
     def add_polymer_repulsions_1D(
         self,
@@ -1049,6 +1238,36 @@ class ReaddyUtil:
             simulation.make_checkpoints(checkpoint_stride, checkpoint_path, 0)
         return simulation
 
+    @staticmethod
+    def add_topologies(
+        simulation, topology_type, particle_types, positions, edges=None
+    ):
+        """
+        add a topology for each set of positions,
+        all with the same topology type, particle types, and edges.
+
+        positions : (N, M, 3) array for M particle_types
+            (or (N, 3) if there's one particle type)
+        edges : list of (index1, index2) pairs of indices into particle_types
+
+        returns the list of added topologies.
+        """
+        positions = np.asarray(positions, dtype=float).reshape(
+            -1, len(particle_types), 3
+        )
+        edges = [] if edges is None else edges
+        result = []
+        for topology_positions in positions:
+            topology = simulation.add_topology(
+                topology_type, particle_types, topology_positions
+            )
+            if len(edges) > 0:
+                graph = topology.get_graph()
+                for index1, index2 in edges:
+                    graph.add_edge(index1, index2)
+            result.append(topology)
+        return result
+
     @staticmethod
     def get_current_particle_edges(current_topologies):
         """
@@ -1066,13 +1285,30 @@ class ReaddyUtil:
                     result.append((p1_id, p2_id))
         return result
 
+    @staticmethod
+    def get_neighbor_ids_from_edges(edges):
+        """
+        Index a list of edges as (particle1 id, particle2 id)
+        into a mapping of particle id to a list of neighbor ids,
+        so each particle's neighbors can be looked up in O(1).
+        Neighbors are listed in the same order as the edges.
+        """
+        result = {}
+        for id1, id2 in edges:
+            result.setdefault(id1, []).append(id2)
+            if id1 != id2:
+                result.setdefault(id2, []).append(id1)
+        return result
+
     @staticmethod
     def get_current_monomers(current_topologies):
         """
         During a running simulation,
         get data for topologies of particles.
         """
-        edges = ReaddyUtil.get_current_particle_edges(current_topologies)
+        neighbors = ReaddyUtil.get_neighbor_ids_from_edges(
+            ReaddyUtil.get_current_particle_edges(current_topologies)
+        )
         result = {
             "topologies": {},
             "particles": {},
@@ -1081,16 +1317,10 @@ class ReaddyUtil:
             particle_ids = []
             for p in topology.particles:
                 particle_ids.append(p.id)
-                neighbor_ids = []
-                for edge in edges:
-                    if p.id == edge[0]:
-                        neighbor_ids.append(edge[1])
-                    elif p.id == edge[1]:
-                        neighbor_ids.append(edge[0])
                 result["particles"][p.id] = {
                     "type_name": p.type,
                     "position": p.pos,
-                    "neighbor_ids": neighbor_ids,
+                    "neighbor_ids": neighbors.get(p.id, []),
                 }
             result["topologies"][index] = {
                 "type_name": topology.type,
@@ -1129,8 +1359,8 @@ class ReaddyUtil:
         topology_records from traj.read_observable_topologies()
         ids, types, positions from traj.read_observable_particles()
         """
-        edges = ReaddyUtil._shape_frame_edge_data_from_file(
-            time_index, topology_records
+        neighbors = ReaddyUtil.get_neighbor_ids_from_edges(
+            ReaddyUtil._shape_frame_edge_data_from_file(time_index, topology_records)
         )
         result = {
             "topologies": {},
@@ -1144,19 +1374,128 @@ class ReaddyUtil:
         for p in range(len(ids[time_index])):
             p_id = ids[time_index][p]
             position = positions[time_index][p]
-            neighbor_ids = []
-            for edge in edges:
-                if p_id == edge[0]:
-                    neighbor_ids.append(edge[1])
-                elif p_id == edge[1]:
-                    neighbor_ids.append(edge[0])
-            result["particles"][ids[time_index][p]] = {
+            result["particles"][p_id] = {
                 "type_name": traj.species_name(types[time_index][p]),
                 "position": np.array([position[0], position[1], position[2]]),
-                "neighbor_ids": neighbor_ids,
+                "neighbor_ids": neighbors.get(p_id, []),
             }
         return result
 
+    @staticmethod
+    def _frame_time_indices(min_time, max_time, time_inc, n_times):
+        """
+        get the time indices of the frames to shape:
+        every time_inc-th index between min_time and max_time (inclusive).
+        """
+        return [
+            t
+            for t in range(max(min_time, 0), min(max_time, n_times - 1) + 1)
+            if t % time_inc == 0
+        ]
+
+    @staticmethod
+    def _iter_shaped_frames(
+        min_time,
+        max_time,
+        time_inc,
+        times,
+        topology_records,
+        ids,
+        types,
+        positions,
+        traj,
+        columnar=False,
+    ):
+        """
+        For each time point, yield the time index and monomer data,
+        shaping one frame at a time.
+        If columnar, each frame is a FrameData instead of a dictionary.
+        """
+        shape_frame = (
+            FrameData.from_records
+            if columnar
+            else ReaddyUtil._shape_frame_monomer_data_from_file
+        )
+        for t in ReaddyUtil._frame_time_indices(
+            min_time, max_time, time_inc, len(times)
+        ):
+            yield t, shape_frame(t, topology_records, ids, types, positions, traj)
+
+    @staticmethod
+    def _shape_frame_chunk(
+        topology_records, ids, types, positions, species_names, columnar=False
+    ):
+        """
+        Shape a chunk of frames in a worker process.
+
+        topology_records, ids, types, positions hold only the frames
+        in the chunk, and species_names maps species id to type name.
+        """
+        traj = SimpleNamespace(species_name=species_names.__getitem__)
+        shape_frame = (
+            FrameData.from_records
+            if columnar
+            else ReaddyUtil._shape_frame_monomer_data_from_file
+        )
+        return [
+            shape_frame(t, topology_records, ids, types, positions, traj)
+            for t in range(len(ids))
+        ]
+
+    @staticmethod
+    def _shape_monomer_data_in_parallel(
+        time_indices,
+        topology_records,
+        ids,
+        types,
+        positions,
+        traj,
+        columnar,
+        n_workers,
+    ):
+        """
+        Shape frames for the given time indices in chunks
+        across a pool of worker processes, keeping time order.
+        """
+        species_names = {}
+        for t in time_indices:
+            for species in np.unique(types[t]):
+                if species not in species_names:
+                    species_names[species] = traj.species_name(species)
+        chunk_size = max(1, math.ceil(len(time_indices) / (4 * n_workers)))
+        chunks = [
+            time_indices[i : i + chunk_size]
+            for i in range(0, len(time_indices), chunk_size)
+        ]
+        result = []
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(
+                    ReaddyUtil._shape_frame_chunk,
+                    [
+                        [
+                            # ReaDDy topology records can't be pickled
+                            SimpleNamespace(
+                                type=top.type,
+                                particles=list(top.particles),
+                                edges=list(top.edges),
+                            )
+                            for top in topology_records[t]
+                        ]
+                        for t in chunk
+                    ],
+                    [ids[t] for t in chunk],
+                    [types[t] for t in chunk],
+                    [positions[t] for t in chunk],
+                    species_names,
+                    columnar,
+                )
+                for chunk in chunks
+            ]
+            for future in tqdm(futures):
+                result += future.result()
+        return result
+
     @staticmethod
     def _shape_monomer_data_from_file(
         min_time,
@@ -1168,22 +1507,201 @@ class ReaddyUtil:
         types,
         positions,
         traj,
+        columnar=False,
+        n_workers=1,
     ):
         """
         For each time point, get monomer data and times.
+        If columnar, each frame is a FrameData instead of a dictionary.
+        If n_workers > 1, frames are shaped in parallel worker processes.
         """
         print("Shaping data for analysis...")
+        time_indices = ReaddyUtil._frame_time_indices(
+            min_time, max_time, time_inc, len(times)
+        )
+        new_times = np.array([times[t] for t in time_indices])
+        if n_workers > 1 and len(time_indices) > 1:
+            result = ReaddyUtil._shape_monomer_data_in_parallel(
+                time_indices,
+                topology_records,
+                ids,
+                types,
+                positions,
+                traj,
+                columnar,
+                n_workers,
+            )
+            return result, new_times
         result = []
-        new_times = []
-        for t in tqdm(range(len(times))):
-            if t >= min_time and t <= max_time and t % time_inc == 0:
-                result.append(
-                    ReaddyUtil._shape_frame_monomer_data_from_file(
-                        t, topology_records, ids, types, positions, traj
+        for _, frame in tqdm(
+            ReaddyUtil._iter_shaped_frames(
+                min_time,
+                max_time,
+                time_inc,
+                times,
+                topology_records,
+                ids,
+                types,
+                positions,
+                traj,
+                columnar,
+            ),
+            total=len(time_indices),
+        ):
+            result.append(frame)
+        return result, new_times
+
+    @staticmethod
+    def _read_topology_records_window(group, time_indices):
+        """
+        Read topology records for the given time indices
+        from a ReaDDy topologies observable group,
+        in the same layout as traj.read_observable_topologies().
+
+        For each frame, the flat particles dataset holds
+        [n_particles, particle ids...] per topology and
+        the edges dataset holds a [n_edges, 0] header row
+        followed by n_edges (vertex1, vertex2) rows per topology.
+        """
+        result = []
+        for t in time_indices:
+            p0, p1 = group["limitsParticles"][t]
+            e0, e1 = group["limitsEdges"][t]
+            flat_particles = group["particles"][p0:p1]
+            flat_edges = group["edges"][e0:e1]
+            topology_types = group["types"][t]
+            records = []
+            p_index = 0
+            e_index = 0
+            for top_type in topology_types:
+                n_particles = int(flat_particles[p_index])
+                n_edges = int(flat_edges[e_index][0])
+                records.append(
+                    SimpleNamespace(
+                        type=int(top_type),
+                        particles=flat_particles[
+                            p_index + 1 : p_index + 1 + n_particles
+                        ].tolist(),
+                        edges=[
+                            (int(e[0]), int(e[1]))
+                            for e in flat_edges[e_index + 1 : e_index + 1 + n_edges]
+                        ],
                     )
                 )
-                new_times.append(times[t])
-        return result, np.array(new_times)
+                p_index += 1 + n_particles
+                e_index += 1 + n_edges
+            result.append(records)
+        return result
+
+    @staticmethod
+    def read_observables_window(h5_file_path, min_time=0, max_time=None, stride=1):
+        """
+        For data saved in a ReaDDy .h5 file,
+        read the particles and topologies observables
+        only for every stride-th time index between min_time and max_time
+        (inclusive, as time indices), using hyperslab reads
+        so the rest of the file is never read or decoded.
+
+        Returns times, topology_records, ids, types, positions
+        in the same layout as traj.read_observable_topologies()
+        and traj.read_observable_particles(), for the selected frames only.
+        """
+        with h5py.File(h5_file_path, "r") as f:
+            particles = f["readdy/observables/particles"]
+            n_times = particles["time"].shape[0]
+            if max_time is None:
+                max_time = n_times
+            time_indices = ReaddyUtil._frame_time_indices(
+                min_time, max_time, stride, n_times
+            )
+            if len(time_indices) == 0:
+                return np.zeros(0, dtype=np.uint64), [], [], [], []
+            window = slice(time_indices[0], time_indices[-1] + 1, stride)
+            times = particles["time"][window]
+            types = particles["types"][window]
+            ids = particles["ids"][window]
+            positions = particles["positions"][window]
+            topology_records = ReaddyUtil._read_topology_records_window(
+                f["readdy/observables/topologies"], time_indices
+            )
+        return times, topology_records, ids, types, positions
+
+    @staticmethod
+    def iter_monomer_data_from_file(
+        h5_file_path,
+        stride=1,
+        min_time=0,
+        max_time=None,
+        timestep=0.1,
+        columnar=False,
+    ):
+        """
+        For data saved in a ReaDDy .h5 file,
+        lazily yield (time in microseconds, monomer data)
+        one frame at a time for every stride-th time index
+        between min_time and max_time (inclusive, as time indices).
+
+        Only the current frame is shaped, so analysis can run
+        in a single pass without holding every frame in memory.
+        Monomer data has the same format as
+        monomer_data_and_reactions_from_file.
+        """
+        trajectory = readdy.Trajectory(h5_file_path)
+        (
+            times,
+            topology_records,
+            ids,
+            types,
+            positions,
+        ) = ReaddyUtil.read_observables_window(h5_file_path, min_time, max_time, stride)
+        for t, frame in ReaddyUtil._iter_shaped_frames(
+            0,
+            times.shape[0],
+            1,
+            times,
+            topology_records,
+            ids,
+            types,
+            positions,
+            trajectory,
+            columnar,
+        ):
+            yield timestep / 1e3 * times[t], frame  # index --> microseconds
+
+    @staticmethod
+    def cache_arguments(
+        cache_path, save_cache, pickle_file_path=None, save_pickle_file=False
+    ):
+        """
+        get (cache_path, save_cache) from the shaped data cache arguments,
+        mapping the deprecated pickle_file_path and save_pickle_file
+        onto them with a DeprecationWarning.
+        If pickle_file_path is an existing file (e.g. an old pickle),
+        the cache is kept in a directory next to it
+        at pickle_file_path + ".cache" instead.
+        """
+        if pickle_file_path is not None:
+            warnings.warn(
+                "pickle_file_path is deprecated, use cache_path instead",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+            if cache_path is None:
+                cache_path = pickle_file_path
+                if os.path.isfile(pickle_file_path):
+                    cache_path = FrameCache.default_path(pickle_file_path)
+                    print(
+                        f"{pickle_file_path} is not a shaped data cache, "
+                        f"using {cache_path} instead"
+                    )
+        if save_pickle_file:
+            warnings.warn(
+                "save_pickle_file is deprecated, use save_cache instead",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+            save_cache = True
+        return cache_path, save_cache
 
     @staticmethod
     def monomer_data_and_reactions_from_file(
@@ -1191,6 +1709,10 @@ class ReaddyUtil:
         stride=1,
         timestep=0.1,
         reaction_names=None,
+        cache_path=None,
+        save_cache=False,
+        columnar=False,
+        n_workers=1,
         pickle_file_path=None,
         save_pickle_file=False,
     ):
@@ -1212,60 +1734,82 @@ class ReaddyUtil:
             }
         }
 
+        If columnar, each frame is instead a FrameData,
+        which stores particles in contiguous arrays
+        and can still be read like the dictionary above.
+
         Also return the counts of reactions over time,
         the timestamps for each frame,
         and the reaction time increment in seconds
-        """
-        if pickle_file_path is not None and os.path.isfile(pickle_file_path):
-            print("Loading pickle file for shaped data")
-            import pickle
 
-            data = []
-            with open(pickle_file_path, "rb") as f:
-                while True:
-                    try:
-                        data.append(pickle.load(f))
-                    except EOFError:
-                        break
-            monomer_data, reactions, times, time_inc_s = data[0]
-            return monomer_data, reactions, times, time_inc_s
-        else:
-            trajectory = readdy.Trajectory(h5_file_path)
-            _, topology_records = trajectory.read_observable_topologies()
-            (
-                times,
-                types,
-                ids,
-                positions,
-            ) = trajectory.read_observable_particles()
-            monomer_data, times = ReaddyUtil._shape_monomer_data_from_file(
-                0,
-                times.shape[0],
-                stride,
-                times,
-                topology_records,
-                ids,
-                types,
-                positions,
-                trajectory,
-            )
-            times = timestep / 1e3 * times  # index --> microseconds
-            # times = timestep * times  # index --> nanoseconds
-            reactions = None
-            time_inc_s = None
-            if reaction_names is not None:
-                recorded_steps = stride * (len(times) - 1)
-                reactions = ReaddyUtil.load_reactions(
-                    trajectory, stride, reaction_names, recorded_steps
+        If save_cache, the shaped data is written to a FrameCache
+        at cache_path (default h5_file_path + ".cache").
+        If a cache at that path was built from the same .h5 file
+        with the same stride, timestep and reaction_names,
+        the shaped data is loaded from it instead of the .h5 file.
+
+        If n_workers > 1, frames are shaped in parallel
+        across that many worker processes.
+
+        pickle_file_path and save_pickle_file are deprecated
+        aliases for cache_path and save_cache.
+        """
+        cache_path, save_cache = ReaddyUtil.cache_arguments(
+            cache_path, save_cache, pickle_file_path, save_pickle_file
+        )
+        cache_key = None
+        if cache_path is not None or save_cache:
+            if cache_path is None:
+                cache_path = FrameCache.default_path(h5_file_path)
+            cache_key = FrameCache.key(h5_file_path, stride, timestep, reaction_names)
+            cache = FrameCache.open(cache_path, cache_key)
+            if cache is not None:
+                print("Loading cached shaped data")
+                monomer_data = (
+                    cache if columnar else [frame.to_monomer_data() for frame in cache]
                 )
-                time_inc_s = times[-1] * 1e-6 / (len(times) - 1)
-            data = [monomer_data, reactions, times, time_inc_s]
-            if save_pickle_file:
-                import pickle
-
-                fname = h5_file_path + ".dat"
-                with open(fname, "wb") as f:
-                    pickle.dump(data, f)
+                return (
+                    monomer_data,
+                    cache.reactions,
+                    np.array(cache.times),
+                    cache.time_inc_s,
+                )
+        trajectory = readdy.Trajectory(h5_file_path)
+        (
+            times,
+            topology_records,
+            ids,
+            types,
+            positions,
+        ) = ReaddyUtil.read_observables_window(h5_file_path, stride=stride)
+        monomer_data, times = ReaddyUtil._shape_monomer_data_from_file(
+            0,
+            times.shape[0],
+            1,
+            times,
+            topology_records,
+            ids,
+            types,
+            positions,
+            trajectory,
+            columnar,
+            n_workers,
+        )
+        times = timestep / 1e3 * times  # index --> microseconds
+        # times = timestep * times  # index --> nanoseconds
+        reactions = None
+        time_inc_s = None
+        if reaction_names is not None:
+            recorded_steps = stride * (len(times) - 1)
+            reactions = ReaddyUtil.load_reactions(
+                trajectory, stride, reaction_names, recorded_steps
+            )
+            time_inc_s = times[-1] * 1e-6 / (len(times) - 1)
+        if save_cache:
+            print("Saving shaped data cache...")
+            FrameCache.write(
+                cache_path, cache_key, monomer_data, times, reactions, time_inc_s
+            )
         return monomer_data, reactions, times, time_inc_s
 
     @staticmethod
@@ -1325,6 +1869,47 @@ class ReaddyUtil:
                 result.append(p_id)
         return result
 
+    @staticmethod
+    def analyze_type_class_counts(types, particle_types, type_classes):
+        """
+        Get the number of particles in each class of particle types
+        at each time index, counted in one pass over all the frames.
+
+        types from traj.read_observable_particles()
+        (a list of species ids for each frame)
+        particle_types from traj.particle_types
+        (mapping of particle type name to species id)
+        type_classes is a mapping of class name to a list of particle types.
+
+        Returns a mapping of class name to an array of counts per frame.
+        """
+        n_frames = len(types)
+        flat_types = [np.asarray(frame_types, dtype=np.int64) for frame_types in types]
+        flat_types = (
+            np.concatenate(flat_types) if n_frames > 0 else np.zeros(0, dtype=np.int64)
+        )
+        n_species = max(
+            [int(species_id) + 1 for species_id in particle_types.values()]
+            + [int(flat_types.max()) + 1 if len(flat_types) > 0 else 0]
+        )
+        # which classes each species is in
+        class_matrix = np.zeros((n_species, len(type_classes)), dtype=np.int64)
+        for column, class_types in enumerate(type_classes.values()):
+            for type_name in set(class_types):
+                if type_name in particle_types:
+                    class_matrix[int(particle_types[type_name]), column] = 1
+        frame_indices = np.repeat(
+            np.arange(n_frames), [len(frame_types) for frame_types in types]
+        )
+        species_counts = np.bincount(
+            frame_indices * n_species + flat_types, minlength=n_frames * n_species
+        ).reshape(n_frames, n_species)
+        class_counts = species_counts @ class_matrix
+        return {
+            class_name: class_counts[:, column]
+            for column, class_name in enumerate(type_classes)
+        }
+
     @staticmethod
     def analyze_frame_get_id_for_neighbor_of_types(
         particle_id,
@@ -1365,7 +1950,7 @@ class ReaddyUtil:
         frame_particle_data,
         chain_length=0,
         last_particle_id=None,
-        result=[],
+        result=None,
         next_neighbor_index=None,
         exact_match=True,
     ):
@@ -1375,39 +1960,30 @@ class ReaddyUtil:
         avoiding the particle with last_particle_id,
         if chain_length = 0, return entire chain.
         """
-        if next_neighbor_index is not None:
-            n_types = neighbor_types[next_neighbor_index]
-        else:
-            n_types = neighbor_types
-
-        n_id = ReaddyUtil.analyze_frame_get_id_for_neighbor_of_types(
-            start_particle_id,
-            n_types,
-            frame_particle_data,
-            [last_particle_id] if last_particle_id is not None else [],
-            exact_match=exact_match,
-        )
-
-        if n_id is None:
-            return result
-        result.append(n_id)
-
-        if chain_length == 1:
-            return result
-
-        if next_neighbor_index is not None:
-            next_neighbor_index = (next_neighbor_index + 1) % len(neighbor_types)
-
-        return ReaddyUtil.analyze_frame_get_chain_of_types(
-            n_id,
-            neighbor_types,
-            frame_particle_data,
-            chain_length - 1 if chain_length > 0 else 0,
-            start_particle_id,
-            result,
-            next_neighbor_index=next_neighbor_index,
-            exact_match=exact_match,
-        )
+        if result is None:
+            result = []
+        while True:
+            if next_neighbor_index is not None:
+                n_types = neighbor_types[next_neighbor_index]
+            else:
+                n_types = neighbor_types
+            n_id = ReaddyUtil.analyze_frame_get_id_for_neighbor_of_types(
+                start_particle_id,
+                n_types,
+                frame_particle_data,
+                [last_particle_id] if last_particle_id is not None else [],
+                exact_match=exact_match,
+            )
+            if n_id is None:
+                return result
+            result.append(n_id)
+            if chain_length == 1:
+                return result
+            if next_neighbor_index is not None:
+                next_neighbor_index = (next_neighbor_index + 1) % len(neighbor_types)
+            chain_length = chain_length - 1 if chain_length > 0 else 0
+            last_particle_id = start_particle_id
+            start_particle_id = n_id
 
     @staticmethod
     def load_reactions(trajectory, stride, total_reactions_mapping, recorded_steps=1e3):
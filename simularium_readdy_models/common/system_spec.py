@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+
+import hashlib
+import inspect
+import json
+import os
+from fnmatch import fnmatchcase
+
+import numpy as np
+
+
+class SystemSpec:
+    """
+    Specification of the species and potentials in a ReaDDy system,
+    recorded as a list of calls with plain (JSON serializable) arguments.
+
+    A SystemSpec has the same methods as readdy.ReactionDiffusionSystem
+    for adding species, topology types and potentials,
+    so it can be passed anywhere a system is expected while building.
+    The recorded calls can be saved, loaded,
+    and applied to a real system in one loop.
+
+    Reactions are not part of the spec, since structural reactions
+    are defined by Python functions. Add them to the real system
+    after applying the spec.
+    """
+
+    VERSION = 1
+    METHODS = {
+        "": ("add_species", "add_topology_species"),
+        "topologies": (
+            "add_type",
+            "configure_harmonic_bond",
+            "configure_harmonic_angle",
+            "configure_cosine_dihedral",
+        ),
+        "potentials": ("add_harmonic_repulsion", "add_box"),
+    }
+
+    def __init__(self, calls=None):
+        self.calls = [] if calls is None else calls
+        self.topologies = _SystemSpecGroup(self, "topologies")
+        self.potentials = _SystemSpecGroup(self, "potentials")
+
+    def record(self, group, method, args, kwargs):
+        """
+        record a call to a system method.
+        """
+        if method not in SystemSpec.METHODS[group]:
+            name = f"{group}.{method}" if group else method
+            raise Exception(f"{name} can't be recorded in a SystemSpec")
+        self.calls.append(
+            [
+                group,
+                method,
+                [SystemSpec._plain(arg) for arg in args],
+                {key: SystemSpec._plain(arg) for key, arg in kwargs.items()},
+            ]
+        )
+
+    def add_species(self, *args, **kwargs):
+        self.record("", "add_species", args, kwargs)
+
+    def add_topology_species(self, *args, **kwargs):
+        self.record("", "add_topology_species", args, kwargs)
+
+    @staticmethod
+    def _plain(value):
+        """
+        get a JSON serializable version of an argument.
+        """
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def apply(self, system):
+        """
+        add the recorded species and potentials to a ReaDDy system.
+        """
+        targets = {
+            "": system,
+            "topologies": system.topologies,
+            "potentials": system.potentials,
+        }
+        methods = SystemSpec._fast_topology_methods(system.topologies)
+        for group, method, args, kwargs in self.calls:
+            function = methods.get((group, method))
+            if function is None:
+                function = getattr(targets[group], method)
+                methods[(group, method)] = function
+            function(*args, **kwargs)
+
+    @staticmethod
+    def _fast_topology_methods(topologies):
+        """
+        get versions of the topology potential methods that pass
+        plain float arguments straight to ReaDDy's registry.
+
+        readdy's own methods build the target units for every call,
+        which costs ~100x more than configuring the potential,
+        so they're only used for arguments that aren't plain positive numbers.
+
+        The registry and configuration classes aren't part of readdy's public API,
+        so if they aren't available, return no methods
+        and the public ones are used for every call.
+        """
+        try:
+            from readdy._internal.readdybinding.api import (
+                AnglePotentialConfiguration,
+                BondedPotentialConfiguration,
+                TorsionPotentialConfiguration,
+            )
+        except ImportError:
+            return {}
+        registry = getattr(topologies, "_registry", None)
+        if registry is None or not all(
+            hasattr(registry, name)
+            for name in (
+                "configure_bond_potential",
+                "configure_angle_potential",
+                "configure_torsion_potential",
+            )
+        ):
+            return {}
+
+        def fast(public_method, configure, make_config, n_types):
+            def method(*args, **kwargs):
+                values = args[n_types:]
+                if (
+                    len(kwargs) > 0
+                    or not all(isinstance(v, (int, float)) for v in values)
+                    or len(values) < 1
+                    or values[0] <= 0
+                ):
+                    return public_method(*args, **kwargs)
+                configure(*args[:n_types], make_config(*values))
+
+            return method
+
+        return {
+            ("topologies", "configure_harmonic_bond"): fast(
+                topologies.configure_harmonic_bond,
+                registry.configure_bond_potential,
+                lambda force_constant=1.0, length=1.0: BondedPotentialConfiguration(
+                    force_constant, length, "harmonic"
+                ),
+                2,
+            ),
+            ("topologies", "configure_harmonic_angle"): fast(
+                topologies.configure_harmonic_angle,
+                registry.configure_angle_potential,
+                lambda force_constant=1.0, angle=0.0: AnglePotentialConfiguration(
+                    force_constant, angle, "harmonic"
+                ),
+                3,
+            ),
+            ("topologies", "configure_cosine_dihedral"): fast(
+                topologies.configure_cosine_dihedral,
+                registry.configure_torsion_potential,
+                lambda force_constant=1.0, multiplicity=1, phi0=0.0: (
+                    TorsionPotentialConfiguration(
+                        force_constant, multiplicity, phi0, "cos_dihedral"
+                    )
+                ),
+                4,
+            ),
+        }
+
+    def save(self, file_path):
+        """
+        save the recorded calls to a JSON file.
+        """
+        tmp_path = file_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": SystemSpec.VERSION, "calls": self.calls}, f)
+        os.replace(tmp_path, file_path)
+
+    @staticmethod
+    def load(file_path):
+        """
+        load a spec saved with save(), or return None if it's from another version.
+        """
+        with open(file_path) as f:
+            data = json.load(f)
+        if data.get("version") != SystemSpec.VERSION:
+            return None
+        return SystemSpec(data["calls"])
+
+    @staticmethod
+    def key(parameters, ignored_parameters, sources):
+        """
+        get a hash of the parameters that can affect the spec
+        (all those not matching a pattern in ignored_parameters)
+        and of the source code of the classes in sources that build it.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        relevant = {
+            name: SystemSpec._plain(value)
+            for name, value in parameters.items()
+            if not any(fnmatchcase(name, pattern) for pattern in ignored_parameters)
+        }
+        digest.update(
+            json.dumps(
+                {"version": SystemSpec.VERSION, "parameters": relevant},
+                sort_keys=True,
+                default=str,
+            ).encode()
+        )
+        for source in sources:
+            with open(inspect.getsourcefile(source), "rb") as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    @staticmethod
+    def load_or_build(cache_path, key, build):
+        """
+        load the spec for key from the cache directory,
+        or call build(spec) to record it and save it there.
+        If cache_path is None, always build it.
+        """
+        file_path = None
+        if cache_path is not None:
+            file_path = os.path.join(cache_path, f"system_spec_{key}.json")
+            if os.path.isfile(file_path):
+                spec = SystemSpec.load(file_path)
+                if spec is not None:
+                    print(f"Loaded ReaDDy system spec from {file_path}")
+                    return spec
+        spec = SystemSpec()
+        build(spec)
+        if file_path is not None:
+            os.makedirs(cache_path, exist_ok=True)
+            spec.save(file_path)
+        return spec
+
+
+class _SystemSpecGroup:
+    """
+    Records calls to system.topologies or system.potentials.
+    """
+
+    def __init__(self, spec, group):
+        self._spec = spec
+        self._group = group
+
+    def __getattr__(self, method):
+        def record(*args, **kwargs):
+            self._spec.record(self._group, method, args, kwargs)
+
+        return record
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+from .particle_type_registry import ParticleTypeRegistry
+
+
+class TopologyIndex:
+    """
+    Lookup tables for the vertices of a ReaDDy topology,
+    built with one pass over the graph.
+
+    Build one at the start of a reaction function and pass it
+    as index to the ReaddyUtil vertex query helpers, so repeated queries
+    are dictionary lookups instead of scans over every vertex.
+    The topology can't change during a reaction function,
+    so the index is valid until the recipe is returned.
+    """
+
+    def __init__(self, topology):
+        self.topology = topology
+        self.vertices = topology.graph.get_vertices()
+        self._types = {}
+        self._ids = {}
+        self._order = {}
+        self.vertex_by_id = {}
+        self.vertices_by_type = {}
+        self.vertices_by_flag = {}
+        for order, vertex in enumerate(self.vertices):
+            index = vertex.particle_index
+            particle_type = topology.particle_type_of_vertex(vertex)
+            particle_id = topology.particle_id_of_vertex(vertex)
+            self._types[index] = particle_type
+            self._ids[index] = particle_id
+            self._order[index] = order
+            self.vertex_by_id[particle_id] = vertex
+            self.vertices_by_type.setdefault(particle_type, []).append(vertex)
+            for flag in ParticleTypeRegistry.get(particle_type).flags:
+                self.vertices_by_flag.setdefault(flag, []).append(vertex)
+
+    def type_of(self, vertex):
+        """
+        get the particle type of a vertex.
+        """
+        return self._types[vertex.particle_index]
+
+    def id_of(self, vertex):
+        """
+        get the particle id of a vertex.
+        """
+        return self._ids[vertex.particle_index]
+
+    def vertex_with_id(self, particle_id):
+        """
+        get the vertex for a particle id, or None if it's not in the topology.
+        """
+        return self.vertex_by_id.get(particle_id)
+
+    def vertices_with_flag(self, flag):
+        """
+        get all vertices with the given flag, in graph order.
+        """
+        return self.vertices_by_flag.get(flag, [])
+
+    def vertices_of_type(self, vertex_type, exact_match):
+        """
+        get all vertices with a given type, in graph order.
+        If not exact_match, get vertices whose type contains vertex_type.
+        """
+        if exact_match:
+            return self.vertices_by_type.get(vertex_type, [])
+        return self.vertices_of_types(
+            [t for t in self.vertices_by_type if vertex_type in t]
+        )
+
+    def vertices_of_types(self, vertex_types):
+        """
+        get all vertices with any of the given types, in graph order.
+        """
+        result = []
+        for vertex_type in set(vertex_types):
+            result += self.vertices_by_type.get(vertex_type, [])
+        result.sort(key=lambda vertex: self._order[vertex.particle_index])
+        return result
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+
+
+class TypeCatalogue:
+    """
+    Cached groups of particle type names.
+
+    Each group of types (e.g. every polymer number of a few actin types)
+    is built by formatting the names only the first time it's requested
+    for a key (e.g. the number of polymer numbers),
+    then kept as a tuple, for iterating in order,
+    and as a frozenset, for membership tests.
+    Reaction functions and analyses that need the same group
+    for every reaction or particle look it up instead of rebuilding it.
+    """
+
+    _ordered = {}
+    _members = {}
+
+    @staticmethod
+    def ordered(name, key, build):
+        """
+        get a tuple of the types in a group, in the order build() returns them,
+        calling build() only the first time for name and key.
+        """
+        result = TypeCatalogue._ordered.get((name, key))
+        if result is None:
+            result = tuple(build())
+            TypeCatalogue._ordered[(name, key)] = result
+        return result
+
+    @staticmethod
+    def members(name, key, build):
+        """
+        get a frozenset of the types in a group,
+        calling build() only the first time for name and key.
+        """
+        result = TypeCatalogue._members.get((name, key))
+        if result is None:
+            result = frozenset(TypeCatalogue.ordered(name, key, build))
+            TypeCatalogue._members[(name, key)] = result
+        return result
+
+    @staticmethod
+    def clear():
+        """
+        remove all the cached groups.
+        """
+        TypeCatalogue._ordered.clear()
+        TypeCatalogue._members.clear()
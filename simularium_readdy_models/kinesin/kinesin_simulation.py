@@ -3,13 +3,31 @@
 import numpy as np
 import readdy
 
-from ..common import ReaddyUtil
-from ..microtubules import MicrotubulesUtil
+from ..common import ReaddyUtil, SystemSpec
+from ..microtubules import MicrotubulesSeedLayout, MicrotubulesUtil
 from .kinesin_util import KinesinUtil
 
 
 class KinesinSimulation:
-    def __init__(self, parameters, record=False, save_checkpoints=False):
+    # parameters that only affect reactions or the initial state,
+    # not the particle types and constraints in the system spec
+    SPEC_IGNORED_PARAMETERS = [
+        "name",
+        "total_steps",
+        "timestep",
+        "n_cpu",
+        "verbose",
+        "*_rate",
+        "reaction_distance",
+        "*_reaction_distance",
+        "*_concentration",
+        "seed_*",
+        "kinesin_position_*",
+    ]
+
+    def __init__(
+        self, parameters, record=False, save_checkpoints=False, spec_cache_path=None
+    ):
         """
         Creates a ReaDDy kinesin simulation.
 
@@ -19,12 +37,17 @@ class KinesinSimulation:
         force_constant, grow_reaction_distance, attach_reaction_distance,
         n_cpu, tubulin_concentration, seed_n_rings, seed_n_frayed_rings_minus,
         seed_n_frayed_rings_plus, seed_position_offset_x, seed_position_offset_y,
-        seed_position_offset_z, tubulin_radius, protofilament_growth_GTP_rate,
+        seed_position_offset_z, seed_layout, seed_n_seeds, seed_layout_spacing,
+        seed_layout_path, tubulin_radius, protofilament_growth_GTP_rate,
         protofilament_growth_GDP_rate, protofilament_shrink_GTP_rate,
         protofilament_shrink_GDP_rate, ring_attach_GTP_rate, ring_attach_GDP_rate,
         ring_detach_GTP_rate, ring_detach_GDP_rate, hydrolyze_rate, verbose
+
+        spec_cache_path: directory to save the system's types and constraints to,
+        so later simulations with the same parameters can load them.
         """
         self.parameters = parameters
+        self.spec_cache_path = spec_cache_path
         self.kinesin_util = KinesinUtil(self.parameters)
         self.create_kinesin_system()
         self.simulation = ReaddyUtil.create_readdy_simulation(
@@ -46,11 +69,31 @@ class KinesinSimulation:
         self.system.temperature = self.parameters["temperature_K"]
         self.motor_types = ["motor#ADP", "motor#ATP", "motor#apo", "motor#new"]
         self.tubulin_types = ["tubulinA#", "tubulinB#", "tubulinB#bound_"]
-        self.add_kinesin_types()
-        self.add_kinesin_constraints()
+        self.system_spec = SystemSpec.load_or_build(
+            self.spec_cache_path, self.system_spec_key(), self.add_system_spec
+        )
+        self.system_spec.apply(self.system)
         self.add_kinesin_reactions()
 
-    def add_kinesin_types(self):
+    def system_spec_key(self):
+        """
+        Get the key for the system's types and constraints
+        from the parameters that can affect them.
+        """
+        return SystemSpec.key(
+            self.parameters,
+            KinesinSimulation.SPEC_IGNORED_PARAMETERS,
+            [KinesinSimulation, KinesinUtil, MicrotubulesUtil, ReaddyUtil],
+        )
+
+    def add_system_spec(self, system):
+        """
+        Add particle types and constraints to a ReaDDy system or SystemSpec.
+        """
+        self.add_kinesin_types(system)
+        self.add_kinesin_constraints(system)
+
+    def add_kinesin_types(self, system):
         """
         Add particle and topology types for kinesin particles
         to the ReaDDy system.
@@ -69,25 +112,25 @@ class KinesinSimulation:
         tubulin_diffCoeff = ReaddyUtil.calculate_diffusionCoefficient(
             self.parameters["tubulin_radius"], viscosity, temperature_K
         )  # nm^2/s
-        self.system.topologies.add_type("Kinesin")
-        self.system.topologies.add_type("Microtubule-Kinesin#ADP-ATP")
-        self.system.topologies.add_type("Microtubule-Kinesin#ADP-apo")
-        self.system.topologies.add_type("Microtubule-Kinesin#ATP-ATP")
-        self.system.topologies.add_type("Microtubule-Kinesin#ATP-apo")
-        self.system.topologies.add_type("Microtubule-Kinesin#apo-apo")
-        self.system.topologies.add_type("Microtubule-Kinesin#Binding")
-        self.system.topologies.add_type("Microtubule-Kinesin#Releasing")
-        self.system.add_topology_species("hips", hips_diffCoeff)
-        self.system.add_topology_species("cargo", cargo_diffCoeff)
+        system.topologies.add_type("Kinesin")
+        system.topologies.add_type("Microtubule-Kinesin#ADP-ATP")
+        system.topologies.add_type("Microtubule-Kinesin#ADP-apo")
+        system.topologies.add_type("Microtubule-Kinesin#ATP-ATP")
+        system.topologies.add_type("Microtubule-Kinesin#ATP-apo")
+        system.topologies.add_type("Microtubule-Kinesin#apo-apo")
+        system.topologies.add_type("Microtubule-Kinesin#Binding")
+        system.topologies.add_type("Microtubule-Kinesin#Releasing")
+        system.add_topology_species("hips", hips_diffCoeff)
+        system.add_topology_species("cargo", cargo_diffCoeff)
         for motor_type in self.motor_types:
-            self.system.add_topology_species(motor_type, motor_diffCoeff)
-        self.system.topologies.add_type("Microtubule")
+            system.add_topology_species(motor_type, motor_diffCoeff)
+        system.topologies.add_type("Microtubule")
         for tubulin_type in self.tubulin_types:
             MicrotubulesUtil.add_polymer_topology_species(
-                tubulin_type, tubulin_diffCoeff, self.system
+                tubulin_type, tubulin_diffCoeff, system
             )
 
-    def add_kinesin_constraints(self):
+    def add_kinesin_constraints(self, system):
         """
         Add geometric constraints for connected kinesin particles,
         including bonds, angles, and repulsions, to the ReaDDy system.
@@ -96,23 +139,23 @@ class KinesinSimulation:
         microtubule_force_constant = self.parameters["microtubules_force_constant"]
         util = ReaddyUtil()
         self.kinesin_util.add_kinesin_bonds_and_repulsions(
-            self.motor_types, force_constant, self.system, util
+            self.motor_types, force_constant, system, util
         )
         self.kinesin_util.add_kinesin_angles_and_dihedrals(
-            self.tubulin_types[-1:], force_constant, self.system, util
+            self.tubulin_types[-1:], force_constant, system, util
         )
         self.kinesin_util.add_tubulin_bonds_and_repulsions(
-            self.tubulin_types, microtubule_force_constant, self.system, util
+            self.tubulin_types, microtubule_force_constant, system, util
         )
         self.kinesin_util.add_angles_between_tubulins(
-            self.tubulin_types, microtubule_force_constant, self.system, util
+            self.tubulin_types, microtubule_force_constant, system, util
         )
         self.kinesin_util.add_motor_tubulin_interactions(
             self.motor_types,
             self.tubulin_types[-2:],
             self.tubulin_types,
             force_constant,
-            self.system,
+            system,
             util,
         )
 
@@ -130,15 +173,17 @@ class KinesinSimulation:
 
     def add_microtubule(self):
         """
-        Add a microtubule.
+        Add a microtubule at the origin or several in the seed layout.
         """
-        MicrotubulesUtil.add_microtubule(
-            int(self.parameters["microtubule_n_rings"]),
-            0,
-            0,
-            np.zeros(3),
+        seed = MicrotubulesUtil.get_seed(
+            int(self.parameters["microtubule_n_rings"]), 0, 0, False
+        )
+        MicrotubulesUtil.add_microtubules(
+            seed,
+            MicrotubulesSeedLayout.from_parameters(
+                self.parameters, seed, self.parameters["box_size"], np.zeros(3)
+            ),
             self.simulation,
-            False,
         )
 
     def add_kinesin(self):
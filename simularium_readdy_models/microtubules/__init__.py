@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 
 from .microtubules_analyzer import MicrotubulesAnalyzer  # noqa: F401
+from .microtubules_lattice import MicrotubulesLattice  # noqa: F401
 from .microtubules_reactions import MICROTUBULES_REACTIONS  # noqa: F401
+from .microtubules_seed import MicrotubulesSeed  # noqa: F401
+from .microtubules_seed_layout import MicrotubulesSeedLayout  # noqa: F401
 from .microtubules_simulation import MicrotubulesSimulation  # noqa: F401
 from .microtubules_util import MicrotubulesUtil  # noqa: F401
@@ -3,6 +3,7 @@
 import numpy as np
 
 from ..common import ReaddyUtil
+from .microtubules_lattice import MicrotubulesLattice
 from .microtubules_util import MicrotubulesUtil
 
 
@@ -10,41 +11,17 @@ class MicrotubulesAnalyzer:
     @staticmethod
     def get_protofilaments(frame_particle_data):
         """
-        get a list of the number of monomers in the closed part
-        of each protofilament at the time index.
+        get a list of the ids of the monomers in the closed part
+        of each protofilament at the time index, from minus to plus end.
         """
-        protofilaments = []
-
-        for particle_id in frame_particle_data["particles"]:
-            (
-                plus_end_neighbor_id,
-                minus_end_neighbor_id,
-            ) = MicrotubulesAnalyzer.get_plus_and_minus_end_neighbors(
-                particle_id,
-                frame_particle_data,
-            )
-
-            if plus_end_neighbor_id is None or minus_end_neighbor_id is not None:
-                continue
-            protofilament = [particle_id]
-            while plus_end_neighbor_id is not None:
-                protofilament.append(plus_end_neighbor_id)
-                (
-                    plus_end_neighbor_id,
-                    _,
-                ) = MicrotubulesAnalyzer.get_plus_and_minus_end_neighbors(
-                    plus_end_neighbor_id,
-                    frame_particle_data,
-                )
-            protofilaments.append(protofilament)
-        return protofilaments
+        return MicrotubulesLattice(frame_particle_data).protofilaments()
 
     @staticmethod
     def get_plus_and_minus_end_neighbors(
         particle_id,
         frame_particle_data,
     ):
-        tubulin_types = MicrotubulesUtil.get_all_tubulin_types()
+        tubulin_types = MicrotubulesUtil.tubulin_types()
 
         particle = frame_particle_data["particles"][particle_id]
 
@@ -103,7 +80,6 @@ class MicrotubulesAnalyzer:
         max_len = -1
         result = []
         for t in range(len(monomer_data)):
-            print(f"processing time step {t}")
             protofilaments = MicrotubulesAnalyzer.get_protofilaments(monomer_data[t])
             result.append([])
             for filament in protofilaments:
@@ -117,3 +93,38 @@ class MicrotubulesAnalyzer:
         ]
         result = np.transpose(np.array(result))
         return result
+
+    @staticmethod
+    def analyze_lattice_metrics(monomer_data, box_size=None, periodic_boundary=False):
+        """
+        Get the metrics of the tubulin lattice in each frame of the trajectory
+        (see MicrotubulesLattice), building each frame's lattice once:
+            lateral_bonds : number of lateral bonds
+            seam_bonds : number of lateral bonds at the seam
+            GTP_cap_lengths : GTP tubulins at the plus end of each protofilament
+            bent_fraction, straight_fraction : fractions of polymer tubulins
+            ring_closure : fraction of straight tubulins bonded on both sides
+            tip_taper : spread of the protofilament plus ends along the axis
+        """
+        result = {
+            "lateral_bonds": [],
+            "seam_bonds": [],
+            "GTP_cap_lengths": [],
+            "bent_fraction": [],
+            "straight_fraction": [],
+            "ring_closure": [],
+            "tip_taper": [],
+        }
+        for t in range(len(monomer_data)):
+            lattice = MicrotubulesLattice(monomer_data[t])
+            result["lateral_bonds"].append(lattice.lateral_bond_count())
+            result["seam_bonds"].append(lattice.seam_bond_count())
+            result["GTP_cap_lengths"].append(lattice.GTP_cap_lengths())
+            result["bent_fraction"].append(lattice.bent_fraction())
+            result["straight_fraction"].append(lattice.straight_fraction())
+            result["ring_closure"].append(lattice.ring_closure())
+            result["tip_taper"].append(lattice.tip_taper(box_size, periodic_boundary))
+        for metric in result:
+            if metric != "GTP_cap_lengths":
+                result[metric] = np.array(result[metric])
+        return result
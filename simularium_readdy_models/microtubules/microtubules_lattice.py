@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+
+import numpy as np
+
+from ..common import FrameData, ParticleTypeRegistry, ReaddyUtil
+from .microtubules_util import MicrotubulesUtil
+
+
+class MicrotubulesLattice:
+    """
+    The tubulin lattice in one frame of monomer data (dictionary or FrameData),
+    encoded as arrays indexed by particle row.
+
+    Each particle type in the frame is parsed once
+    (MicrotubulesUtil.get_polymer_indices, GTP and bent flags),
+    then the longitudinal and lateral neighbors of every tubulin
+    are found with array comparisons over the neighbor bonds,
+    so all the lattice metrics of a frame take one pass over its particles.
+
+    Polymer indices are "x_y" with x and y in [1, 3]:
+    the plus end neighbor of x_y is (x+1)_y (and y+1 when x wraps around),
+    and its lateral neighbors are x_(y+1) and x_(y-1).
+    """
+
+    def __init__(self, frame_particle_data):
+        self.frame_particle_data = frame_particle_data
+        (
+            self.ids,
+            type_names,
+            type_codes,
+            rows,
+            neighbor_rows,
+        ) = MicrotubulesLattice._get_frame_arrays(frame_particle_data)
+        tubulin_types = MicrotubulesUtil.tubulin_types()
+        type_is_polymer = np.zeros(len(type_names), dtype=bool)
+        type_is_neighbor = np.zeros(len(type_names), dtype=bool)
+        type_is_A = np.zeros(len(type_names), dtype=bool)
+        type_is_GTP = np.zeros(len(type_names), dtype=bool)
+        type_is_bent = np.zeros(len(type_names), dtype=bool)
+        type_indices = np.zeros((len(type_names), 2), dtype=int)
+        for code, type_name in enumerate(type_names):
+            type_is_polymer[code] = "tubulin" in type_name and "free" not in type_name
+            type_is_neighbor[code] = any(
+                tubulin_type in type_name for tubulin_type in tubulin_types
+            )
+            polymer_indices = MicrotubulesUtil.get_polymer_indices(type_name)
+            if len(polymer_indices) == 2:
+                type_indices[code] = polymer_indices
+            type_info = ParticleTypeRegistry.get(type_name)
+            type_is_A[code] = type_info.base == "tubulinA"
+            type_is_GTP[code] = type_info.has_flag("GTP")
+            type_is_bent[code] = type_info.has_flag("bent")
+        self.is_polymer = type_is_polymer[type_codes]
+        self.is_A = type_is_A[type_codes]
+        self.is_GTP = type_is_GTP[type_codes]
+        self.is_bent = type_is_bent[type_codes]
+        x = type_indices[type_codes, 0]
+        y = type_indices[type_codes, 1]
+        neighbor_x = x[neighbor_rows]
+        neighbor_y = y[neighbor_rows]
+        # longitudinal neighbors, the same as
+        # MicrotubulesAnalyzer.get_plus_and_minus_end_neighbors
+        is_neighbor = (
+            self.is_polymer[rows] & type_is_neighbor[type_codes][neighbor_rows]
+        )
+        plus_x = x % 3 + 1
+        plus_y = np.where(x == 3, y % 3 + 1, y)
+        minus_x = (x - 2) % 3 + 1
+        minus_y = np.where(x == 1, (y - 2) % 3 + 1, y)
+        self.plus_rows = MicrotubulesLattice._last_neighbor_rows(
+            rows,
+            neighbor_rows,
+            is_neighbor & (neighbor_x == plus_x[rows]) & (neighbor_y == plus_y[rows]),
+            len(self.ids),
+        )
+        self.minus_rows = MicrotubulesLattice._last_neighbor_rows(
+            rows,
+            neighbor_rows,
+            is_neighbor & (neighbor_x == minus_x[rows]) & (neighbor_y == minus_y[rows]),
+            len(self.ids),
+        )
+        # lateral bonds, each listed once from x_y to x_(y+1)
+        lateral = (
+            self.is_polymer[rows]
+            & self.is_polymer[neighbor_rows]
+            & (neighbor_x == x[rows])
+            & (neighbor_y == y[rows] % 3 + 1)
+        )
+        self.lateral_rows = rows[lateral]
+        self.lateral_neighbor_rows = neighbor_rows[lateral]
+        self._protofilament_rows = None
+
+    @staticmethod
+    def _get_frame_arrays(frame_particle_data):
+        """
+        get the particle ids, type names, type code for each particle,
+        and the neighbor bonds as rows -> neighbor rows (in neighbor order)
+        for a frame of monomer data.
+        """
+        if isinstance(frame_particle_data, FrameData):
+            return (
+                frame_particle_data.ids.tolist(),
+                frame_particle_data.type_names,
+                frame_particle_data.type_codes,
+                np.repeat(
+                    np.arange(len(frame_particle_data)),
+                    np.diff(frame_particle_data.neighbor_offsets),
+                ),
+                frame_particle_data.neighbor_rows,
+            )
+        particles = frame_particle_data["particles"]
+        ids = list(particles)
+        rows_by_id = {particle_id: row for row, particle_id in enumerate(ids)}
+        codes_by_name = {}
+        type_codes = []
+        rows = []
+        neighbor_rows = []
+        for row, particle in enumerate(particles.values()):
+            type_codes.append(
+                codes_by_name.setdefault(particle["type_name"], len(codes_by_name))
+            )
+            for neighbor_id in particle["neighbor_ids"]:
+                if neighbor_id in rows_by_id:
+                    rows.append(row)
+                    neighbor_rows.append(rows_by_id[neighbor_id])
+        return (
+            ids,
+            list(codes_by_name),
+            np.array(type_codes, dtype=int),
+            np.array(rows, dtype=int),
+            np.array(neighbor_rows, dtype=int),
+        )
+
+    @staticmethod
+    def _last_neighbor_rows(rows, neighbor_rows, matches, n_particles):
+        """
+        get the row of the last matching neighbor of each particle
+        (-1 if none) given the bonds from rows to neighbor_rows.
+        """
+        result = np.full(n_particles, -1, dtype=int)
+        matching_rows = rows[matches][::-1]
+        matching_neighbor_rows = neighbor_rows[matches][::-1]
+        unique_rows, last_index = np.unique(matching_rows, return_index=True)
+        result[unique_rows] = matching_neighbor_rows[last_index]
+        return result
+
+    def positions_for_rows(self, rows):
+        """
+        get the (N, 3) positions of the particles at the given rows.
+        """
+        if isinstance(self.frame_particle_data, FrameData):
+            return self.frame_particle_data.positions[rows]
+        particles = self.frame_particle_data["particles"]
+        return np.array(
+            [particles[self.ids[row]]["position"] for row in rows], dtype=float
+        ).reshape(-1, 3)
+
+    def protofilament_rows(self):
+        """
+        get an array of the rows of the tubulins in the closed part
+        of each protofilament, from minus to plus end.
+        """
+        if self._protofilament_rows is not None:
+            return self._protofilament_rows
+        self._protofilament_rows = []
+        starts = np.flatnonzero((self.plus_rows >= 0) & (self.minus_rows < 0))
+        plus_rows = self.plus_rows.tolist()
+        for row in starts.tolist():
+            protofilament = [row]
+            row = plus_rows[row]
+            # stop at the number of particles in case the neighbors form a loop
+            while row >= 0 and len(protofilament) <= len(self.ids):
+                protofilament.append(row)
+                row = plus_rows[row]
+            self._protofilament_rows.append(np.array(protofilament, dtype=int))
+        return self._protofilament_rows
+
+    def protofilaments(self):
+        """
+        get a list of the ids of the tubulins in the closed part
+        of each protofilament, from minus to plus end.
+        """
+        return [
+            [self.ids[row] for row in rows.tolist()]
+            for rows in self.protofilament_rows()
+        ]
+
+    def lateral_bond_count(self):
+        """
+        get the number of lateral bonds between tubulins.
+        """
+        return len(self.lateral_rows)
+
+    def seam_bond_count(self):
+        """
+        get the number of lateral bonds at the seam,
+        where tubulinA is bonded to tubulinB.
+        """
+        return int(
+            np.count_nonzero(
+                self.is_A[self.lateral_rows] != self.is_A[self.lateral_neighbor_rows]
+            )
+        )
+
+    def GTP_cap_lengths(self):
+        """
+        get the number of GTP tubulins in a row at the plus end
+        of each protofilament.
+        """
+        result = []
+        for rows in self.protofilament_rows():
+            is_GTP = np.append(self.is_GTP[rows][::-1], False)
+            result.append(int(np.argmin(is_GTP)))
+        return result
+
+    def bent_fraction(self):
+        """
+        get the fraction of polymer tubulins that are bent.
+        """
+        n_polymer = np.count_nonzero(self.is_polymer)
+        if n_polymer < 1:
+            return 0.0
+        return np.count_nonzero(self.is_polymer & self.is_bent) / n_polymer
+
+    def straight_fraction(self):
+        """
+        get the fraction of polymer tubulins that are straight (not bent).
+        """
+        n_polymer = np.count_nonzero(self.is_polymer)
+        if n_polymer < 1:
+            return 0.0
+        return np.count_nonzero(self.is_polymer & ~self.is_bent) / n_polymer
+
+    def ring_closure(self):
+        """
+        get the fraction of straight polymer tubulins
+        with lateral neighbors on both sides.
+        """
+        straight = self.is_polymer & ~self.is_bent
+        n_straight = np.count_nonzero(straight)
+        if n_straight < 1:
+            return 0.0
+        n_lateral = np.bincount(
+            np.concatenate([self.lateral_rows, self.lateral_neighbor_rows]),
+            minlength=len(self.ids),
+        )
+        return np.count_nonzero(straight & (n_lateral >= 2)) / n_straight
+
+    def tip_taper(self, box_size=None, periodic_boundary=False):
+        """
+        get the distance along the microtubule axis
+        between the plus ends of the longest and shortest protofilaments.
+        The axis is the average direction of the protofilaments
+        from minus to plus end.
+        """
+        protofilament_rows = self.protofilament_rows()
+        if len(protofilament_rows) < 2:
+            return 0.0
+        minus_ends = []
+        plus_ends = []
+        for rows in protofilament_rows:
+            positions = self.positions_for_rows(rows)
+            if periodic_boundary:
+                start_position = minus_ends[0] if len(minus_ends) > 0 else None
+                positions = ReaddyUtil.get_non_periodic_boundary_chain(
+                    positions, box_size, start_position
+                )
+            minus_ends.append(positions[0])
+            plus_ends.append(positions[-1])
+        axis = ReaddyUtil.normalize(np.sum(np.array(plus_ends) - minus_ends, axis=0))
+        plus_end_heights = np.dot(np.array(plus_ends), axis)
+        return float(np.max(plus_end_heights) - np.min(plus_end_heights))
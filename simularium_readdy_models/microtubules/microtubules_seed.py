@@ -0,0 +1,357 @@
+#!/usr/bin/env python
+
+import random
+
+import numpy as np
+
+
+class MicrotubulesSeed:
+    """
+    The particles and edges of a seed microtubule, generated with arrays.
+
+    The particles are ordered by protofilament, then by ring from minus
+    to plus end, with the 5 site particles of each bent (or edge) ring
+    right after its tubulin,
+    the same as MicrotubulesUtil.get_microtubule_positions_and_types.
+    Positions (N x 3), the GTP and GDP version of each particle type
+    (as codes into type_names) and edges (E x 2 particle indices)
+    are calculated once for the seed geometry,
+    so get() returns the same seed for every microtubule with that geometry
+    and only the GTP state of each ring is drawn for each new microtubule.
+    """
+
+    SITES_PER_SCAFFOLD = 5
+    # pairs of (tubulin, site0, ... site4) bonded in a bent ring
+    SCAFFOLD_EDGES = (
+        (0, 1),
+        (0, 2),
+        (0, 3),
+        (0, 4),
+        (0, 5),
+        (1, 2),
+        (1, 3),
+        (1, 4),
+        (1, 5),
+        (2, 4),
+        (2, 5),
+        (3, 4),
+        (3, 5),
+    )
+    # pairs of (site in a bent ring, site in the previous ring)
+    BENT_RING_EDGES = ((1, 1), (2, 2), (3, 3), (4, 5))
+
+    _seeds = {}
+    _edges = {}
+
+    def __init__(
+        self,
+        n_filaments,
+        n_rings,
+        n_frayed_rings_plus,
+        n_frayed_rings_minus,
+        frayed_angle,
+        radius,
+        use_GTP=True,
+    ):
+        self.n_filaments = n_filaments
+        self.n_rings = n_rings
+        bent, edge = MicrotubulesSeed._get_bent_and_edge_rings(
+            n_rings, n_frayed_rings_plus, n_frayed_rings_minus
+        )
+        mask = MicrotubulesSeed._get_particle_mask(bent | edge)
+        self.positions = MicrotubulesSeed._get_positions(
+            n_filaments,
+            n_rings,
+            n_frayed_rings_minus,
+            frayed_angle,
+            radius,
+            bent | edge,
+            edge,
+        )[:, mask].reshape(-1, 3)
+        (
+            self.type_names,
+            GTP_type_codes,
+            GDP_type_codes,
+        ) = MicrotubulesSeed._get_type_codes(n_filaments, n_rings, bent, edge, use_GTP)
+        self.GTP_type_codes = GTP_type_codes[:, mask].ravel()
+        self.GDP_type_codes = GDP_type_codes[:, mask].ravel()
+        ring_rows = np.arange(n_filaments * n_rings).reshape(n_filaments, n_rings)
+        self.ring_rows = np.repeat(ring_rows[:, :, np.newaxis], mask.shape[1], axis=2)[
+            :, mask
+        ].ravel()
+        ring = np.arange(n_rings)
+        self.GTP_thresholds = np.tile(
+            (ring - n_rings / 3.0) / (n_rings / 3.0), n_filaments
+        )
+        self.edges = MicrotubulesSeed.get_edges(
+            n_filaments, n_rings, n_frayed_rings_plus, n_frayed_rings_minus
+        )
+        for array in [
+            self.positions,
+            self.GTP_type_codes,
+            self.GDP_type_codes,
+            self.ring_rows,
+            self.GTP_thresholds,
+        ]:
+            array.setflags(write=False)
+
+    @staticmethod
+    def get(
+        n_filaments,
+        n_rings,
+        n_frayed_rings_plus,
+        n_frayed_rings_minus,
+        frayed_angle,
+        radius,
+        use_GTP=True,
+    ):
+        """
+        get the seed with the given geometry,
+        generating it only the first time it's requested.
+        """
+        key = (
+            n_filaments,
+            n_rings,
+            n_frayed_rings_plus,
+            n_frayed_rings_minus,
+            float(frayed_angle),
+            float(radius),
+            use_GTP,
+        )
+        if key not in MicrotubulesSeed._seeds:
+            MicrotubulesSeed._seeds[key] = MicrotubulesSeed(*key)
+        return MicrotubulesSeed._seeds[key]
+
+    @staticmethod
+    def _get_bent_and_edge_rings(n_rings, n_frayed_rings_plus, n_frayed_rings_minus):
+        """
+        get whether each ring is bent outward
+        and whether it is the straight ring next to the bent rings at each end.
+        """
+        ring = np.arange(n_rings)
+        bent = (ring < n_frayed_rings_minus) | (
+            ring > n_rings - 1 - n_frayed_rings_plus
+        )
+        edge = np.zeros(n_rings, dtype=bool)
+        if n_frayed_rings_minus + n_frayed_rings_plus > 0:
+            edge = (ring == n_frayed_rings_minus) | (
+                ring == n_rings - 1 - n_frayed_rings_plus
+            )
+        return bent, edge
+
+    @staticmethod
+    def _get_particle_mask(scaffold):
+        """
+        get an (n_rings x 6) mask of which of (tubulin, site0, ... site4)
+        are particles in each ring, only rings with a scaffold have sites.
+        """
+        return np.concatenate(
+            [
+                np.ones((len(scaffold), 1), dtype=bool),
+                np.repeat(
+                    scaffold[:, np.newaxis], MicrotubulesSeed.SITES_PER_SCAFFOLD, axis=1
+                ),
+            ],
+            axis=1,
+        )
+
+    @staticmethod
+    def _get_positions(
+        n_filaments,
+        n_rings,
+        n_frayed_rings_minus,
+        frayed_angle,
+        radius,
+        scaffold,
+        edge,
+    ):
+        """
+        get an (n_filaments x n_rings x 6 x 3) array of the positions
+        of (tubulin, site0, ... site4) in each ring,
+        whether or not the sites are in the microtubule.
+        """
+        # outward shift of the microtubule for the bent rings at - end
+        angle = (np.arange(n_frayed_rings_minus) + 0.5) * frayed_angle
+        quad = np.floor(angle / (np.pi / 2))
+        acute_angle = angle % (np.pi / 2)
+        frayed_y_pos = np.sum(
+            np.where(quad > 1, -1.0, 1.0)
+            * 4
+            * np.where(quad % 2 == 0, np.sin(acute_angle), np.cos(acute_angle))
+        )
+        filament = np.arange(n_filaments)
+        tube_angle = (n_filaments - filament) * 2.0 * np.pi / n_filaments + np.pi / 2.0
+        tube_normal = np.stack(
+            [np.cos(tube_angle), np.sin(tube_angle), np.zeros(n_filaments)], axis=1
+        )
+        tube_tangent = np.array([0.0, 0.0, 1.0])
+        side = np.cross(tube_normal, tube_tangent)
+        # the tangent and normal of each ring are rotated around side
+        # by the bend of the rings before it,
+        # and the next ring is placed along the tangent after its bend
+        bend = np.zeros(n_rings)
+        start_angle = 0.0
+        if np.any(scaffold):
+            bend = np.where(scaffold, np.where(edge, 0.5, 1.0), 0.0) * frayed_angle
+            start_angle = (n_frayed_rings_minus + 0.5) * frayed_angle
+        bend_angle = start_angle - np.concatenate([[0.0], np.cumsum(bend)])
+        tube_normal = tube_normal[:, np.newaxis, :]
+        cos = np.cos(bend_angle)[np.newaxis, :, np.newaxis]
+        sin = np.sin(bend_angle)[np.newaxis, :, np.newaxis]
+        tangents = cos * tube_tangent - sin * tube_normal
+        normal = (cos * tube_normal + sin * tube_tangent)[:, :-1]
+        tangent = tangents[:, :-1]
+        start = (radius + frayed_y_pos) * tube_normal + (
+            12.0 / 13.0 * filament - 2.0 * n_rings
+        )[:, np.newaxis, np.newaxis] * tube_tangent
+        position = start + 4.0 * np.concatenate(
+            [np.zeros((n_filaments, 1, 3)), np.cumsum(tangents[:, 1:-1], axis=1)],
+            axis=1,
+        )
+        side = side[:, np.newaxis, :]
+        return np.stack(
+            [
+                position,
+                position + 1.5 * normal,
+                position - 1.5 * side,
+                position + 1.5 * side,
+                position - 1.5 * tangent,
+                position + 1.5 * tangent,
+            ],
+            axis=2,
+        )
+
+    @staticmethod
+    def _get_type_codes(n_filaments, n_rings, bent, edge, use_GTP):
+        """
+        get a tuple of type names and (n_filaments x n_rings x 6) arrays
+        of the codes for the GTP and GDP types
+        of (tubulin, site0, ... site4) in each ring.
+        """
+        type_names = []
+        codes = {}
+
+        def code(type_name):
+            if type_name not in codes:
+                codes[type_name] = len(type_names)
+                type_names.append(type_name)
+            return codes[type_name]
+
+        # the tubulin type depends on the ring and on the protofilament,
+        # the site types only on the ring
+        tubulin_codes = np.zeros((2, n_rings, 3), dtype=int)
+        site_codes = np.zeros(
+            (2, n_rings, MicrotubulesSeed.SITES_PER_SCAFFOLD), dtype=int
+        )
+        for state_index, GTP_state in enumerate(["GTP", "GDP"]):
+            tub_GTP_state = GTP_state + "_" if use_GTP else ""
+            for ring in range(n_rings):
+                tub_type = "A" if ring % 2 == 0 else "B"
+                bent_type = "bent_" if bent[ring] else ""
+                for number2 in range(1, 4):
+                    tubulin_codes[state_index, ring, number2 - 1] = code(
+                        f"tubulin{tub_type}#{tub_GTP_state}{bent_type}"
+                        f"{ring % 3 + 1}_{number2}"
+                    )
+                site_state = f"_{GTP_state}" if not edge[ring] else ""
+                end_site_state = f"_{GTP_state}" if ring == n_rings - 1 else ""
+                site_codes[state_index, ring] = [
+                    code("site#out"),
+                    code(f"site#1{site_state}"),
+                    code(f"site#2{site_state}"),
+                    code("site#3"),
+                    code(f"site#4{end_site_state}"),
+                ]
+        filament = np.arange(n_filaments)[:, np.newaxis]
+        ring = np.arange(n_rings)
+        number2_index = (filament + ring // 3) % 3
+        result = []
+        for state_index in range(2):
+            state_codes = np.zeros((n_filaments, n_rings, 6), dtype=int)
+            state_codes[:, :, 0] = tubulin_codes[state_index, ring, number2_index]
+            state_codes[:, :, 1:] = site_codes[state_index]
+            result.append(state_codes)
+        return tuple(type_names), result[0], result[1]
+
+    @staticmethod
+    def get_edges(n_filaments, n_rings, n_frayed_rings_plus, n_frayed_rings_minus):
+        """
+        get an (E x 2) array of the particle indices bonded in a microtubule
+            with n_filaments protofilaments
+            and n_rings rings
+            and n_frayed_rings_plus rings at + end with outward bend
+            and n_frayed_rings_minus rings at - end with outward bend.
+        """
+        key = (n_filaments, n_rings, n_frayed_rings_plus, n_frayed_rings_minus)
+        if key in MicrotubulesSeed._edges:
+            return MicrotubulesSeed._edges[key]
+        bent, edge = MicrotubulesSeed._get_bent_and_edge_rings(
+            n_rings, n_frayed_rings_plus, n_frayed_rings_minus
+        )
+        scaffold = bent | edge
+        mask = MicrotubulesSeed._get_particle_mask(scaffold)
+        rows = np.full((n_filaments,) + mask.shape, -1, dtype=int)
+        rows[:, mask] = np.arange(n_filaments * np.count_nonzero(mask)).reshape(
+            n_filaments, -1
+        )
+        tubulin_rows = rows[:, :, 0]
+        edges = [
+            # bonds along each protofilament
+            np.stack([tubulin_rows[:, :-1], tubulin_rows[:, 1:]], axis=-1),
+            # bonds along each straight ring
+            np.stack([tubulin_rows[:-1, ~bent], tubulin_rows[1:, ~bent]], axis=-1),
+        ]
+        # bonds across the seam, 3 rings apart,
+        # as long as not in + end overhang
+        ring = np.arange(n_rings)
+        seam = ~bent & (ring <= n_rings - 4 - n_frayed_rings_plus)
+        edges.append(
+            np.stack([tubulin_rows[-1, seam], tubulin_rows[0, ring[seam] + 3]], axis=-1)
+        )
+        # bonds between each tubulin and its sites
+        for index1, index2 in MicrotubulesSeed.SCAFFOLD_EDGES:
+            edges.append(
+                np.stack(
+                    [rows[:, scaffold, index1], rows[:, scaffold, index2]], axis=-1
+                )
+            )
+        # bonds between the sites of bent rings along each protofilament
+        bent_ring = (ring > 0) & (
+            bent | (edge & (n_frayed_rings_minus > 0) & (ring == n_frayed_rings_minus))
+        )
+        for index1, index2 in MicrotubulesSeed.BENT_RING_EDGES:
+            edges.append(
+                np.stack(
+                    [
+                        rows[:, bent_ring, index1],
+                        rows[:, np.flatnonzero(bent_ring) - 1, index2],
+                    ],
+                    axis=-1,
+                )
+            )
+        result = np.concatenate([e.reshape(-1, 2) for e in edges])
+        result.setflags(write=False)
+        MicrotubulesSeed._edges[key] = result
+        return result
+
+    def type_codes(self):
+        """
+        get a random type code for each particle,
+        drawing whether each ring of each protofilament has GTP
+        (more likely toward the + end).
+        """
+        draws = np.array([random.random() for _ in range(len(self.GTP_thresholds))])
+        is_GTP = draws <= self.GTP_thresholds
+        return np.where(
+            is_GTP[self.ring_rows], self.GTP_type_codes, self.GDP_type_codes
+        )
+
+    def types(self, type_codes=None):
+        """
+        get a list of the type name of each particle for type codes
+        (random type codes if None).
+        """
+        if type_codes is None:
+            type_codes = self.type_codes()
+        type_names = np.array(self.type_names, dtype=object)
+        return type_names[type_codes].tolist()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+import itertools
+import math
+
+import numpy as np
+
+
+class MicrotubulesSeedLayout:
+    """
+    Position offsets for many seed microtubules in a box
+    that don't overlap.
+
+    All the seeds have the same geometry (a MicrotubulesSeed),
+    so each seed is its bounding box plus spacing moved by its offset.
+    Placed seeds are kept in a spatial hash of cells the size of a seed,
+    so checking whether a new seed overlaps only compares it
+    to the seeds in the cells around it.
+    Seeds are kept inside the box, not wrapped across its periodic boundary.
+    """
+
+    LAYOUTS = ("single", "grid", "random", "file")
+
+    def __init__(self, seed, box_size, spacing=0.0):
+        self.seed_min = np.min(seed.positions, axis=0) - spacing / 2.0
+        self.seed_max = np.max(seed.positions, axis=0) + spacing / 2.0
+        self.box_size = np.asarray(box_size, dtype=float) * np.ones(3)
+        # range of offsets that keep the seed inside the box
+        self.min_offset = -self.box_size / 2.0 - self.seed_min
+        self.max_offset = self.box_size / 2.0 - self.seed_max
+        if np.any(self.min_offset > self.max_offset):
+            raise Exception(
+                f"Microtubule seed of size {self.seed_max - self.seed_min} "
+                f"does not fit in box of size {self.box_size}"
+            )
+        self.cell_size = self.seed_max - self.seed_min
+        self.cells = {}
+        self.offsets = []
+
+    def _cell(self, offset):
+        """
+        get the spatial hash cell for a seed offset.
+        """
+        return tuple(np.floor(offset / self.cell_size).astype(int).tolist())
+
+    def fits(self, offset):
+        """
+        check if a seed at offset is inside the box
+        and doesn't overlap any of the placed seeds.
+        """
+        if np.any(offset < self.min_offset) or np.any(offset > self.max_offset):
+            return False
+        cell = self._cell(offset)
+        # seeds in cells further than one cell away can't overlap
+        for delta in itertools.product((-1, 0, 1), repeat=3):
+            neighbor_cell = (cell[0] + delta[0], cell[1] + delta[1], cell[2] + delta[2])
+            for index in self.cells.get(neighbor_cell, []):
+                # seeds that only touch (within rounding) don't overlap
+                distance = np.abs(self.offsets[index] - offset)
+                if np.all(distance < self.cell_size - 1e-6):
+                    return False
+        return True
+
+    def add(self, offset):
+        """
+        place a seed at offset if it fits,
+        return whether it was placed.
+        """
+        offset = np.asarray(offset, dtype=float)
+        if not self.fits(offset):
+            return False
+        self.cells.setdefault(self._cell(offset), []).append(len(self.offsets))
+        self.offsets.append(offset)
+        return True
+
+    @staticmethod
+    def grid(seed, n_seeds, box_size, spacing=0.0):
+        """
+        get an (n_seeds x 3) array of offsets for seeds
+        in a square grid perpendicular to the seed axis (z),
+        centered in the box.
+        """
+        layout = MicrotubulesSeedLayout(seed, box_size, spacing)
+        n_columns = math.ceil(math.sqrt(n_seeds))
+        n_rows = math.ceil(n_seeds / n_columns)
+        center = -(layout.seed_min + layout.seed_max) / 2.0
+        for index in range(n_seeds):
+            grid_position = np.array(
+                [
+                    index % n_columns - (n_columns - 1) / 2.0,
+                    index // n_columns - (n_rows - 1) / 2.0,
+                    0.0,
+                ]
+            )
+            offset = center + grid_position * layout.cell_size
+            if not layout.add(offset):
+                raise Exception(
+                    f"{n_seeds} microtubule seeds in a {n_columns} x {n_rows} grid "
+                    f"do not fit in box of size {layout.box_size}"
+                )
+        return np.array(layout.offsets)
+
+    @staticmethod
+    def random(seed, n_seeds, box_size, spacing=0.0, max_attempts=1000):
+        """
+        get an (n_seeds x 3) array of offsets for seeds
+        at random positions in the box that don't overlap,
+        trying at most max_attempts random positions per seed.
+        """
+        layout = MicrotubulesSeedLayout(seed, box_size, spacing)
+        for _ in range(n_seeds):
+            for _ in range(max_attempts):
+                offset = np.random.uniform(layout.min_offset, layout.max_offset)
+                if layout.add(offset):
+                    break
+            else:
+                raise Exception(
+                    f"Placed only {len(layout.offsets)} of {n_seeds} "
+                    "non-overlapping microtubule seeds "
+                    f"in box of size {layout.box_size}"
+                )
+        return np.array(layout.offsets)
+
+    @staticmethod
+    def from_file(path, seed, box_size, spacing=0.0):
+        """
+        get an array of offsets for seeds
+        read from a text file with "x, y, z" for each seed on each line,
+        checking that the seeds don't overlap.
+        """
+        layout = MicrotubulesSeedLayout(seed, box_size, spacing)
+        for offset in np.loadtxt(path, delimiter=",", ndmin=2):
+            if not layout.add(offset):
+                raise Exception(
+                    f"Microtubule seed at {offset} from {path} "
+                    "overlaps another seed or is outside the box"
+                )
+        return np.array(layout.offsets)
+
+    @staticmethod
+    def from_parameters(parameters, seed, box_size, position_offset):
+        """
+        get an array of offsets for seeds from the parameters:
+        seed_layout (one of LAYOUTS, "single" if not set),
+        seed_n_seeds, seed_layout_spacing and seed_layout_path.
+        A "single" seed is at position_offset.
+        """
+        layout = parameters.get("seed_layout", "single")
+        if layout not in MicrotubulesSeedLayout.LAYOUTS:
+            raise Exception(
+                f"Microtubule seed layout {layout} is not one of "
+                f"{MicrotubulesSeedLayout.LAYOUTS}"
+            )
+        if layout == "single":
+            return np.array([position_offset], dtype=float)
+        spacing = float(parameters.get("seed_layout_spacing", 0.0))
+        if layout == "file":
+            return MicrotubulesSeedLayout.from_file(
+                parameters["seed_layout_path"], seed, box_size, spacing
+            )
+        n_seeds = int(parameters["seed_n_seeds"])
+        if layout == "grid":
+            return MicrotubulesSeedLayout.grid(seed, n_seeds, box_size, spacing)
+        return MicrotubulesSeedLayout.random(seed, n_seeds, box_size, spacing)
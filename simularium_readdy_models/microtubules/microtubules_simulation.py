@@ -3,12 +3,29 @@
 import numpy as np
 import readdy
 
-from ..common import ReaddyUtil
+from ..common import ReaddyUtil, SystemSpec
+from .microtubules_seed_layout import MicrotubulesSeedLayout
 from .microtubules_util import MicrotubulesUtil
 
 
 class MicrotubulesSimulation:
-    def __init__(self, parameters, record=False, save_checkpoints=False):
+    # parameters that only affect reactions or the initial state,
+    # not the particle types and constraints in the system spec
+    SPEC_IGNORED_PARAMETERS = [
+        "name",
+        "total_steps",
+        "timestep",
+        "n_cpu",
+        "verbose",
+        "*_rate",
+        "*_reaction_distance",
+        "*_concentration",
+        "seed_*",
+    ]
+
+    def __init__(
+        self, parameters, record=False, save_checkpoints=False, spec_cache_path=None
+    ):
         """
         Creates a ReaDDy microtubules simulation.
 
@@ -20,12 +37,17 @@ class MicrotubulesSimulation:
         force_constant, grow_reaction_distance, attach_reaction_distance,
         n_cpu, tubulin_concentration, seed_n_rings, seed_n_frayed_rings_minus,
         seed_n_frayed_rings_plus, seed_position_offset_x, seed_position_offset_y,
-        seed_position_offset_z, tubulin_radius, protofilament_growth_GTP_rate,
+        seed_position_offset_z, seed_layout, seed_n_seeds, seed_layout_spacing,
+        seed_layout_path, tubulin_radius, protofilament_growth_GTP_rate,
         protofilament_growth_GDP_rate, protofilament_shrink_GTP_rate,
         protofilament_shrink_GDP_rate, ring_attach_GTP_rate, ring_attach_GDP_rate,
         ring_detach_GTP_rate, ring_detach_GDP_rate, hydrolyze_rate, verbose
+
+        spec_cache_path: directory to save the system's types and constraints to,
+        so later simulations with the same parameters can load them.
         """
         self.parameters = parameters
+        self.spec_cache_path = spec_cache_path
         self.microtubules_util = MicrotubulesUtil(self.parameters)
         self.create_microtubules_system()
         self.simulation = ReaddyUtil.create_readdy_simulation(
@@ -45,11 +67,31 @@ class MicrotubulesSimulation:
         self.system = readdy.ReactionDiffusionSystem(self.parameters["box_size"])
         self.parameters["temperature_K"] = self.parameters["temperature_C"] + 273.15
         self.system.temperature = self.parameters["temperature_K"]
-        self.add_microtubules_types()
-        self.add_microtubules_constraints()
+        self.system_spec = SystemSpec.load_or_build(
+            self.spec_cache_path, self.system_spec_key(), self.add_system_spec
+        )
+        self.system_spec.apply(self.system)
         self.add_microtubules_reactions()
 
-    def add_microtubules_types(self):
+    def system_spec_key(self):
+        """
+        Get the key for the system's types and constraints
+        from the parameters that can affect them.
+        """
+        return SystemSpec.key(
+            self.parameters,
+            MicrotubulesSimulation.SPEC_IGNORED_PARAMETERS,
+            [MicrotubulesSimulation, MicrotubulesUtil, ReaddyUtil],
+        )
+
+    def add_system_spec(self, system):
+        """
+        Add particle types and constraints to a ReaDDy system or SystemSpec.
+        """
+        self.add_microtubules_types(system)
+        self.add_microtubules_constraints(system)
+
+    def add_microtubules_types(self, system):
         """
         Add particle and topology types for microtubules particles
         to the ReaDDy system.
@@ -59,9 +101,9 @@ class MicrotubulesSimulation:
             self.parameters["viscosity"],
             self.parameters["temperature_K"],
         )  # nm^2/s
-        self.microtubules_util.add_tubulin_types(self.system, tubulin_diffCoeff)
+        self.microtubules_util.add_tubulin_types(system, tubulin_diffCoeff)
 
-    def add_microtubules_constraints(self):
+    def add_microtubules_constraints(self, system):
         """
         Add geometric constraints for connected microtubules particles,
         including bonds, angles, and repulsions, to the ReaDDy system.
@@ -99,31 +141,31 @@ class MicrotubulesSimulation:
         ]
         # bonds
         self.microtubules_util.add_bonds_between_tubulins(
-            all_tubulin_types, 1.2 * force_constant, self.system, util
+            all_tubulin_types, 1.2 * force_constant, system, util
         )
         self.microtubules_util.add_tubulin_site_bonds(
-            all_tubulin_types, site_types, force_constant, self.system, util
+            all_tubulin_types, site_types, force_constant, system, util
         )
-        self.microtubules_util.add_bent_site_bonds(force_constant, self.system, util)
+        self.microtubules_util.add_bent_site_bonds(force_constant, system, util)
         # angles
         self.microtubules_util.add_angles_between_tubulins(
             [tube_tubulin_types, bent_tubulin_types, all_tubulin_types],
             1.2 * force_constant,
-            self.system,
+            system,
             util,
         )
         self.microtubules_util.add_tubulin_site_angles(
-            all_tubulin_types, force_constant, self.system, util
+            all_tubulin_types, force_constant, system, util
         )
         self.microtubules_util.add_bent_site_angles(
-            all_tubulin_types, force_constant, self.system, util
+            all_tubulin_types, force_constant, system, util
         )
         self.microtubules_util.add_edge_site_angles(
-            all_tubulin_types, force_constant, self.system, util
+            all_tubulin_types, force_constant, system, util
         )
         # repulsions
         self.microtubules_util.add_polymer_repulsion(
-            all_tubulin_types, force_constant, 4.2, self.system, util
+            all_tubulin_types, force_constant, 4.2, system, util
         )
 
     def add_microtubules_reactions(self):
@@ -149,18 +191,27 @@ class MicrotubulesSimulation:
 
     def add_microtubule_seed(self):
         """
-        Add a microtubule seed.
+        Add microtubule seeds, one at the seed position offset
+        or several in the seed layout.
         """
-        self.microtubules_util.add_microtubule(
+        seed = self.microtubules_util.get_seed(
             int(self.parameters["seed_n_rings"]),
             int(self.parameters["seed_n_frayed_rings_minus"]),
             int(self.parameters["seed_n_frayed_rings_plus"]),
-            np.array(
-                [
-                    self.parameters["seed_position_offset_x"],
-                    self.parameters["seed_position_offset_y"],
-                    self.parameters["seed_position_offset_z"],
-                ]
+        )
+        self.microtubules_util.add_microtubules(
+            seed,
+            MicrotubulesSeedLayout.from_parameters(
+                self.parameters,
+                seed,
+                self.parameters["box_size"],
+                np.array(
+                    [
+                        self.parameters["seed_position_offset_x"],
+                        self.parameters["seed_position_offset_y"],
+                        self.parameters["seed_position_offset_z"],
+                    ]
+                ),
             ),
             self.simulation,
         )
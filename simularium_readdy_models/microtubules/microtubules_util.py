@@ -1,13 +1,13 @@
 #!/usr/bin/env python
 
-import copy
 import math
 import random
 
 import numpy as np
 import readdy
 
-from ..common import ReaddyUtil
+from ..common import ParticleTypeRegistry, ReaddyUtil, TopologyIndex, TypeCatalogue
+from .microtubules_seed import MicrotubulesSeed
 
 parameters = {}
 
@@ -30,15 +30,21 @@ class MicrotubulesUtil:
 
     @staticmethod
     def get_random_tubulin_neighbors(
-        topology, types_include, types_exclude, GTP_state, polymer_offsets
+        topology, types_include, types_exclude, GTP_state, polymer_offsets, index=None
     ):
         """
         get a random pair of neighbor tubulins of the given types,
         GTP state, and polymer offsets.
         """
+        if index is None:
+            all_vertices = topology.graph.get_vertices()
+            type_of = topology.particle_type_of_vertex
+        else:
+            all_vertices = index.vertices
+            type_of = index.type_of
         vertices = []
-        for v in topology.graph.get_vertices():
-            pt = topology.particle_type_of_vertex(v)
+        for v in all_vertices:
+            pt = type_of(v)
             if ReaddyUtil.vertex_satisfies_type(
                 pt,
                 types_include[0] + (["GDP"] if GTP_state == "GDP" else []),
@@ -49,15 +55,14 @@ class MicrotubulesUtil:
             types_include[1] += ["GDP"]
         neighbors = []
         for v in vertices:
-            n = MicrotubulesUtil.get_neighboring_tubulin(topology, v, polymer_offsets)
+            n = MicrotubulesUtil.get_neighboring_tubulin(
+                topology, v, polymer_offsets, index=index
+            )
             if n is not None:
                 extra_types = []
-                if (
-                    GTP_state == "GTP"
-                    and "GTP" not in topology.particle_type_of_vertex(v)
-                ):
+                if GTP_state == "GTP" and "GTP" not in type_of(v):
                     extra_types = ["GTP"]
-                nt = topology.particle_type_of_vertex(n)
+                nt = type_of(n)
                 if ReaddyUtil.vertex_satisfies_type(
                     nt, types_include[1] + extra_types, types_exclude[1]
                 ):
@@ -67,47 +72,63 @@ class MicrotubulesUtil:
         return random.choice(neighbors)
 
     @staticmethod
-    def get_neighboring_tubulin(topology, vertex, polymer_offsets):
+    def get_neighboring_tubulin(topology, vertex, polymer_offsets, index=None):
         """
         get the next tubulin neighbor in the branch from site named direction.
         """
+        vertex_type = (
+            topology.particle_type_of_vertex(vertex)
+            if index is None
+            else index.type_of(vertex)
+        )
         return ReaddyUtil.get_neighbor_of_type(
             topology,
             vertex,
             MicrotubulesUtil.polymer_indices_to_string(
                 MicrotubulesUtil.increment_polymer_indices(
-                    MicrotubulesUtil.get_polymer_indices(
-                        topology.particle_type_of_vertex(vertex)
-                    ),
+                    MicrotubulesUtil.get_polymer_indices(vertex_type),
                     polymer_offsets,
                 )
             ),
             False,
+            index=index,
         )
 
     @staticmethod
-    def tubulin_has_sites(topology, tubulin):
+    def tubulin_has_sites(topology, tubulin, index=None):
         """
         does the tubulin have sites attached?.
         """
         return (
-            ReaddyUtil.get_neighbor_of_type(topology, tubulin, "site#out", False)
+            ReaddyUtil.get_neighbor_of_type(
+                topology, tubulin, "site#out", False, index=index
+            )
             is not None
         )
 
     @staticmethod
-    def get_tubulin_sites(topology, tubulin):
+    def get_tubulin_sites(topology, tubulin, index=None):
         """
         get the site particles attached to this tubulin vertex.
         """
-        if not MicrotubulesUtil.tubulin_has_sites(topology, tubulin):
+        if not MicrotubulesUtil.tubulin_has_sites(topology, tubulin, index=index):
             return None
         return [
-            ReaddyUtil.get_neighbor_of_type(topology, tubulin, "site#out", False),
-            ReaddyUtil.get_neighbor_of_type(topology, tubulin, "site#1", False),
-            ReaddyUtil.get_neighbor_of_type(topology, tubulin, "site#2", False),
-            ReaddyUtil.get_neighbor_of_type(topology, tubulin, "site#3", False),
-            ReaddyUtil.get_neighbor_of_type(topology, tubulin, "site#4", False),
+            ReaddyUtil.get_neighbor_of_type(
+                topology, tubulin, "site#out", False, index=index
+            ),
+            ReaddyUtil.get_neighbor_of_type(
+                topology, tubulin, "site#1", False, index=index
+            ),
+            ReaddyUtil.get_neighbor_of_type(
+                topology, tubulin, "site#2", False, index=index
+            ),
+            ReaddyUtil.get_neighbor_of_type(
+                topology, tubulin, "site#3", False, index=index
+            ),
+            ReaddyUtil.get_neighbor_of_type(
+                topology, tubulin, "site#4", False, index=index
+            ),
         ]
 
     @staticmethod
@@ -125,8 +146,12 @@ class MicrotubulesUtil:
         polymer_offsets = ReaddyUtil.clamp_polymer_offsets_2D(
             polymer_indices[0], polymer_offsets
         )
-        x = ReaddyUtil.calculate_polymer_number(polymer_indices[0], polymer_offsets[0])
-        y = ReaddyUtil.calculate_polymer_number(polymer_indices[1], polymer_offsets[1])
+        x = ReaddyUtil.calculate_polymer_number(
+            polymer_indices[0], polymer_offsets[0], 3
+        )
+        y = ReaddyUtil.calculate_polymer_number(
+            polymer_indices[1], polymer_offsets[1], 3
+        )
         return [x, y]
 
     @staticmethod
@@ -136,13 +161,10 @@ class MicrotubulesUtil:
         """
         if "tubulin" not in particle_type:
             return []
-        flag_string = particle_type[particle_type.index("#") + 1 :]
-        flags = flag_string.split("_")
-        if len(flags) <= 1:
+        polymer_indices = ParticleTypeRegistry.get(particle_type).polymer_indices
+        if len(polymer_indices) < 2:
             return []
-        x = int(flags[-2])
-        y = int(flags[-1])
-        return [x, y]
+        return [polymer_indices[-2], polymer_indices[-1]]
 
     @staticmethod
     def get_polymer_offsets(particle_types):
@@ -162,16 +184,16 @@ class MicrotubulesUtil:
         return offsets
 
     @staticmethod
-    def get_filament_lengths(topology, tubulin_minus, tubulin_plus):
+    def get_filament_lengths(topology, tubulin_minus, tubulin_plus, index=None):
         """
         get the lengths of the filaments, cut off the larger one
         at one larger than the smaller.
         """
         next_tub_minus = MicrotubulesUtil.get_neighboring_tubulin(
-            topology, tubulin_minus, [-1, 0]
+            topology, tubulin_minus, [-1, 0], index=index
         )
         next_tub_plus = MicrotubulesUtil.get_neighboring_tubulin(
-            topology, tubulin_plus, [1, 0]
+            topology, tubulin_plus, [1, 0], index=index
         )
         if next_tub_minus is None and next_tub_plus is None:
             return np.array([1, 1])
@@ -181,11 +203,11 @@ class MicrotubulesUtil:
             return np.array([2, 1])
         else:
             return MicrotubulesUtil.get_filament_lengths(
-                topology, next_tub_minus, next_tub_plus
+                topology, next_tub_minus, next_tub_plus, index=index
             ) + np.array([1, 1])
 
     @staticmethod
-    def filament_is_crosslinked(topology, tubulin, direction):
+    def filament_is_crosslinked(topology, tubulin, direction, index=None):
         """
         does the fragment starting at the given tubulin
         and going the given direction (-1 or 1) along a filament
@@ -193,23 +215,29 @@ class MicrotubulesUtil:
         """
         for i in range(2):
             neighbor_tub = MicrotubulesUtil.get_neighboring_tubulin(
-                topology, tubulin, [0, -1 if i == 0 else 1]
+                topology, tubulin, [0, -1 if i == 0 else 1], index=index
             )
             if neighbor_tub is not None:
                 return True
         next_tub = MicrotubulesUtil.get_neighboring_tubulin(
-            topology, tubulin, [direction, 0]
+            topology, tubulin, [direction, 0], index=index
         )
         if next_tub is None:
             return False
-        return MicrotubulesUtil.filament_is_crosslinked(topology, next_tub, direction)
+        return MicrotubulesUtil.filament_is_crosslinked(
+            topology, next_tub, direction, index=index
+        )
 
     @staticmethod
-    def remove_bent_filament_site_bonds(topology, recipe, tubulin_minus, tubulin_plus):
+    def remove_bent_filament_site_bonds(
+        topology, recipe, tubulin_minus, tubulin_plus, index=None
+    ):
         """
         remove bonds between the sites of tubulin1 and tubulin2.
         """
-        v_sites_minus = MicrotubulesUtil.get_tubulin_sites(topology, tubulin_minus)
+        v_sites_minus = MicrotubulesUtil.get_tubulin_sites(
+            topology, tubulin_minus, index=index
+        )
         if v_sites_minus is None:
             raise Exception(
                 "Failed to find sites on bent tubulin ("
@@ -217,7 +245,9 @@ class MicrotubulesUtil:
                 + ")\n"
                 + ReaddyUtil.topology_to_string(topology)
             )
-        v_sites_plus = MicrotubulesUtil.get_tubulin_sites(topology, tubulin_plus)
+        v_sites_plus = MicrotubulesUtil.get_tubulin_sites(
+            topology, tubulin_plus, index=index
+        )
         if v_sites_plus is None:
             raise Exception(
                 "Failed to find sites on bent tubulin ("
@@ -245,11 +275,11 @@ class MicrotubulesUtil:
                 )
 
     @staticmethod
-    def remove_tubulin_sites(topology, recipe, tubulin):
+    def remove_tubulin_sites(topology, recipe, tubulin, index=None):
         """
         emit a tubulin's site particles.
         """
-        v_sites = MicrotubulesUtil.get_tubulin_sites(topology, tubulin)
+        v_sites = MicrotubulesUtil.get_tubulin_sites(topology, tubulin, index=index)
         if v_sites is None:
             return False
         for site in range(5):
@@ -259,46 +289,60 @@ class MicrotubulesUtil:
         return True
 
     @staticmethod
-    def set_free(topology, recipe, tubulins):
+    def set_free(topology, recipe, tubulins, index=None):
         """
         emit each tubulin's site particles and change its type to tubulin#free.
         """
         for tubulin in tubulins:
-            if not MicrotubulesUtil.remove_tubulin_sites(topology, recipe, tubulin):
+            if not MicrotubulesUtil.remove_tubulin_sites(
+                topology, recipe, tubulin, index=index
+            ):
                 return False
             tub_type = "A" if "A" in topology.particle_type_of_vertex(tubulin) else "B"
             recipe.change_particle_type(tubulin, f"tubulin{tub_type}#free")
         return True
 
     @staticmethod
-    def topology_is_microtubule(topology):
+    def topology_is_microtubule(topology, index=None):
         """
         does the topology have tubulins with ring bonds?
         if so it has multiple protofilaments and is not just an oligomer.
         """
-        for vertex in topology.graph.get_vertices():
-            pt = topology.particle_type_of_vertex(vertex)
+        if index is None:
+            vertices = topology.graph.get_vertices()
+            type_of = topology.particle_type_of_vertex
+        else:
+            vertices = index.vertices_of_type("tubulin", False)
+            type_of = index.type_of
+        for vertex in vertices:
+            pt = type_of(vertex)
             if "tubulin" in pt:
                 if (
-                    MicrotubulesUtil.get_neighboring_tubulin(topology, vertex, [0, -1])
+                    MicrotubulesUtil.get_neighboring_tubulin(
+                        topology, vertex, [0, -1], index=index
+                    )
                     is not None
                 ):
                     return True
                 if (
-                    MicrotubulesUtil.get_neighboring_tubulin(topology, vertex, [0, 1])
+                    MicrotubulesUtil.get_neighboring_tubulin(
+                        topology, vertex, [0, 1], index=index
+                    )
                     is not None
                 ):
                     return True
         return False
 
     @staticmethod
-    def get_attaching_sites(topology):
+    def get_attaching_sites(topology, index=None):
         """
         get the ring sites that just attached in a spatial reaction.
         """
-        sites1 = ReaddyUtil.get_vertices_of_type(topology, "site#1", True)
+        sites1 = ReaddyUtil.get_vertices_of_type(topology, "site#1", True, index=index)
         for site1 in sites1:
-            site2 = ReaddyUtil.get_neighbor_of_type(topology, site1, "site#2", True)
+            site2 = ReaddyUtil.get_neighbor_of_type(
+                topology, site1, "site#2", True, index=index
+            )
             if site2 is not None:
                 return [site1, site2]
         return []
@@ -324,14 +368,18 @@ class MicrotubulesUtil:
         return offsets[0] == 0 and offsets[1] == -1
 
     @staticmethod
-    def tubulin_is_crosslinked(topology, tubulin):
+    def tubulin_is_crosslinked(topology, tubulin, index=None):
         """
         is the tubulin connected to a neighbor on each ring side?.
         """
         return (
-            MicrotubulesUtil.get_neighboring_tubulin(topology, tubulin, [0, -1])
+            MicrotubulesUtil.get_neighboring_tubulin(
+                topology, tubulin, [0, -1], index=index
+            )
             is not None
-            and MicrotubulesUtil.get_neighboring_tubulin(topology, tubulin, [0, 1])
+            and MicrotubulesUtil.get_neighboring_tubulin(
+                topology, tubulin, [0, 1], index=index
+            )
             is not None
         )
 
@@ -343,16 +391,21 @@ class MicrotubulesUtil:
         tubulin_crosslinked=False,
         neighbor_tubulin=None,
         neighbor_crosslinked=False,
+        index=None,
     ):
         """
         check if the tubulin's sites should be removed, if so remove them.
         """
-        if not MicrotubulesUtil.tubulin_has_sites(topology, tubulin):
+        if not MicrotubulesUtil.tubulin_has_sites(topology, tubulin, index=index):
             return False
         crosslinked = []
         neighbor_tubulins = [
-            MicrotubulesUtil.get_neighboring_tubulin(topology, tubulin, [-1, 0]),
-            MicrotubulesUtil.get_neighboring_tubulin(topology, tubulin, [1, 0]),
+            MicrotubulesUtil.get_neighboring_tubulin(
+                topology, tubulin, [-1, 0], index=index
+            ),
+            MicrotubulesUtil.get_neighboring_tubulin(
+                topology, tubulin, [1, 0], index=index
+            ),
         ]
         for nt in range(2):
             if (
@@ -367,27 +420,34 @@ class MicrotubulesUtil:
                 if neighbor_tubulins[nt] is not None:
                     crosslinked.append(
                         MicrotubulesUtil.tubulin_is_crosslinked(
-                            topology, neighbor_tubulins[nt]
+                            topology, neighbor_tubulins[nt], index=index
                         )
                     )
                 else:
                     crosslinked.append(nt == 0)
         if False not in crosslinked and (
             tubulin_crosslinked
-            or MicrotubulesUtil.tubulin_is_crosslinked(topology, tubulin)
+            or MicrotubulesUtil.tubulin_is_crosslinked(topology, tubulin, index=index)
         ):
-            MicrotubulesUtil.remove_tubulin_sites(topology, recipe, tubulin)
+            MicrotubulesUtil.remove_tubulin_sites(
+                topology, recipe, tubulin, index=index
+            )
             return True
         return False
 
     @staticmethod
-    def tubulin_is_not_crosslinked(topology, tubulin):
+    def tubulin_is_not_crosslinked(topology, tubulin, index=None):
         """
         is the tubulin missing at least one ring side connection?.
         """
         return (
-            MicrotubulesUtil.get_neighboring_tubulin(topology, tubulin, [0, -1]) is None
-            or MicrotubulesUtil.get_neighboring_tubulin(topology, tubulin, [0, 1])
+            MicrotubulesUtil.get_neighboring_tubulin(
+                topology, tubulin, [0, -1], index=index
+            )
+            is None
+            or MicrotubulesUtil.get_neighboring_tubulin(
+                topology, tubulin, [0, 1], index=index
+            )
             is None
         )
 
@@ -408,14 +468,21 @@ class MicrotubulesUtil:
 
     @staticmethod
     def check_add_tubulin_sites(
-        topology, recipe, tubulin, site1_type="site#new", site2_type="site#new"
+        topology,
+        recipe,
+        tubulin,
+        site1_type="site#new",
+        site2_type="site#new",
+        index=None,
     ):
         """
         check if the tubulin should have sites added, if so add them.
         """
-        if MicrotubulesUtil.tubulin_has_sites(topology, tubulin):
+        if MicrotubulesUtil.tubulin_has_sites(topology, tubulin, index=index):
             if not (site1_type == "site#new" and site2_type == "site#new"):
-                sites = MicrotubulesUtil.get_tubulin_sites(topology, tubulin)
+                sites = MicrotubulesUtil.get_tubulin_sites(
+                    topology, tubulin, index=index
+                )
                 if site1_type != "site#new":
                     recipe.change_particle_type(sites[1], site1_type)
                 if site2_type != "site#new":
@@ -427,12 +494,12 @@ class MicrotubulesUtil:
         return True
 
     @staticmethod
-    def get_new_sites(topology, tubulin):
+    def get_new_sites(topology, tubulin, index=None):
         """
         get new site particles attached to a tubulin.
         """
         v_new_sites = ReaddyUtil.get_neighbors_of_type(
-            topology, tubulin, "site#", False
+            topology, tubulin, "site#", False, index=index
         )
         return v_new_sites if len(v_new_sites) >= 1 else None
 
@@ -489,11 +556,15 @@ class MicrotubulesUtil:
 
             returns list of types
         """
-        result = []
-        for x in range(1, 4):
-            for y in range(1, 4):
-                result.append(f"{particle_type}{x}_{y}")
-        return result
+        return list(
+            TypeCatalogue.ordered(
+                "polymer_tubulin",
+                particle_type,
+                lambda: [
+                    f"{particle_type}{x}_{y}" for x in range(1, 4) for y in range(1, 4)
+                ],
+            )
+        )
 
     @staticmethod
     def add_polymer_topology_species(particle_type, diffCoeff, system):
@@ -518,7 +589,8 @@ class MicrotubulesUtil:
         use_GTP=True,
     ):
         """
-        get lists of positions and types for particles in a microtubule
+        get an array of positions and a list of types
+        for particles in a microtubule
             with n_filaments protofilaments
             and n_rings rings
             and n_frayed_rings_plus rings at + end with outward bend
@@ -526,96 +598,16 @@ class MicrotubulesUtil:
             and frayed_angle [radians] rotation of normal per bent tubulin
             and radius [nm].
         """
-        frayed_y_pos = 0.0
-        for ring in range(n_frayed_rings_minus):
-            angle = (ring + 0.5) * frayed_angle
-            quad = math.floor(angle / (np.pi / 2))
-            acute_angle = angle % (np.pi / 2)
-            frayed_y_pos += (
-                (-1 if quad > 1 else 1)
-                * 4
-                * (np.sin(acute_angle) if quad % 2 == 0 else np.cos(acute_angle))
-            )
-        n_frayed_rings = n_frayed_rings_minus + n_frayed_rings_plus
-        positions = []
-        types = []
-        i = 0
-        for filament in range(n_filaments):
-            tube_angle = (
-                n_filaments - filament
-            ) * 2.0 * np.pi / n_filaments + np.pi / 2.0
-            tube_normal = ReaddyUtil.normalize(
-                np.array([math.cos(tube_angle), math.sin(tube_angle), 0.0])
-            )
-            tube_tangent = np.array([0.0, 0.0, 1.0])
-            side = ReaddyUtil.normalize(np.cross(tube_normal, tube_tangent))
-            if n_frayed_rings > 0:
-                tangent = ReaddyUtil.rotate(
-                    np.copy(tube_tangent),
-                    side,
-                    (n_frayed_rings_minus + 0.5) * frayed_angle,
-                )
-                normal = ReaddyUtil.rotate(
-                    np.copy(tube_normal),
-                    side,
-                    (n_frayed_rings_minus + 0.5) * frayed_angle,
-                )
-            else:
-                tangent = tube_tangent
-                normal = tube_normal
-            pos = (radius + frayed_y_pos) * tube_normal + (
-                12.0 / 13.0 * filament - 2.0 * n_rings
-            ) * tube_tangent
-            for ring in range(n_rings):
-                number1 = ring % 3 + 1
-                number2 = (filament + math.floor(ring / 3)) % 3 + 1
-                GTP_state = (
-                    "GTP"
-                    if random.random() <= (ring - n_rings / 3.0) / (n_rings / 3.0)
-                    else "GDP"
-                )
-                positions.append(copy.copy(pos))
-                bent = (
-                    ring < n_frayed_rings_minus
-                    or ring > n_rings - 1 - n_frayed_rings_plus
-                )
-                edge = n_frayed_rings > 0 and (
-                    ring == n_frayed_rings_minus
-                    or ring == n_rings - 1 - n_frayed_rings_plus
-                )
-                tub_type = "A" if ring % 2 == 0 else "B"
-                bent_type = "bent_" if bent else ""
-                tub_GTP_state = GTP_state + "_" if use_GTP else ""
-                types.append(
-                    f"tubulin{tub_type}#{tub_GTP_state}{bent_type}{number1}_{number2}"
-                )
-                i += 1
-                if bent or edge:  # needs site scaffolds
-                    types.append("site#out")
-                    i += 1
-                    positions.append(pos + 1.5 * normal)
-                    site_state = f"_{GTP_state}" if not edge else ""
-                    types.append(f"site#1{site_state}")
-                    i += 1
-                    positions.append(pos - 1.5 * side)
-                    types.append(f"site#2{site_state}")
-                    i += 1
-                    positions.append(pos + 1.5 * side)
-                    types.append("site#3")
-                    i += 1
-                    positions.append(pos - 1.5 * tangent)
-                    site_state = f"_{GTP_state}" if ring == n_rings - 1 else ""
-                    types.append(f"site#4{site_state}")
-                    i += 1
-                    positions.append(pos + 1.5 * tangent)
-                    tangent = ReaddyUtil.rotate(
-                        tangent, side, -frayed_angle * (0.5 if edge else 1.0)
-                    )
-                    normal = ReaddyUtil.rotate(
-                        normal, side, -frayed_angle * (0.5 if edge else 1.0)
-                    )
-                pos += 4.0 * tangent
-        return positions, types
+        seed = MicrotubulesSeed.get(
+            n_filaments,
+            n_rings,
+            n_frayed_rings_plus,
+            n_frayed_rings_minus,
+            frayed_angle,
+            radius,
+            use_GTP,
+        )
+        return np.copy(seed.positions), seed.types()
 
     @staticmethod
     def add_edges(
@@ -628,99 +620,21 @@ class MicrotubulesUtil:
             and n_frayed_rings_plus rings at + end with outward bend
             and n_frayed_rings_minus rings at - end with outward bend.
         """
-        sites_per_scaffold = 5
-        n_frayed_rings = n_frayed_rings_minus + n_frayed_rings_plus
-        particles_per_filament = n_rings + sites_per_scaffold * (
-            n_frayed_rings + (2 if n_frayed_rings > 0 else 0)
-        )
-        total_particles = n_filaments * particles_per_filament
-        for filament in range(n_filaments):
-            for ring in range(n_rings):
-                end = (
-                    "minus"
-                    if n_frayed_rings_minus > 0 and ring <= n_frayed_rings_minus + 1
-                    else "plus"
-                )
-                bent = (
-                    ring < n_frayed_rings_minus
-                    or ring > n_rings - 1 - n_frayed_rings_plus
-                )
-                edge = n_frayed_rings > 0 and (
-                    ring == n_frayed_rings_minus
-                    or ring == n_rings - 1 - n_frayed_rings_plus
-                )
-                i = (
-                    filament * particles_per_filament
-                    + ring
-                    + sites_per_scaffold
-                    * (
-                        (ring if end == "minus" else n_frayed_rings_minus + 1)
-                        if n_frayed_rings_minus > 0
-                        else 0
-                    )
-                    + sites_per_scaffold
-                    * (
-                        ring - ((n_rings - n_frayed_rings_plus) - 1)
-                        if end == "plus" and bent
-                        else 0
-                    )
-                )
-                if ring < n_rings - 1:  # bond along filament
-                    i_filament = i + 1 + (sites_per_scaffold if bent or edge else 0)
-                    microtubule.get_graph().add_edge(i, i_filament)
-                if not bent:  # bond along ring
-                    # as long as not in + end overhang
-                    if not (
-                        filament == n_filaments - 1
-                        and ring > (n_rings - 1 - n_frayed_rings_plus) - 3
-                    ):
-                        i_ring = i + particles_per_filament
-                        if filament == n_filaments - 1:
-                            i_ring += (
-                                8 if end == "minus" and edge else 3
-                            ) - total_particles
-                        microtubule.get_graph().add_edge(i, i_ring)
-                if bent or edge:  # bent site bonds
-                    microtubule.get_graph().add_edge(i, i + 1)  # tub -- site0
-                    microtubule.get_graph().add_edge(i, i + 2)  # tub -- site1
-                    microtubule.get_graph().add_edge(i, i + 3)  # tub -- site2
-                    microtubule.get_graph().add_edge(i, i + 4)  # tub -- site3
-                    microtubule.get_graph().add_edge(i, i + 5)  # tub -- site4
-                    microtubule.get_graph().add_edge(i + 1, i + 2)  # site0 -- site1
-                    microtubule.get_graph().add_edge(i + 1, i + 3)  # site0 -- site2
-                    microtubule.get_graph().add_edge(i + 1, i + 4)  # site0 -- site3
-                    microtubule.get_graph().add_edge(i + 1, i + 5)  # site0 -- site4
-                    microtubule.get_graph().add_edge(i + 2, i + 4)  # site1 -- site3
-                    microtubule.get_graph().add_edge(i + 2, i + 5)  # site1 -- site4
-                    microtubule.get_graph().add_edge(i + 3, i + 4)  # site2 -- site3
-                    microtubule.get_graph().add_edge(i + 3, i + 5)  # site2 -- site4
-                    # longitudinal bonds on bent rings
-                    if ring > 0 and (bent or (edge and end == "minus")):
-                        # site0 -- prev site0
-                        microtubule.get_graph().add_edge(i + 1, i - 5)
-                        # site1 -- prev site1
-                        microtubule.get_graph().add_edge(i + 2, i - 4)
-                        # site2 -- prev site2
-                        microtubule.get_graph().add_edge(i + 3, i - 3)
-                        # site3 -- prev site4
-                        microtubule.get_graph().add_edge(i + 4, i - 1)
+        graph = microtubule.get_graph()
+        edges = MicrotubulesSeed.get_edges(
+            n_filaments, n_rings, n_frayed_rings_plus, n_frayed_rings_minus
+        )
+        for index1, index2 in edges.tolist():
+            graph.add_edge(index1, index2)
 
     @staticmethod
-    def add_microtubule(
-        n_rings,
-        n_frayed_rings_minus,
-        n_frayed_rings_plus,
-        position_offset,
-        simulation,
-        use_GTP=True,
-    ):
+    def get_seed(n_rings, n_frayed_rings_minus, n_frayed_rings_plus, use_GTP=True):
         """
-        add seed microtubule to the simulation
-            with n_filaments protofilaments
+        get the seed microtubule
+            with 13 protofilaments
             and n_rings rings
             and n_frayed_rings_minus rings at - end with outward bend
-            and n_frayed_rings_plus rings at + end with outward bend
-            and position_offset.
+            and n_frayed_rings_plus rings at + end with outward bend.
         """
         if n_rings - (n_frayed_rings_minus + n_frayed_rings_plus) < 2:
             raise Exception(
@@ -731,7 +645,7 @@ class MicrotubulesUtil:
         max_frayed_rings = math.floor((360.0 + frayed_angle / 2.0) / frayed_angle)
         n_frayed_rings_minus = min(max_frayed_rings, n_frayed_rings_minus)
         n_frayed_rings_plus = min(max_frayed_rings, n_frayed_rings_plus)
-        positions, types = MicrotubulesUtil.get_microtubule_positions_and_types(
+        return MicrotubulesSeed.get(
             n_filaments,
             n_rings,
             n_frayed_rings_plus,
@@ -740,12 +654,44 @@ class MicrotubulesUtil:
             10.86,
             use_GTP,
         )
-        microtubule = simulation.add_topology(
-            "Microtubule", types, positions + position_offset
-        )
-        MicrotubulesUtil.add_edges(
-            microtubule, n_filaments, n_rings, n_frayed_rings_plus, n_frayed_rings_minus
+
+    @staticmethod
+    def add_microtubule(
+        n_rings,
+        n_frayed_rings_minus,
+        n_frayed_rings_plus,
+        position_offset,
+        simulation,
+        use_GTP=True,
+    ):
+        """
+        add seed microtubule to the simulation
+            with n_filaments protofilaments
+            and n_rings rings
+            and n_frayed_rings_minus rings at - end with outward bend
+            and n_frayed_rings_plus rings at + end with outward bend
+            and position_offset.
+        """
+        seed = MicrotubulesUtil.get_seed(
+            n_rings, n_frayed_rings_minus, n_frayed_rings_plus, use_GTP
         )
+        MicrotubulesUtil.add_microtubules(seed, [position_offset], simulation)
+
+    @staticmethod
+    def add_microtubules(seed, position_offsets, simulation):
+        """
+        add a copy of a seed microtubule to the simulation
+        at each of the position_offsets,
+        each with its own random GTP states.
+        """
+        edges = seed.edges.tolist()
+        for position_offset in position_offsets:
+            microtubule = simulation.add_topology(
+                "Microtubule", seed.types(), seed.positions + position_offset
+            )
+            graph = microtubule.get_graph()
+            for index1, index2 in edges:
+                graph.add_edge(index1, index2)
 
     @staticmethod
     def add_tubulin_dimers(simulation, n_tubulin, box_size):
@@ -753,16 +699,19 @@ class MicrotubulesUtil:
         add seed tubulin dimers to the simulation.
         """
         positions = np.random.uniform(size=(n_tubulin, 3)) * box_size - box_size * 0.5
-        for p in range(len(positions)):
-            to_B = 4.0 * ReaddyUtil.normalize(
-                np.array([random.random(), random.random(), random.random()])
-            )
-            top = simulation.add_topology(
-                "Dimer",
-                ["tubulinA#free", "tubulinB#free"],
-                np.array([positions[p], positions[p] + to_B]),
-            )
-            top.get_graph().add_edge(0, 1)
+        ReaddyUtil.add_topologies(
+            simulation,
+            "Dimer",
+            ["tubulinA#free", "tubulinB#free"],
+            np.stack(
+                [
+                    positions,
+                    positions + 4.0 * ReaddyUtil.get_random_unit_vectors(n_tubulin),
+                ],
+                axis=1,
+            ),
+            edges=[(0, 1)],
+        )
 
     @staticmethod
     def add_tubulin_types(system, diffCoeff):
@@ -845,20 +794,27 @@ class MicrotubulesUtil:
         """
         returns the list of all tubulin types.
         """
-        tube_tubulin_types = [
-            "tubulinA#GTP_",
-            "tubulinA#GDP_",
-            "tubulinB#GTP_",
-            "tubulinB#GDP_",
-        ]
-        bent_tubulin_types = [
-            "tubulinA#GTP_bent_",
-            "tubulinA#GDP_bent_",
-            "tubulinB#GTP_bent_",
-            "tubulinB#GDP_bent_",
-        ]
-        all_tubulin_types = tube_tubulin_types + bent_tubulin_types
-        return all_tubulin_types
+        return list(MicrotubulesUtil.tubulin_types())
+
+    @staticmethod
+    def tubulin_types():
+        """
+        returns a cached tuple of all tubulin types.
+        """
+        return TypeCatalogue.ordered(
+            "tubulin",
+            None,
+            lambda: [
+                "tubulinA#GTP_",
+                "tubulinA#GDP_",
+                "tubulinB#GTP_",
+                "tubulinB#GDP_",
+                "tubulinA#GTP_bent_",
+                "tubulinA#GDP_bent_",
+                "tubulinB#GTP_bent_",
+                "tubulinB#GDP_bent_",
+            ],
+        )
 
     @staticmethod
     def do_grow1(topology, GTP_state):
@@ -869,14 +825,16 @@ class MicrotubulesUtil:
         if parameters["verbose"]:
             print("Grow 1")
         recipe = readdy.StructuralReactionRecipe(topology)
+        index = TopologyIndex(topology)
         v_newB = ReaddyUtil.get_vertex_of_type(
             topology,
             "tubulinB#free",
             True,
             error_msg="Failed to find tubulinB#free vertex",
+            index=index,
         )
         v_newA = ReaddyUtil.get_neighbor_of_type(
-            topology, v_newB, "tubulinA#free", True
+            topology, v_newB, "tubulinA#free", True, index=index
         )
         if v_newA is None:
             raise Exception(
@@ -911,6 +869,7 @@ class MicrotubulesUtil:
         set types, positions, and edges.
         """
         recipe = readdy.StructuralReactionRecipe(topology)
+        index = TopologyIndex(topology)
         if parameters["verbose"]:
             print("Grow 2")
         v_newB = ReaddyUtil.get_vertex_of_type(
@@ -918,35 +877,40 @@ class MicrotubulesUtil:
             "tubulinB#free",
             True,
             error_msg="Failed to find tubulinB#free vertex",
+            index=index,
         )
         v_newA = ReaddyUtil.get_neighbor_of_type(
-            topology, v_newB, "tubulinA#free", True
+            topology, v_newB, "tubulinA#free", True, index=index
         )
         if v_newA is None:
             raise Exception(
                 "Failed to find tubulinA#free vertex\n"
                 + ReaddyUtil.topology_to_string(topology)
             )
-        v_site4 = ReaddyUtil.get_neighbor_of_type(topology, v_newA, "site#4", True)
+        v_site4 = ReaddyUtil.get_neighbor_of_type(
+            topology, v_newA, "site#4", True, index=index
+        )
         if v_site4 is None:
             raise Exception(
                 "Failed to find site#4 vertex\n"
                 + ReaddyUtil.topology_to_string(topology)
             )
-        v_endB = ReaddyUtil.get_neighbor_of_type(topology, v_site4, "tubulinB", False)
+        v_endB = ReaddyUtil.get_neighbor_of_type(
+            topology, v_site4, "tubulinB", False, index=index
+        )
         if v_endB is None:
             raise Exception(
                 "Failed to find neighboring tubulin vertex\n"
                 + ReaddyUtil.topology_to_string(topology)
             )
-        v_sites = MicrotubulesUtil.get_tubulin_sites(topology, v_endB)
+        v_sites = MicrotubulesUtil.get_tubulin_sites(topology, v_endB, index=index)
         if v_sites is None:
             raise Exception(
                 "TubulinB at end does not have sites!\n"
                 + ReaddyUtil.topology_to_string(topology)
             )
         v_new_sitesB = ReaddyUtil.get_neighbors_of_type(
-            topology, v_newB, "site#new", True
+            topology, v_newB, "site#new", True, index=index
         )
         if len(v_new_sitesB) != 5:
             raise Exception(
@@ -954,7 +918,7 @@ class MicrotubulesUtil:
                 + ReaddyUtil.topology_to_string(topology)
             )
         v_new_sitesA = ReaddyUtil.get_neighbors_of_type(
-            topology, v_newA, "site#new", True
+            topology, v_newA, "site#new", True, index=index
         )
         if len(v_new_sitesA) != 5:
             raise Exception(
@@ -1051,8 +1015,14 @@ class MicrotubulesUtil:
         if parameters["verbose"]:
             print("Shrink")
         recipe = readdy.StructuralReactionRecipe(topology)
+        index = TopologyIndex(topology)
         tubulins = MicrotubulesUtil.get_random_tubulin_neighbors(
-            topology, [["B#", "bent"], ["A#", "bent"]], [[], []], GTP_state, [1, 0]
+            topology,
+            [["B#", "bent"], ["A#", "bent"]],
+            [[], []],
+            GTP_state,
+            [1, 0],
+            index=index,
         )
         if tubulins is None:
             recipe.change_topology_type(f"{topology.type}#Fail-Shrink-{GTP_state}")
@@ -1064,8 +1034,10 @@ class MicrotubulesUtil:
             return recipe
         # are both fragments crosslinked to other filaments?
         if MicrotubulesUtil.filament_is_crosslinked(
-            topology, tubulins[0], -1
-        ) and MicrotubulesUtil.filament_is_crosslinked(topology, tubulins[1], 1):
+            topology, tubulins[0], -1, index=index
+        ) and MicrotubulesUtil.filament_is_crosslinked(
+            topology, tubulins[1], 1, index=index
+        ):
             recipe.change_topology_type(f"{topology.type}#Fail-Shrink-{GTP_state}")
             if parameters["verbose"]:
                 print(
@@ -1079,13 +1051,13 @@ class MicrotubulesUtil:
         # will either of the cut fragments be a dimer?
         is_dimer = []
         filament_lengths = MicrotubulesUtil.get_filament_lengths(
-            topology, tubulins[0], tubulins[1]
+            topology, tubulins[0], tubulins[1], index=index
         )
         for t in range(len(tubulins)):
             is_dimer.append(filament_lengths[t] < 3)
         if not is_dimer[0]:
             site4 = ReaddyUtil.get_neighbor_of_type(
-                topology, tubulins[0], "site#4", False
+                topology, tubulins[0], "site#4", False, index=index
             )
             if site4 is None:
                 raise Exception(
@@ -1095,7 +1067,7 @@ class MicrotubulesUtil:
         # if both fragments are bigger than dimers, just disconnect them
         if True not in is_dimer:
             MicrotubulesUtil.remove_bent_filament_site_bonds(
-                topology, recipe, tubulins[0], tubulins[1]
+                topology, recipe, tubulins[0], tubulins[1], index=index
             )
         # detach at least one dimer
         else:
@@ -1106,10 +1078,12 @@ class MicrotubulesUtil:
                 tubulins_to_detach.append(tubulins[i])
                 tubulins_to_detach.append(
                     MicrotubulesUtil.get_neighboring_tubulin(
-                        topology, tubulins[i], [-1 if i == 0 else 1, 0]
+                        topology, tubulins[i], [-1 if i == 0 else 1, 0], index=index
                     )
                 )
-            if not MicrotubulesUtil.set_free(topology, recipe, tubulins_to_detach):
+            if not MicrotubulesUtil.set_free(
+                topology, recipe, tubulins_to_detach, index=index
+            ):
                 raise Exception(
                     "Failed to find sites for tubulins being released\n"
                     + ReaddyUtil.topology_to_string(topology)
@@ -1126,7 +1100,9 @@ class MicrotubulesUtil:
         # if it's not a dimer and it and its plus neighbor
         # are both fully attached laterally
         if not is_dimer[1]:
-            MicrotubulesUtil.check_remove_tubulin_sites(topology, recipe, tubulins[1])
+            MicrotubulesUtil.check_remove_tubulin_sites(
+                topology, recipe, tubulins[1], index=index
+            )
         recipe.change_topology_type("Microtubule#Shrinking")
         return recipe
 
@@ -1153,9 +1129,10 @@ class MicrotubulesUtil:
         change topology types.
         """
         recipe = readdy.StructuralReactionRecipe(topology)
-        if len(topology.graph.get_vertices()) == 2:
+        index = TopologyIndex(topology)
+        if len(index.vertices) == 2:
             recipe.change_topology_type("Dimer")
-        elif MicrotubulesUtil.topology_is_microtubule(topology):
+        elif MicrotubulesUtil.topology_is_microtubule(topology, index=index):
             recipe.change_topology_type("Microtubule")
         else:
             recipe.change_topology_type("Oligomer")
@@ -1169,7 +1146,8 @@ class MicrotubulesUtil:
         if parameters["verbose"]:
             print("Attach")
         recipe = readdy.StructuralReactionRecipe(topology)
-        attaching_sites = MicrotubulesUtil.get_attaching_sites(topology)
+        index = TopologyIndex(topology)
+        attaching_sites = MicrotubulesUtil.get_attaching_sites(topology, index=index)
         if len(attaching_sites) == 0:
             raise Exception(
                 "Failed to find attaching vertices\n"
@@ -1178,7 +1156,9 @@ class MicrotubulesUtil:
         tubulins = []
         for site in attaching_sites:
             tubulins.append(
-                ReaddyUtil.get_neighbor_of_type(topology, site, "tubulin", False)
+                ReaddyUtil.get_neighbor_of_type(
+                    topology, site, "tubulin", False, index=index
+                )
             )
             if tubulins[len(tubulins) - 1] is None:
                 raise Exception(
@@ -1222,29 +1202,41 @@ class MicrotubulesUtil:
         for i in range(2):
             crosslinked = (
                 MicrotubulesUtil.get_neighboring_tubulin(
-                    topology, tubulins[i], [0, 1 if i == 0 else -1]
+                    topology, tubulins[i], [0, 1 if i == 0 else -1], index=index
                 )
                 is not None
             )
             if crosslinked:
                 MicrotubulesUtil.check_remove_tubulin_sites(
-                    topology, recipe, tubulins[i], True
+                    topology, recipe, tubulins[i], True, index=index
                 )
             else:
                 ReaddyUtil.set_flags(topology, recipe, tubulins[i], [], ["bent"])
             prev_tubulin = MicrotubulesUtil.get_neighboring_tubulin(
-                topology, tubulins[i], [-1, 0]
+                topology, tubulins[i], [-1, 0], index=index
             )
             if prev_tubulin is not None:
                 MicrotubulesUtil.check_remove_tubulin_sites(
-                    topology, recipe, prev_tubulin, False, tubulins[i], crosslinked
+                    topology,
+                    recipe,
+                    prev_tubulin,
+                    False,
+                    tubulins[i],
+                    crosslinked,
+                    index=index,
                 )
             next_tubulin = MicrotubulesUtil.get_neighboring_tubulin(
-                topology, tubulins[i], [1, 0]
+                topology, tubulins[i], [1, 0], index=index
             )
             if next_tubulin is not None:
                 MicrotubulesUtil.check_remove_tubulin_sites(
-                    topology, recipe, next_tubulin, False, tubulins[i], crosslinked
+                    topology,
+                    recipe,
+                    next_tubulin,
+                    False,
+                    tubulins[i],
+                    crosslinked,
+                    index=index,
                 )
         removed, message = ReaddyUtil.try_remove_edge(
             topology, recipe, attaching_sites[0], attaching_sites[1]
@@ -1263,6 +1255,7 @@ class MicrotubulesUtil:
         if parameters["verbose"]:
             print("Detach")
         recipe = readdy.StructuralReactionRecipe(topology)
+        index = TopologyIndex(topology)
         GTP_state = (
             "GTP"
             if (
@@ -1281,6 +1274,7 @@ class MicrotubulesUtil:
             [["bent"], ["bent"]],
             GTP_state,
             [0, -1],
+            index=index,
         )
         if detaching_tubulins is None:
             if parameters["verbose"]:
@@ -1293,10 +1287,14 @@ class MicrotubulesUtil:
                 detaching_tubulins[i],
                 "site#new" if i == 0 else "site#1_detach",
                 "site#2_detach" if i == 0 else "site#new",
+                index=index,
             )
             if (
                 MicrotubulesUtil.get_neighboring_tubulin(
-                    topology, detaching_tubulins[i], [0, 1 if i == 0 else -1]
+                    topology,
+                    detaching_tubulins[i],
+                    [0, 1 if i == 0 else -1],
+                    index=index,
                 )
                 is None
             ):
@@ -1305,11 +1303,14 @@ class MicrotubulesUtil:
                 )
             for j in range(2):
                 neighbor_tubulin = MicrotubulesUtil.get_neighboring_tubulin(
-                    topology, detaching_tubulins[i], [-1 if j == 0 else 1, 0]
+                    topology,
+                    detaching_tubulins[i],
+                    [-1 if j == 0 else 1, 0],
+                    index=index,
                 )
                 if neighbor_tubulin is not None:
                     MicrotubulesUtil.check_add_tubulin_sites(
-                        topology, recipe, neighbor_tubulin
+                        topology, recipe, neighbor_tubulin, index=index
                     )
         recipe.change_topology_type(f"Microtubule#Detaching-{GTP_state}")
         return recipe
@@ -1320,26 +1321,29 @@ class MicrotubulesUtil:
         detach tubulins laterally.
         """
         recipe = readdy.StructuralReactionRecipe(topology)
+        index = TopologyIndex(topology)
         detaching_sites = [
             ReaddyUtil.get_vertex_of_type(
                 topology,
                 "site#2_detach",
                 False,
                 error_msg="Failed to find detaching sites",
+                index=index,
             ),
             ReaddyUtil.get_vertex_of_type(
                 topology,
                 "site#1_detach",
                 False,
                 error_msg="Failed to find detaching sites",
+                index=index,
             ),
         ]
         detaching_tubulins = [
             ReaddyUtil.get_neighbor_of_type(
-                topology, detaching_sites[0], "tubulin", False
+                topology, detaching_sites[0], "tubulin", False, index=index
             ),
             ReaddyUtil.get_neighbor_of_type(
-                topology, detaching_sites[1], "tubulin", False
+                topology, detaching_sites[1], "tubulin", False, index=index
             ),
         ]
         if None in detaching_tubulins:
@@ -1360,11 +1364,11 @@ class MicrotubulesUtil:
         for i in range(2):
             tubulins = [
                 MicrotubulesUtil.get_neighboring_tubulin(
-                    topology, detaching_tubulins[i], [-1, 0]
+                    topology, detaching_tubulins[i], [-1, 0], index=index
                 ),
                 detaching_tubulins[i],
                 MicrotubulesUtil.get_neighboring_tubulin(
-                    topology, detaching_tubulins[i], [1, 0]
+                    topology, detaching_tubulins[i], [1, 0], index=index
                 ),
             ]
             if tubulins[0] is None and tubulins[2] is None:
@@ -1395,7 +1399,9 @@ class MicrotubulesUtil:
                     np.copy(normal), side, frayed_angle * (-1 if j > 0 else 0.5)
                 )
                 if tubulins[j] is not None:
-                    sites[j] = MicrotubulesUtil.get_tubulin_sites(topology, tubulins[j])
+                    sites[j] = MicrotubulesUtil.get_tubulin_sites(
+                        topology, tubulins[j], index=index
+                    )
                     tubulin_state = (
                         "_GTP"
                         if "GTP" in topology.particle_type_of_vertex(tubulins[j])
@@ -1407,7 +1413,9 @@ class MicrotubulesUtil:
                         else ""
                     )
                     if sites[j] is None:
-                        sites[j] = MicrotubulesUtil.get_new_sites(topology, tubulins[j])
+                        sites[j] = MicrotubulesUtil.get_new_sites(
+                            topology, tubulins[j], index=index
+                        )
                         if sites[j] is None:
                             raise Exception(
                                 ReaddyUtil.vertex_to_string(topology, tubulins[j])
@@ -1418,7 +1426,7 @@ class MicrotubulesUtil:
                         site_state_filament = (
                             tubulin_state
                             if MicrotubulesUtil.get_neighboring_tubulin(
-                                topology, tubulins[j], [1, 0]
+                                topology, tubulins[j], [1, 0], index=index
                             )
                             is None
                             else ""
@@ -1470,16 +1478,18 @@ class MicrotubulesUtil:
         if parameters["verbose"]:
             print("Hydrolyze")
         recipe = readdy.StructuralReactionRecipe(topology)
+        index = TopologyIndex(topology)
         tubulin = ReaddyUtil.get_random_vertex_of_type(
             topology,
             "#GTP",
             False,
             parameters["verbose"],
             "Hydrolyze cancelled: Couldn't find GTP-tubulin",
+            index=index,
         )
         if tubulin is None:
             return recipe
-        sites = MicrotubulesUtil.get_tubulin_sites(topology, tubulin)
+        sites = MicrotubulesUtil.get_tubulin_sites(topology, tubulin, index=index)
         if sites is not None:
             for s in range(1, 4):
                 if "GTP" in topology.particle_type_of_vertex(sites[s]):
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+import numpy as np
+
+from simularium_readdy_models.actin import (
+    ActinAnalysisPipeline,
+    ActinAnalyzer,
+    ActinFrameContext,
+    ActinGenerator,
+    ActinTestData,
+    FiberData,
+)
+from simularium_readdy_models.actin.actin_util import set_parameters
+
+
+def test_frame_filaments_long_fiber():
+    set_parameters({"longitudinal_bonds": True})
+    fiber = FiberData(
+        fiber_id=0,
+        points=[np.array([-3000.0, 0.0, 0.0]), np.array([3000.0, 0.0, 0.0])],
+        type_name="Actin-Polymer",
+    )
+    monomers = ActinGenerator.get_monomers([fiber], use_uuids=False)
+    filaments = ActinAnalyzer._frame_all_filaments(monomers)
+    assert len(filaments) == 1
+    assert len(filaments[0]) == len(monomers["particles"])
+    for index in range(len(filaments[0]) - 1):
+        assert (
+            filaments[0][index + 1]
+            in monomers["particles"][filaments[0][index]]["neighbor_ids"]
+        )
+
+
+def test_frame_context():
+    set_parameters({"longitudinal_bonds": True})
+    monomer_data = [ActinTestData.complex_branched_actin_monomers()]
+    contexts = ActinFrameContext.from_monomer_data(monomer_data)
+    filaments = ActinAnalyzer._frame_all_filaments(contexts[0])
+    assert filaments == ActinAnalyzer._frame_all_filaments(monomer_data[0])
+    assert ActinAnalyzer._frame_mother_filaments(
+        contexts[0]
+    ) is ActinAnalyzer._frame_mother_filaments(contexts[0])
+    assert ActinAnalyzer.analyze_daughter_filament_lengths(
+        contexts
+    ) == ActinAnalyzer.analyze_daughter_filament_lengths(monomer_data)
+
+
+def test_analysis_pipeline():
+    set_parameters({"longitudinal_bonds": True})
+    monomer_data = [ActinTestData.complex_branched_actin_monomers()] * 2
+    box_size = np.array([1000.0, 1000.0, 1000.0])
+    metrics = [
+        "ratio_of_daughter_to_total_actin",
+        "mother_filament_lengths",
+        "branch_angles",
+        "short_helix_pitches",
+        "pointed_end_displacement",
+    ]
+    results = ActinAnalysisPipeline(metrics, box_size).run(iter(monomer_data))
+    np.testing.assert_array_equal(
+        results["ratio_of_daughter_to_total_actin"],
+        ActinAnalyzer.analyze_ratio_of_daughter_to_total_actin(monomer_data),
+    )
+    assert results[
+        "mother_filament_lengths"
+    ] == ActinAnalyzer.analyze_mother_filament_lengths(monomer_data)
+    assert results["branch_angles"] == ActinAnalyzer.analyze_branch_angles(
+        monomer_data, box_size, True
+    )
+    assert results["short_helix_pitches"] == ActinAnalyzer.analyze_short_helix_pitches(
+        monomer_data, box_size, True
+    )
+    np.testing.assert_array_equal(results["pointed_end_displacement"], [0.0, 0.0])
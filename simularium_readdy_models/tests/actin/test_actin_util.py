@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+
+from simularium_readdy_models.actin import ActinUtil
+from simularium_readdy_models.actin.actin_util import set_parameters
+
+
+def polymer_actin_types_uncached(vertex_type):
+    """
+    the previous implementation of ActinUtil.get_all_polymer_actin_types.
+    """
+    spacer = "_"
+    if "#" not in vertex_type:
+        spacer = "#"
+    return [f"{vertex_type}{spacer}{i + 1}" for i in ActinUtil.polymer_number_range()]
+
+
+def test_polymer_actin_types():
+    for longitudinal_bonds in [True, False]:
+        set_parameters({"longitudinal_bonds": longitudinal_bonds})
+        ATP_types = ActinUtil.get_all_polymer_actin_types("actin#ATP")
+        assert ATP_types == polymer_actin_types_uncached("actin#ATP")
+        mid_types = ActinUtil.get_all_polymer_actin_types("actin#mid")
+        assert mid_types == polymer_actin_types_uncached("actin#mid")
+        types = ActinUtil.polymer_actin_types(
+            ("actin#ATP", "actin#mid"), ("actin#branch_1",)
+        )
+        assert types == tuple(ATP_types + mid_types) + ("actin#branch_1",)
+        assert (
+            ActinUtil.polymer_actin_types(
+                ("actin#ATP", "actin#mid"), ("actin#branch_1",)
+            )
+            is types
+        )
+        assert ActinUtil.polymer_actin_type_set(
+            ("actin#ATP", "actin#mid"), ("actin#branch_1",)
+        ) == frozenset(types)
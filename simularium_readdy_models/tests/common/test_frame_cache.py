@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+
+import json
+import os
+import pickle
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from simularium_readdy_models.common import FrameCache, ReaddyUtil
+from simularium_readdy_models.tests.conftest import (
+    SMALL_TRAJECTORY_REACTIONS,
+    assert_monomer_data_equal,
+    write_small_trajectory,
+)
+
+
+def read_trajectory(h5_file_path, stride=1, cache_path=None, save_cache=False):
+    return ReaddyUtil.monomer_data_and_reactions_from_file(
+        h5_file_path,
+        stride=stride,
+        reaction_names=SMALL_TRAJECTORY_REACTIONS,
+        cache_path=cache_path,
+        save_cache=save_cache,
+    )
+
+
+@pytest.fixture
+def trajectory(small_trajectory, tmp_path):
+    """
+    a copy of the small trajectory that a test can overwrite.
+    """
+    h5_file_path = str(tmp_path / "small.h5")
+    shutil.copy2(small_trajectory, h5_file_path)
+    return h5_file_path
+
+
+def test_write_and_open(trajectory, tmp_path):
+    monomer_data, reactions, times, time_inc_s = read_trajectory(trajectory)
+    cache_path = str(tmp_path / "frames")
+    key = FrameCache.key(trajectory, 1, 0.1, SMALL_TRAJECTORY_REACTIONS)
+    FrameCache.write(cache_path, key, monomer_data, times, reactions, time_inc_s)
+    cache = FrameCache.open(cache_path, key)
+    assert cache is not None
+    assert not os.path.exists(cache_path + ".tmp")
+    assert_monomer_data_equal(
+        [frame.to_monomer_data() for frame in cache], monomer_data
+    )
+    np.testing.assert_array_equal(cache.times, times)
+    assert cache.time_inc_s == time_inc_s
+    pd.testing.assert_frame_equal(cache.reactions, reactions)
+
+
+def test_reload_from_cache(trajectory, tmp_path):
+    cache_path = str(tmp_path / "frames")
+    monomer_data, reactions, times, time_inc_s = read_trajectory(
+        trajectory, cache_path=cache_path, save_cache=True
+    )
+    assert os.path.isfile(os.path.join(cache_path, "meta.json"))
+    (
+        cached_monomer_data,
+        cached_reactions,
+        cached_times,
+        cached_time_inc_s,
+    ) = read_trajectory(trajectory, cache_path=cache_path)
+    assert_monomer_data_equal(cached_monomer_data, monomer_data)
+    # reaction counts keep their integer dtype
+    pd.testing.assert_frame_equal(cached_reactions, reactions)
+    np.testing.assert_array_equal(cached_times, times)
+    assert cached_time_inc_s == time_inc_s
+
+
+def test_rebuild_when_stride_changes(trajectory, tmp_path):
+    cache_path = str(tmp_path / "frames")
+    read_trajectory(trajectory, cache_path=cache_path, save_cache=True)
+    assert (
+        FrameCache.open(
+            cache_path, FrameCache.key(trajectory, 2, 0.1, SMALL_TRAJECTORY_REACTIONS)
+        )
+        is None
+    )
+    monomer_data, reactions, times, _ = read_trajectory(
+        trajectory, stride=2, cache_path=cache_path, save_cache=True
+    )
+    expected_monomer_data, expected_reactions, expected_times, _ = read_trajectory(
+        trajectory, stride=2
+    )
+    assert_monomer_data_equal(monomer_data, expected_monomer_data)
+    pd.testing.assert_frame_equal(reactions, expected_reactions)
+    np.testing.assert_array_equal(times, expected_times)
+    assert (
+        FrameCache.open(
+            cache_path, FrameCache.key(trajectory, 2, 0.1, SMALL_TRAJECTORY_REACTIONS)
+        )
+        is not None
+    )
+
+
+def test_rebuild_when_reactions_change(trajectory, tmp_path):
+    cache_path = str(tmp_path / "frames")
+    read_trajectory(trajectory, cache_path=cache_path, save_cache=True)
+    reaction_names = {"Total": ["convert"]}
+    assert (
+        FrameCache.open(cache_path, FrameCache.key(trajectory, 1, 0.1, reaction_names))
+        is None
+    )
+    _, reactions, _, _ = ReaddyUtil.monomer_data_and_reactions_from_file(
+        trajectory, reaction_names=reaction_names, cache_path=cache_path
+    )
+    assert list(reactions.columns) == ["convert", "Total"]
+
+
+def test_rebuild_when_trajectory_changes(trajectory, tmp_path):
+    cache_path = str(tmp_path / "frames")
+    monomer_data, _, _, _ = read_trajectory(
+        trajectory, cache_path=cache_path, save_cache=True
+    )
+    os.remove(trajectory)
+    write_small_trajectory(trajectory, n_steps=100)
+    expected_monomer_data, _, _, _ = read_trajectory(trajectory)
+    assert len(expected_monomer_data) != len(monomer_data)
+    cached_monomer_data, _, _, _ = read_trajectory(trajectory, cache_path=cache_path)
+    assert_monomer_data_equal(cached_monomer_data, expected_monomer_data)
+
+
+def test_leftover_tmp_directory(trajectory, tmp_path):
+    cache_path = str(tmp_path / "frames")
+    # an interrupted write leaves arrays but no meta.json in the tmp directory
+    os.makedirs(cache_path + ".tmp")
+    np.save(os.path.join(cache_path + ".tmp", "ids.npy"), np.arange(3))
+    assert FrameCache.open(cache_path + ".tmp", None) is None
+    monomer_data, _, _, _ = read_trajectory(
+        trajectory, cache_path=cache_path, save_cache=True
+    )
+    assert not os.path.exists(cache_path + ".tmp")
+    cached_monomer_data, _, _, _ = read_trajectory(trajectory, cache_path=cache_path)
+    assert_monomer_data_equal(cached_monomer_data, monomer_data)
+
+
+@pytest.mark.parametrize(
+    "break_cache",
+    [
+        lambda cache_path: os.remove(os.path.join(cache_path, "meta.json")),
+        lambda cache_path: os.remove(os.path.join(cache_path, "positions.npy")),
+        lambda cache_path: open(os.path.join(cache_path, "meta.json"), "w").close(),
+    ],
+)
+def test_incomplete_cache_is_rebuilt(trajectory, tmp_path, break_cache):
+    cache_path = str(tmp_path / "frames")
+    monomer_data, _, _, _ = read_trajectory(
+        trajectory, cache_path=cache_path, save_cache=True
+    )
+    key = FrameCache.key(trajectory, 1, 0.1, SMALL_TRAJECTORY_REACTIONS)
+    break_cache(cache_path)
+    assert FrameCache.open(cache_path, key) is None
+    rebuilt_monomer_data, _, _, _ = read_trajectory(
+        trajectory, cache_path=cache_path, save_cache=True
+    )
+    assert_monomer_data_equal(rebuilt_monomer_data, monomer_data)
+    assert FrameCache.open(cache_path, key) is not None
+
+
+def test_cache_path_is_a_file(trajectory, tmp_path):
+    cache_path = str(tmp_path / "frames.dat")
+    with open(cache_path, "w") as f:
+        json.dump({}, f)
+    with pytest.raises(Exception, match="is not a shaped data cache"):
+        read_trajectory(trajectory, cache_path=cache_path, save_cache=True)
+
+
+def test_deprecated_pickle_arguments(trajectory, tmp_path):
+    cache_path = str(tmp_path / "frames")
+    with pytest.warns(DeprecationWarning, match="save_pickle_file"):
+        with pytest.warns(DeprecationWarning, match="pickle_file_path"):
+            monomer_data, _, _, _ = ReaddyUtil.monomer_data_and_reactions_from_file(
+                trajectory,
+                reaction_names=SMALL_TRAJECTORY_REACTIONS,
+                pickle_file_path=cache_path,
+                save_pickle_file=True,
+            )
+    key = FrameCache.key(trajectory, 1, 0.1, SMALL_TRAJECTORY_REACTIONS)
+    cache = FrameCache.open(cache_path, key)
+    assert cache is not None
+    assert_monomer_data_equal(
+        [frame.to_monomer_data() for frame in cache], monomer_data
+    )
+
+
+def test_deprecated_pickle_arguments_with_old_pickle(trajectory, tmp_path):
+    pickle_file_path = str(tmp_path / "shaped.pkl")
+    with open(pickle_file_path, "wb") as f:
+        pickle.dump([[], None, [], None], f)
+    with open(pickle_file_path, "rb") as f:
+        old_pickle = f.read()
+    with pytest.warns(DeprecationWarning):
+        monomer_data, _, _, _ = ReaddyUtil.monomer_data_and_reactions_from_file(
+            trajectory,
+            reaction_names=SMALL_TRAJECTORY_REACTIONS,
+            pickle_file_path=pickle_file_path,
+            save_pickle_file=True,
+        )
+    # the old pickle is left as it is and the cache is saved next to it
+    with open(pickle_file_path, "rb") as f:
+        assert f.read() == old_pickle
+    key = FrameCache.key(trajectory, 1, 0.1, SMALL_TRAJECTORY_REACTIONS)
+    assert FrameCache.open(pickle_file_path + ".cache", key) is not None
+    with pytest.warns(DeprecationWarning):
+        (
+            cached_monomer_data,
+            _,
+            _,
+            _,
+        ) = ReaddyUtil.monomer_data_and_reactions_from_file(
+            trajectory,
+            reaction_names=SMALL_TRAJECTORY_REACTIONS,
+            pickle_file_path=pickle_file_path,
+        )
+    assert_monomer_data_equal(cached_monomer_data, monomer_data)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+import numpy as np
+import pytest
+import readdy
+
+from simularium_readdy_models.common import FrameData, ReaddyUtil
+from simularium_readdy_models.tests.conftest import (
+    SMALL_TRAJECTORY_REACTIONS,
+    assert_monomer_data_equal,
+)
+
+
+def read_records(h5_file_path):
+    trajectory = readdy.Trajectory(h5_file_path)
+    _, topology_records = trajectory.read_observable_topologies()
+    _, types, ids, positions = trajectory.read_observable_particles()
+    return trajectory, topology_records, ids, types, positions
+
+
+def test_from_records(small_trajectory):
+    trajectory, topology_records, ids, types, positions = read_records(small_trajectory)
+    for t in range(len(topology_records)):
+        expected = ReaddyUtil._shape_frame_monomer_data_from_file(
+            t, topology_records, ids, types, positions, trajectory
+        )
+        frame = FrameData.from_records(
+            t, topology_records, ids, types, positions, trajectory
+        )
+        assert_monomer_data_equal([frame], [expected])
+        assert_monomer_data_equal([frame.to_monomer_data()], [expected])
+
+
+def test_from_monomer_data(small_trajectory):
+    monomer_data, _, _, _ = ReaddyUtil.monomer_data_and_reactions_from_file(
+        small_trajectory
+    )
+    frames = [FrameData.from_monomer_data(frame) for frame in monomer_data]
+    assert_monomer_data_equal(frames, monomer_data)
+    assert_monomer_data_equal(
+        [frame.to_monomer_data() for frame in frames], monomer_data
+    )
+
+
+def test_columnar_monomer_data(small_trajectory):
+    monomer_data, _, times, _ = ReaddyUtil.monomer_data_and_reactions_from_file(
+        small_trajectory, reaction_names=SMALL_TRAJECTORY_REACTIONS
+    )
+    frames, _, columnar_times, _ = ReaddyUtil.monomer_data_and_reactions_from_file(
+        small_trajectory, reaction_names=SMALL_TRAJECTORY_REACTIONS, columnar=True
+    )
+    assert all(isinstance(frame, FrameData) for frame in frames)
+    assert_monomer_data_equal(frames, monomer_data)
+    np.testing.assert_array_equal(columnar_times, times)
+
+
+def test_views(small_trajectory):
+    trajectory, topology_records, ids, types, positions = read_records(small_trajectory)
+    expected = ReaddyUtil._shape_frame_monomer_data_from_file(
+        0, topology_records, ids, types, positions, trajectory
+    )
+    frame = FrameData.from_records(
+        0, topology_records, ids, types, positions, trajectory
+    )
+    assert list(frame.keys()) == list(expected.keys())
+    assert "particles" in frame and "monomers" not in frame
+    particles = frame["particles"]
+    assert len(particles) == len(expected["particles"])
+    assert all(particle_id in particles for particle_id in expected["particles"])
+    assert -1 not in particles and "A#x" not in particles
+    with pytest.raises(KeyError):
+        particles[-1]
+    topologies = frame["topologies"]
+    assert len(topologies) == len(expected["topologies"])
+    assert list(topologies) == list(expected["topologies"])
+    with pytest.raises(KeyError):
+        topologies[len(topologies)]
+    with pytest.raises(KeyError):
+        frame["monomers"]
+    type_counts = frame.type_counts()
+    for type_name in frame.type_names:
+        assert type_counts[frame.type_code(type_name)] == sum(
+            particle["type_name"] == type_name
+            for particle in expected["particles"].values()
+        )
+    assert frame.type_code("missing") == -1
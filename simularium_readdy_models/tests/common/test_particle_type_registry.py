@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+import pytest
+
+from simularium_readdy_models.common import ParticleTypeRegistry, ReaddyUtil
+
+
+def type_with_flags_from_strings(
+    particle_type, add_flags, remove_flags, reverse_sort=False
+):
+    """
+    the previous implementation of ReaddyUtil.particle_type_with_flags.
+    """
+    if "#" not in particle_type:
+        for f in range(len(add_flags)):
+            particle_type = particle_type + ("_" if f > 0 else "#") + add_flags[f]
+        return particle_type
+    flag_string = particle_type[particle_type.index("#") + 1 :]
+    flags = flag_string.split("_")
+    polymer_indices = ""
+    if "tubulin" in particle_type and len(flags) > 1:
+        polymer_indices = f"_{flags[-2]}_{flags[-1]}"
+        flags = flags[:-2]
+    for flag in remove_flags:
+        if flag in flags:
+            flags.remove(flag)
+    for flag in add_flags:
+        if flag not in flags:
+            flags.append(flag)
+    if "" in flags:
+        flags.remove("")
+    if len(flags) < 1:
+        return particle_type[: particle_type.index("#")]
+    flags.sort(reverse=reverse_sort)
+    flag_string = ""
+    for f in range(len(flags)):
+        flag_string = flag_string + ("_" if f > 0 else "") + flags[f]
+    particle_type = particle_type[: particle_type.index("#")]
+    return f"{particle_type}#{flag_string}{polymer_indices}"
+
+
+@pytest.mark.parametrize(
+    "particle_type, add_flags, remove_flags, reverse_sort",
+    [
+        ("actin#ATP_1", ["barbed"], [], False),
+        ("actin#ATP_1", ["barbed"], ["ATP"], False),
+        ("actin#mid_ATP_3", [], ["mid", "ATP"], False),
+        ("actin#pointed_fixed_ATP_2", ["barbed"], ["pointed"], True),
+        ("actin#free", [], ["free"], False),
+        ("arp2", ["branched"], [], False),
+        ("arp2", ["ATP", "branched"], [], False),
+        ("tubulinA#GTP_bent_2_3", [], ["bent"], False),
+        ("tubulinB#GDP_1_1", ["GTP"], ["GDP"], False),
+        ("tubulinA#GTP_2_3", ["bent"], [], True),
+        ("site#1_GTP", ["detach"], ["GTP"], False),
+        ("motor#ADP", [], ["ADP"], False),
+    ],
+)
+def test_with_flags(particle_type, add_flags, remove_flags, reverse_sort):
+    ParticleTypeRegistry.clear()
+    expected = type_with_flags_from_strings(
+        particle_type, add_flags, remove_flags, reverse_sort
+    )
+    for _ in range(2):
+        # the second time the transition is looked up instead of computed
+        assert (
+            ParticleTypeRegistry.with_flags(
+                particle_type, add_flags, remove_flags, reverse_sort
+            )
+            == expected
+        )
+        assert (
+            ReaddyUtil.particle_type_with_flags(
+                particle_type, add_flags, remove_flags, reverse_sort
+            )
+            == expected
+        )
+
+
+def test_get():
+    info = ParticleTypeRegistry.get("tubulinA#GTP_bent_2_3")
+    assert info.base == "tubulinA"
+    assert info.flags == ("GTP", "bent")
+    assert info.polymer_indices == (2, 3)
+    assert info.has_flag("bent") and not info.has_flag("GDP")
+    assert ParticleTypeRegistry.get("tubulinA#GTP_bent_2_3") is info
+    assert ParticleTypeRegistry.polymer_number("actin#mid_ATP_3") == 3
+    assert ParticleTypeRegistry.get("arp3").flags == ()
+    ParticleTypeRegistry.clear()
+    assert ParticleTypeRegistry.get("tubulinA#GTP_bent_2_3") is not info
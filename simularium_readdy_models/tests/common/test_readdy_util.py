@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+
+import numpy as np
+import pytest
+import readdy
+import scipy.linalg as linalg
+
+from simularium_readdy_models.common import FrameData, ReaddyUtil
+from simularium_readdy_models.tests.conftest import assert_monomer_data_equal
+
+
+def rotate_with_expm(v, axis, angle):
+    """
+    the previous implementation of ReaddyUtil.rotate.
+    """
+    rotation = linalg.expm(np.cross(np.eye(3), ReaddyUtil.normalize(axis) * angle))
+    return np.dot(rotation, np.copy(v))
+
+
+@pytest.mark.parametrize(
+    "v, axis, angle",
+    [
+        (np.array([1.0, 0.0, 0.0]), np.array([0.0, 0.0, 1.0]), np.pi / 2.0),
+        (np.array([1.0, 2.0, 3.0]), np.array([0.0, 0.0, 1.0]), 0.0),
+        (np.array([1.0, 2.0, 3.0]), np.array([1.0, 2.0, 3.0]), 1.3),
+        (np.array([-4.5, 0.2, 7.0]), np.array([0.3, -0.8, 0.1]), -2.7),
+        (np.array([10.0, -3.0, 0.5]), np.array([5.0, 5.0, -2.0]), 2.0 * np.pi),
+        (np.array([0.0, 1.0, 0.0]), np.array([0.0, 0.0, 0.0]), 0.8),
+        (np.array([2, 0, 1]), np.array([0, 1, 0]), np.deg2rad(10.0)),
+    ],
+)
+def test_rotate(v, axis, angle):
+    expected = rotate_with_expm(v, axis, angle)
+    np.testing.assert_allclose(ReaddyUtil.rotate(v, axis, angle), expected, atol=1e-9)
+    np.testing.assert_allclose(
+        ReaddyUtil.rotate_vectors(v, axis, angle), expected, atol=1e-9
+    )
+
+
+def test_rotate_vectors():
+    rng = np.random.default_rng(42)
+    vectors = rng.uniform(-10.0, 10.0, size=(5, 3))
+    axis = rng.uniform(-1.0, 1.0, size=3)
+    angles = rng.uniform(-np.pi, np.pi, size=4)
+    result = ReaddyUtil.rotate_vectors(vectors, axis, angles[:, np.newaxis])
+    assert result.shape == (4, 5, 3)
+    for m in range(len(angles)):
+        for n in range(len(vectors)):
+            np.testing.assert_allclose(
+                result[m, n],
+                rotate_with_expm(vectors[n], axis, angles[m]),
+                atol=1e-9,
+            )
+    axes = rng.uniform(-1.0, 1.0, size=(5, 3))
+    result = ReaddyUtil.rotate_vectors(vectors, axes, angles[0])
+    for n in range(len(vectors)):
+        np.testing.assert_allclose(
+            result[n], rotate_with_expm(vectors[n], axes[n], angles[0]), atol=1e-9
+        )
+
+
+def test_get_non_periodic_boundary_positions():
+    rng = np.random.default_rng(7)
+    box_size = np.array([100.0, 200.0, 50.0])
+    positions1 = rng.uniform(-0.5, 0.5, size=(20, 3)) * box_size
+    positions2 = rng.uniform(-0.5, 0.5, size=(20, 3)) * box_size
+    result = ReaddyUtil.get_non_periodic_boundary_positions(
+        positions1, positions2, box_size
+    )
+    for n in range(len(positions1)):
+        np.testing.assert_allclose(
+            result[n],
+            ReaddyUtil.get_non_periodic_boundary_position(
+                positions1[n], positions2[n], box_size
+            ),
+        )
+
+
+def test_get_non_periodic_boundary_chain():
+    box_size = np.array([100.0, 200.0, 50.0])
+    steps = np.random.default_rng(3).uniform(-4.0, 4.0, size=(40, 3))
+    chain = np.cumsum(steps, axis=0) + np.array([40.0, -90.0, 20.0])
+    wrapped = (chain + box_size / 2.0) % box_size - box_size / 2.0
+    start_position = np.array([45.0, -95.0, 22.0])
+    result = ReaddyUtil.get_non_periodic_boundary_chain(
+        wrapped, box_size, start_position
+    )
+    last_position = start_position
+    for n in range(len(wrapped)):
+        last_position = ReaddyUtil.get_non_periodic_boundary_position(
+            last_position, wrapped[n], box_size
+        )
+        np.testing.assert_allclose(result[n], last_position, atol=1e-9)
+    np.testing.assert_allclose(result, chain, atol=1e-9)
+
+
+def test_analyze_type_class_counts():
+    particle_types = {"A": 0, "B": 1, "C": 2}
+    types = [np.array([0, 0, 1, 2]), np.array([], dtype=int), np.array([2, 2, 1])]
+    type_classes = {"AB": ["A", "B"], "C": ["C", "D"], "none": []}
+    counts = ReaddyUtil.analyze_type_class_counts(types, particle_types, type_classes)
+    np.testing.assert_array_equal(counts["AB"], [3, 0, 1])
+    np.testing.assert_array_equal(counts["C"], [1, 0, 2])
+    np.testing.assert_array_equal(counts["none"], [0, 0, 0])
+
+
+@pytest.mark.parametrize(
+    "stride, min_time, max_time, columnar",
+    [
+        (1, 0, None, False),
+        (3, 2, 15, False),
+        (2, 0, None, True),
+        (4, 5, 100, True),
+    ],
+)
+def test_iter_monomer_data_from_file(
+    small_trajectory, stride, min_time, max_time, columnar
+):
+    monomer_data, _, times, _ = ReaddyUtil.monomer_data_and_reactions_from_file(
+        small_trajectory
+    )
+    time_indices = ReaddyUtil._frame_time_indices(
+        min_time, len(times) if max_time is None else max_time, stride, len(times)
+    )
+    frames = list(
+        ReaddyUtil.iter_monomer_data_from_file(
+            small_trajectory,
+            stride=stride,
+            min_time=min_time,
+            max_time=max_time,
+            columnar=columnar,
+        )
+    )
+    assert len(frames) == len(time_indices) > 0
+    assert all(isinstance(frame, FrameData) == columnar for _, frame in frames)
+    assert_monomer_data_equal(
+        [frame for _, frame in frames], [monomer_data[t] for t in time_indices]
+    )
+    np.testing.assert_allclose(
+        [time for time, _ in frames], [times[t] for t in time_indices]
+    )
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_monomer_data_with_workers(small_trajectory, columnar):
+    monomer_data, _, times, _ = ReaddyUtil.monomer_data_and_reactions_from_file(
+        small_trajectory, stride=2, columnar=columnar
+    )
+    (
+        parallel_monomer_data,
+        _,
+        parallel_times,
+        _,
+    ) = ReaddyUtil.monomer_data_and_reactions_from_file(
+        small_trajectory, stride=2, columnar=columnar, n_workers=3
+    )
+    assert all(
+        isinstance(frame, FrameData) == columnar for frame in parallel_monomer_data
+    )
+    assert_monomer_data_equal(parallel_monomer_data, monomer_data)
+    np.testing.assert_array_equal(parallel_times, times)
+
+
+@pytest.mark.parametrize(
+    "min_time, max_time, stride",
+    [
+        (0, None, 1),
+        (0, None, 3),
+        (4, 13, 2),
+        (19, 100, 5),
+        (30, None, 1),
+    ],
+)
+def test_read_observables_window(small_trajectory, min_time, max_time, stride):
+    trajectory = readdy.Trajectory(small_trajectory)
+    expected_times, expected_topology_records = trajectory.read_observable_topologies()
+    _, expected_types, expected_ids, expected_positions = (
+        trajectory.read_observable_particles()
+    )
+    time_indices = ReaddyUtil._frame_time_indices(
+        min_time,
+        len(expected_times) if max_time is None else max_time,
+        stride,
+        len(expected_times),
+    )
+    (
+        times,
+        topology_records,
+        ids,
+        types,
+        positions,
+    ) = ReaddyUtil.read_observables_window(small_trajectory, min_time, max_time, stride)
+    np.testing.assert_array_equal(times, [expected_times[t] for t in time_indices])
+    assert len(topology_records) == len(ids) == len(time_indices)
+    for index, t in enumerate(time_indices):
+        np.testing.assert_array_equal(ids[index], expected_ids[t])
+        np.testing.assert_array_equal(types[index], expected_types[t])
+        np.testing.assert_array_equal(positions[index], expected_positions[t])
+        assert len(topology_records[index]) == len(expected_topology_records[t])
+        for top, expected_top in zip(
+            topology_records[index], expected_topology_records[t]
+        ):
+            assert top.type == expected_top.type
+            assert list(top.particles) == list(expected_top.particles)
+            assert list(top.edges) == list(expected_top.edges)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+import numpy as np
+import pytest
+import readdy
+
+from simularium_readdy_models.common import ReaddyUtil, SystemSpec
+
+
+def build_system(system):
+    """
+    add species and potentials with every method a SystemSpec records,
+    including arguments that the fast topology methods don't handle.
+    """
+    system.add_species("free", 1.5)
+    system.add_topology_species("A", 2.0)
+    system.add_topology_species("B", np.float64(0.5))
+    system.topologies.add_type("Polymer")
+    system.topologies.configure_harmonic_bond("A", "B", 10.0, 1.0)
+    system.topologies.configure_harmonic_bond("A", "A", force_constant=5.0, length=2.0)
+    system.topologies.configure_harmonic_bond("B", "B", np.float64(3.0), 1)
+    system.topologies.configure_harmonic_angle("A", "B", "A", 20.0, np.pi)
+    system.topologies.configure_harmonic_angle(
+        "B", "A", "B", force_constant=30.0, equilibrium_angle=1.0
+    )
+    system.topologies.configure_cosine_dihedral("A", "B", "A", "B", 4.0, 1, 0.3)
+    system.potentials.add_harmonic_repulsion("free", "A", 7.0, 2.0)
+    system.potentials.add_box(
+        "free", 10.0, np.array([-5.0, -5.0, -5.0]), np.array([10.0, 10.0, 10.0])
+    )
+
+
+def new_system():
+    system = readdy.ReactionDiffusionSystem(box_size=[20.0, 20.0, 20.0])
+    system.temperature = 300.0
+    return system
+
+
+def describe(system):
+    return system._context.describe()
+
+
+@pytest.fixture
+def direct_system():
+    system = new_system()
+    build_system(system)
+    return system
+
+
+def test_apply(direct_system):
+    spec = SystemSpec()
+    build_system(spec)
+    system = new_system()
+    spec.apply(system)
+    assert describe(system) == describe(direct_system)
+
+
+def test_apply_without_fast_methods(direct_system, monkeypatch):
+    # importing a module set to None in sys.modules raises ImportError
+    monkeypatch.setitem(sys.modules, "readdy._internal.readdybinding.api", None)
+    system = new_system()
+    assert SystemSpec._fast_topology_methods(system.topologies) == {}
+    spec = SystemSpec()
+    build_system(spec)
+    spec.apply(system)
+    assert describe(system) == describe(direct_system)
+
+
+def test_save_and_load(direct_system, tmp_path):
+    spec = SystemSpec()
+    build_system(spec)
+    file_path = str(tmp_path / "spec.json")
+    spec.save(file_path)
+    assert not os.path.exists(file_path + ".tmp")
+    loaded_spec = SystemSpec.load(file_path)
+    assert loaded_spec.calls == spec.calls
+    system = new_system()
+    loaded_spec.apply(system)
+    assert describe(system) == describe(direct_system)
+
+
+def test_load_other_version(tmp_path, monkeypatch):
+    spec = SystemSpec()
+    build_system(spec)
+    file_path = str(tmp_path / "spec.json")
+    spec.save(file_path)
+    monkeypatch.setattr(SystemSpec, "VERSION", SystemSpec.VERSION + 1)
+    assert SystemSpec.load(file_path) is None
+
+
+def test_load_or_build(tmp_path):
+    builds = []
+
+    def build(spec):
+        builds.append(spec)
+        build_system(spec)
+
+    cache_path = str(tmp_path / "specs")
+    spec = SystemSpec.load_or_build(cache_path, "abc", build)
+    assert len(builds) == 1
+    assert os.path.isfile(os.path.join(cache_path, "system_spec_abc.json"))
+    loaded_spec = SystemSpec.load_or_build(cache_path, "abc", build)
+    assert len(builds) == 1
+    assert loaded_spec.calls == spec.calls
+    SystemSpec.load_or_build(cache_path, "def", build)
+    assert len(builds) == 2
+    SystemSpec.load_or_build(None, "abc", build)
+    SystemSpec.load_or_build(None, "abc", build)
+    assert len(builds) == 4
+
+
+def test_key():
+    parameters = {"box_size": 100.0, "n_cpu": 4, "plot_bonds": True}
+    ignored_parameters = ["n_cpu", "plot_*"]
+    key = SystemSpec.key(parameters, ignored_parameters, [SystemSpec])
+    assert key == SystemSpec.key(dict(parameters), ignored_parameters, [SystemSpec])
+    assert key == SystemSpec.key(
+        {"box_size": np.float64(100.0), "n_cpu": 8, "plot_bonds": False},
+        ignored_parameters,
+        [SystemSpec],
+    )
+    assert key != SystemSpec.key(
+        {"box_size": 200.0, "n_cpu": 4, "plot_bonds": True},
+        ignored_parameters,
+        [SystemSpec],
+    )
+    assert key != SystemSpec.key(parameters, ["n_cpu"], [SystemSpec])
+    assert key != SystemSpec.key(
+        parameters, ignored_parameters, [SystemSpec, ReaddyUtil]
+    )
+
+
+def test_record_unknown_method():
+    spec = SystemSpec()
+    with pytest.raises(Exception, match="can't be recorded"):
+        spec.potentials.add_sphere("free", 1.0, [0.0, 0.0, 0.0], 5.0, True)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+import random
+
+import pytest
+
+from simularium_readdy_models.common import ReaddyUtil, TopologyIndex
+from simularium_readdy_models.tests.conftest import RecordedTopology
+
+
+def branched_topology():
+    """
+    get a topology with repeated types in no particular order.
+    """
+    return RecordedTopology(
+        [
+            "actin#barbed_ATP_3",
+            "actin#pointed_1",
+            "actin#ATP_2",
+            "arp2#branched",
+            "actin#mid_ATP_2",
+            "arp3#ATP",
+            "actin#ATP_2",
+            "actin#branch_1",
+            "actin#barbed_3",
+        ],
+        [(1, 2), (2, 4), (4, 6), (6, 0), (4, 3), (6, 5), (3, 5), (3, 7), (7, 8)],
+        ids=[10, 11, 12, 13, 14, 15, 16, 17, 18],
+    )
+
+
+def indices(vertices):
+    return [vertex.particle_index for vertex in vertices]
+
+
+@pytest.mark.parametrize(
+    "vertex_type, exact_match",
+    [
+        ("actin#ATP_2", True),
+        ("ATP", False),
+        ("actin", False),
+        ("barbed", False),
+        ("actin#free", True),
+    ],
+)
+def test_vertices_of_type(vertex_type, exact_match):
+    topology = branched_topology()
+    index = TopologyIndex(topology)
+    expected = ReaddyUtil.get_vertices_of_type(topology, vertex_type, exact_match)
+    result = ReaddyUtil.get_vertices_of_type(
+        topology, vertex_type, exact_match, index=index
+    )
+    assert indices(result) == indices(expected)
+    assert ReaddyUtil.get_vertex_of_type(
+        topology, vertex_type, exact_match, index=index
+    ) is ReaddyUtil.get_vertex_of_type(topology, vertex_type, exact_match)
+
+
+@pytest.mark.parametrize(
+    "vertex_types",
+    [
+        ["actin#barbed_3", "actin#ATP_2"],
+        ["arp3#ATP", "actin#branch_1", "actin#pointed_1"],
+        ["cap"],
+    ],
+)
+def test_vertices_of_types(vertex_types):
+    topology = branched_topology()
+    index = TopologyIndex(topology)
+    assert ReaddyUtil.get_first_vertex_of_types(
+        topology, vertex_types, index=index
+    ) is ReaddyUtil.get_first_vertex_of_types(topology, vertex_types)
+    random.seed(2)
+    expected = ReaddyUtil.get_random_vertex_of_types(topology, vertex_types)
+    random.seed(2)
+    result = ReaddyUtil.get_random_vertex_of_types(topology, vertex_types, index=index)
+    assert result is expected
+
+
+def test_neighbors_and_ids():
+    topology = branched_topology()
+    index = TopologyIndex(topology)
+    for vertex in topology.get_vertices():
+        for exclude in [[], [vertex.neighbors[0]]]:
+            assert ReaddyUtil.get_neighbor_of_types(
+                topology, vertex, ["actin#ATP_2", "arp3#ATP"], exclude, index=index
+            ) is ReaddyUtil.get_neighbor_of_types(
+                topology, vertex, ["actin#ATP_2", "arp3#ATP"], exclude
+            )
+            assert ReaddyUtil.get_neighbor_of_type(
+                topology, vertex, "actin", False, exclude, index=index
+            ) is ReaddyUtil.get_neighbor_of_type(
+                topology, vertex, "actin", False, exclude
+            )
+        assert indices(
+            ReaddyUtil.get_neighbors_of_type(
+                topology, vertex, "ATP", False, index=index
+            )
+        ) == indices(ReaddyUtil.get_neighbors_of_type(topology, vertex, "ATP", False))
+    for particle_id in [10, 14, 18, 99]:
+        assert ReaddyUtil.get_vertex_with_id(
+            topology, particle_id, index=index
+        ) is ReaddyUtil.get_vertex_with_id(topology, particle_id)
+    assert indices(index.vertices_with_flag("ATP")) == [0, 2, 4, 5, 6]
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 
 import numpy as np
+import pytest
+import readdy
 
 from simularium_readdy_models.actin import ActinStructure
 
@@ -106,6 +108,24 @@ def assert_fibers_equal(topology_fibers1, topology_fibers2, test_position=False)
             )
 
 
+def assert_monomer_data_equal(monomer_data1, monomer_data2):
+    assert len(monomer_data1) == len(monomer_data2)
+    for frame1, frame2 in zip(monomer_data1, monomer_data2):
+        assert list(frame1["topologies"].keys()) == list(frame2["topologies"].keys())
+        for index in frame1["topologies"]:
+            topology1 = frame1["topologies"][index]
+            topology2 = frame2["topologies"][index]
+            assert topology1["type_name"] == topology2["type_name"]
+            assert list(topology1["particle_ids"]) == list(topology2["particle_ids"])
+        assert list(frame1["particles"].keys()) == list(frame2["particles"].keys())
+        for particle_id in frame1["particles"]:
+            particle1 = frame1["particles"][particle_id]
+            particle2 = frame2["particles"][particle_id]
+            assert particle1["type_name"] == particle2["type_name"]
+            np.testing.assert_array_equal(particle1["position"], particle2["position"])
+            assert list(particle1["neighbor_ids"]) == list(particle2["neighbor_ids"])
+
+
 def monomer():
     return {
         "topologies": {
@@ -153,3 +173,113 @@ def dimer():
             },
         },
     }
+
+
+class RecordedVertex:
+    """
+    A vertex of a RecordedTopology, iterating over references
+    to its neighbors like a ReaDDy vertex.
+    """
+
+    def __init__(self, particle_index):
+        self.particle_index = particle_index
+        self.neighbors = []
+
+    def get(self):
+        return self
+
+    def __iter__(self):
+        return iter(self.neighbors)
+
+
+class RecordedTopology:
+    """
+    A stand-in for a ReaDDy topology passed to reaction functions,
+    with particle types, ids and positions for each vertex
+    and edges as (vertex index, vertex index).
+    """
+
+    def __init__(self, types, edges, positions=None, ids=None):
+        self.types = list(types)
+        self.ids = list(range(len(types))) if ids is None else list(ids)
+        self.positions = (
+            np.zeros((len(types), 3)) if positions is None else np.array(positions)
+        )
+        self.vertices = [RecordedVertex(index) for index in range(len(types))]
+        for index1, index2 in edges:
+            self.vertices[index1].neighbors.append(self.vertices[index2])
+            self.vertices[index2].neighbors.append(self.vertices[index1])
+        self.graph = self
+
+    def get_vertices(self):
+        return self.vertices
+
+    def particle_type_of_vertex(self, vertex):
+        return self.types[vertex.particle_index]
+
+    def particle_id_of_vertex(self, vertex):
+        return self.ids[vertex.particle_index]
+
+    def position_of_vertex(self, vertex):
+        return self.positions[vertex.particle_index]
+
+
+class RecordedRecipe:
+    """
+    A stand-in for readdy.StructuralReactionRecipe
+    that records the particle type changes.
+    """
+
+    def __init__(self, topology):
+        self.topology = topology
+        self.type_changes = []
+
+    def change_particle_type(self, vertex, particle_type):
+        self.type_changes.append((vertex.particle_index, particle_type))
+
+
+SMALL_TRAJECTORY_REACTIONS = {"Total conversion": ["convert"]}
+
+
+def write_small_trajectory(h5_file_path, n_steps=200):
+    """
+    run a small ReaDDy simulation of branched topologies
+    and free particles that convert, recording every 10 steps
+    and reaction counts every step.
+    """
+    random_state = np.random.RandomState(42)
+    system = readdy.ReactionDiffusionSystem(box_size=[30.0, 30.0, 30.0])
+    system.add_topology_species("A#x", 1.0)
+    system.add_topology_species("B#y", 1.0)
+    system.topologies.add_type("Polymer")
+    system.topologies.configure_harmonic_bond("A#x", "B#y", 10.0, 1.0)
+    system.topologies.configure_harmonic_bond("A#x", "A#x", 10.0, 1.0)
+    system.add_species("free", 1.0)
+    system.add_species("converted", 1.0)
+    system.reactions.add("convert: free -> converted", rate=0.5)
+    simulation = system.simulation("CPU")
+    simulation.output_file = h5_file_path
+    simulation.record_trajectory(10)
+    simulation.observe.topologies(10)
+    simulation.observe.particles(10)
+    simulation.observe.reaction_counts(1)
+    for _ in range(5):
+        topology = simulation.add_topology(
+            "Polymer",
+            ["A#x", "A#x", "B#y", "A#x"],
+            3.0 * random_state.rand(4, 3),
+        )
+        graph = topology.get_graph()
+        graph.add_edge(0, 1)
+        graph.add_edge(1, 2)
+        graph.add_edge(1, 3)
+    simulation.add_particles("free", 10.0 * random_state.rand(20, 3))
+    simulation.run(n_steps, 0.01, show_summary=False)
+    return h5_file_path
+
+
+@pytest.fixture(scope="session")
+def small_trajectory(tmp_path_factory):
+    return write_small_trajectory(
+        str(tmp_path_factory.mktemp("trajectory") / "small.h5")
+    )
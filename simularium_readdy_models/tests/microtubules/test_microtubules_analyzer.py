@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+import numpy as np
+
+from simularium_readdy_models.common import FrameData
+from simularium_readdy_models.microtubules import (
+    MicrotubulesAnalyzer,
+    MicrotubulesUtil,
+)
+
+
+class RecordedGraph:
+    """
+    records the edges MicrotubulesUtil.add_edges adds to a topology.
+    """
+
+    def __init__(self):
+        self.edges = []
+
+    def get_graph(self):
+        return self
+
+    def add_edge(self, vertex1, vertex2):
+        self.edges.append((vertex1, vertex2))
+
+
+def microtubule_monomer_data(n_rings, n_frayed_rings_plus=0, n_frayed_rings_minus=0):
+    """
+    get monomer data for a seed microtubule with 13 protofilaments.
+    """
+    positions, types = MicrotubulesUtil.get_microtubule_positions_and_types(
+        13, n_rings, n_frayed_rings_plus, n_frayed_rings_minus, np.deg2rad(10.0), 10.86
+    )
+    graph = RecordedGraph()
+    MicrotubulesUtil.add_edges(
+        graph, 13, n_rings, n_frayed_rings_plus, n_frayed_rings_minus
+    )
+    particles = {}
+    for index in range(len(types)):
+        particles[index] = {
+            "type_name": types[index],
+            "position": positions[index],
+            "neighbor_ids": [],
+        }
+    for index1, index2 in graph.edges:
+        particles[index1]["neighbor_ids"].append(index2)
+        particles[index2]["neighbor_ids"].append(index1)
+    particles[len(types)] = {
+        "type_name": "tubulinA#free",
+        "position": np.zeros(3),
+        "neighbor_ids": [],
+    }
+    return {"topologies": {}, "particles": particles}
+
+
+def test_get_protofilaments():
+    monomer_data = microtubule_monomer_data(8)
+    expected = [list(range(f * 8, (f + 1) * 8)) for f in range(13)]
+    assert MicrotubulesAnalyzer.get_protofilaments(monomer_data) == expected
+    assert (
+        MicrotubulesAnalyzer.get_protofilaments(
+            FrameData.from_monomer_data(monomer_data)
+        )
+        == expected
+    )
+    assert MicrotubulesAnalyzer.get_plus_and_minus_end_neighbors(9, monomer_data) == (
+        10,
+        8,
+    )
+
+
+def test_analyze_lattice_metrics():
+    monomer_data = [microtubule_monomer_data(12), microtubule_monomer_data(20, 2, 3)]
+    metrics = MicrotubulesAnalyzer.analyze_lattice_metrics(monomer_data)
+    # the last 3 rings of the last protofilament have no bonds across the seam
+    np.testing.assert_array_equal(metrics["lateral_bonds"], [12 * 12 + 9, 12 * 15 + 12])
+    np.testing.assert_array_equal(metrics["seam_bonds"], [9, 12])
+    np.testing.assert_allclose(metrics["bent_fraction"], [0.0, 5.0 / 20.0])
+    np.testing.assert_allclose(metrics["ring_closure"][0], 150.0 / 156.0)
+    assert len(metrics["GTP_cap_lengths"][1]) == 13
+    # the protofilaments of the seed are staggered along the 3-start helix
+    np.testing.assert_allclose(metrics["tip_taper"], 12 * 12.0 / 13.0)
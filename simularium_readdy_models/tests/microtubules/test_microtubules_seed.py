@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+
+import random
+
+import numpy as np
+import pytest
+
+from simularium_readdy_models.microtubules import MicrotubulesSeed
+
+
+@pytest.mark.parametrize(
+    "n_rings, n_frayed_rings_plus, n_frayed_rings_minus",
+    [(8, 0, 0), (20, 3, 2), (20, 0, 3), (20, 3, 0)],
+)
+def test_seed(n_rings, n_frayed_rings_plus, n_frayed_rings_minus):
+    seed = MicrotubulesSeed.get(
+        13,
+        n_rings,
+        n_frayed_rings_plus,
+        n_frayed_rings_minus,
+        np.deg2rad(10.0),
+        10.86,
+    )
+    assert (
+        MicrotubulesSeed.get(
+            13,
+            n_rings,
+            n_frayed_rings_plus,
+            n_frayed_rings_minus,
+            np.deg2rad(10.0),
+            10.86,
+        )
+        is seed
+    )
+    random.seed(1)
+    types = seed.types()
+    assert len(types) == len(seed.positions)
+    assert sum("tubulin" in type_name for type_name in types) == 13 * n_rings
+    edges = seed.edges.tolist()
+    assert len({tuple(sorted(edge)) for edge in edges}) == len(edges)
+    # each site is bonded to the tubulin before it
+    for row, type_name in enumerate(types):
+        if "site" in type_name:
+            tubulin_row = max(r for r in range(row) if "tubulin" in types[r])
+            assert [tubulin_row, row] in edges
+    # each tubulin is 4 nm from the next one in its protofilament
+    for index1, index2 in edges:
+        if "tubulin" in types[index1] and "tubulin" in types[index2]:
+            distance = np.linalg.norm(seed.positions[index1] - seed.positions[index2])
+            assert distance < 6.0
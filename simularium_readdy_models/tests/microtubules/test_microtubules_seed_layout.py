@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+import numpy as np
+import pytest
+
+from simularium_readdy_models.microtubules import (
+    MicrotubulesSeedLayout,
+    MicrotubulesUtil,
+)
+
+
+def seeds_overlap(seed, offsets, spacing):
+    """
+    check whether the bounding boxes of any two seeds overlap
+    by comparing every pair of seeds.
+    """
+    size = np.max(seed.positions, axis=0) - np.min(seed.positions, axis=0) + spacing
+    for index1 in range(len(offsets)):
+        for index2 in range(index1 + 1, len(offsets)):
+            if np.all(np.abs(offsets[index1] - offsets[index2]) < size - 1e-6):
+                return True
+    return False
+
+
+def seeds_in_box(seed, offsets, box_size):
+    """
+    check whether all the particles of all the seeds are in the box.
+    """
+    positions = seed.positions[np.newaxis] + offsets[:, np.newaxis]
+    return np.all(np.abs(positions) <= box_size / 2.0 + 1e-6)
+
+
+def test_grid():
+    seed = MicrotubulesUtil.get_seed(10, 2, 2)
+    box_size = np.array([300.0, 300.0, 100.0])
+    offsets = MicrotubulesSeedLayout.grid(seed, 7, box_size, 5.0)
+    assert offsets.shape == (7, 3)
+    assert not seeds_overlap(seed, offsets, 5.0)
+    assert seeds_in_box(seed, offsets, box_size)
+    with pytest.raises(Exception, match="do not fit in box"):
+        MicrotubulesSeedLayout.grid(seed, 100, box_size, 5.0)
+    with pytest.raises(Exception, match="does not fit in box"):
+        MicrotubulesSeedLayout.grid(seed, 1, np.array([300.0, 300.0, 10.0]))
+
+
+def test_random():
+    np.random.seed(3)
+    seed = MicrotubulesUtil.get_seed(10, 0, 0)
+    box_size = np.array([400.0, 400.0, 300.0])
+    offsets = MicrotubulesSeedLayout.random(seed, 40, box_size, 2.0)
+    assert offsets.shape == (40, 3)
+    assert not seeds_overlap(seed, offsets, 2.0)
+    assert seeds_in_box(seed, offsets, box_size)
+
+
+def test_from_file(tmp_path):
+    seed = MicrotubulesUtil.get_seed(10, 0, 0)
+    box_size = np.array([300.0, 300.0, 300.0])
+    path = tmp_path / "seeds.csv"
+    np.savetxt(path, [[0.0, 0.0, 0.0], [40.0, 0.0, 0.0]], delimiter=",")
+    offsets = MicrotubulesSeedLayout.from_file(path, seed, box_size)
+    np.testing.assert_allclose(offsets, [[0.0, 0.0, 0.0], [40.0, 0.0, 0.0]])
+    np.savetxt(path, [[0.0, 0.0, 0.0], [10.0, 0.0, 0.0]], delimiter=",")
+    with pytest.raises(Exception, match="overlaps another seed"):
+        MicrotubulesSeedLayout.from_file(path, seed, box_size)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+import random
+
+import pytest
+
+from simularium_readdy_models.common import TopologyIndex
+from simularium_readdy_models.microtubules import MicrotubulesUtil
+from simularium_readdy_models.tests.conftest import RecordedTopology
+
+
+def lattice_topology(n_rings, n_filaments, bent_indices=()):
+    """
+    get a topology of tubulins bonded along filaments and around rings,
+    optionally with some bent tubulins.
+    """
+    types = []
+    for x in range(n_rings):
+        for y in range(n_filaments):
+            tubulin = "A" if x % 2 == 0 else "B"
+            state = "GTP_bent" if len(types) in bent_indices else "GTP"
+            types.append(f"tubulin{tubulin}#{state}_{x % 3 + 1}_{y % 3 + 1}")
+    edges = []
+    for x in range(n_rings):
+        for y in range(n_filaments):
+            index = x * n_filaments + y
+            if x + 1 < n_rings:
+                edges.append((index, index + n_filaments))
+            if y + 1 < n_filaments:
+                edges.append((index, index + 1))
+    return RecordedTopology(types, edges)
+
+
+def indices(vertices):
+    if vertices is None:
+        return None
+    return [vertex.particle_index for vertex in vertices]
+
+
+@pytest.mark.parametrize(
+    "n_filaments, expected",
+    [
+        (1, False),
+        (3, True),
+    ],
+)
+def test_topology_is_microtubule(n_filaments, expected):
+    topology = lattice_topology(4, n_filaments)
+    index = TopologyIndex(topology)
+    assert MicrotubulesUtil.topology_is_microtubule(topology) == expected
+    assert MicrotubulesUtil.topology_is_microtubule(topology, index=index) == expected
+
+
+@pytest.mark.parametrize(
+    "types_include, types_exclude, GTP_state, polymer_offsets",
+    [
+        ([["B#", "bent"], ["A#", "bent"]], [[], []], "GTP", [1, 0]),
+        ([["tubulin"], ["tubulin"]], [["bent"], ["bent"]], "GTP", [0, -1]),
+        ([["tubulin"], ["tubulin"]], [["bent"], ["bent"]], "GTP", [0, 1]),
+    ],
+)
+def test_get_random_tubulin_neighbors_with_index(
+    types_include, types_exclude, GTP_state, polymer_offsets
+):
+    topology = lattice_topology(4, 3, bent_indices=(4, 7))
+    index = TopologyIndex(topology)
+    for seed in range(5):
+        random.seed(seed)
+        expected = MicrotubulesUtil.get_random_tubulin_neighbors(
+            topology,
+            [list(types) for types in types_include],
+            types_exclude,
+            GTP_state,
+            polymer_offsets,
+        )
+        random.seed(seed)
+        result = MicrotubulesUtil.get_random_tubulin_neighbors(
+            topology,
+            [list(types) for types in types_include],
+            types_exclude,
+            GTP_state,
+            polymer_offsets,
+            index=index,
+        )
+        assert expected is not None
+        assert indices(result) == indices(expected)
@@ -161,12 +161,20 @@ class MicrotubulesVisualization:
         box_size,
         stride=1,
         periodic_boundary=True,
+        save_cache=False,
+        cache_path=None,
         save_pickle_file=False,
         pickle_file_path=None,
     ):
         """
         Use an MicrotubulesAnalyzer to generate plots of observables.
+
+        save_pickle_file and pickle_file_path are deprecated
+        aliases for save_cache and cache_path.
         """
+        cache_path, save_cache = ReaddyUtil.cache_arguments(
+            cache_path, save_cache, pickle_file_path, save_pickle_file
+        )
         (
             monomer_data,
             reactions,
@@ -177,8 +185,8 @@ class MicrotubulesVisualization:
             stride=stride,
             timestep=0.1,
             reaction_names=MICROTUBULES_REACTIONS,
-            save_pickle_file=save_pickle_file,
-            pickle_file_path=pickle_file_path,
+            save_cache=save_cache,
+            cache_path=cache_path,
         )
         return {
             "scatter": [